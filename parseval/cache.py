@@ -0,0 +1,200 @@
+import collections
+import sys
+import threading
+import typing
+
+try:
+    from parseval.steps import Step
+except ImportError:
+    from steps import Step
+
+CacheInfo = collections.namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'currsize', 'currbytes',
+                                                 'maxsize', 'maxbytes'])
+
+
+class _Identity:
+    """
+    Hashable stand-in for an unhashable object, compared by identity.
+    It keeps the object alive, so the identity can not be recycled while the fingerprint is in use.
+    """
+    __slots__ = ('obj',)
+
+    def __init__(self, obj: any):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def _freeze(value: any) -> typing.Hashable:
+    """
+    Turn a step parameter into a hashable structure.
+    The type is part of the result, since e.g. `1`, `1.0` and `True` are equal but render differently.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return type(value), tuple((_freeze(k), _freeze(v)) for k, v in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return _Identity(value)
+    return type(value), value
+
+
+# Incremented on every change of a field parser, see `touch`.
+_generation = 0
+
+
+def touch():
+    """
+    Record a change of a field parser (e.g. a validator added to it). Parsers look their plans up again
+    after any change, instead of fingerprinting their schema on every parsing.
+    """
+    global _generation
+    _generation += 1
+
+
+def generation() -> int:
+    """
+    Number of field parser changes so far, see `touch`.
+    """
+    return _generation
+
+
+def field_fingerprint(parser: any) -> typing.Hashable:
+    """
+    Structural fingerprint of a field parser: its class, type settings and validator chain.
+    Built-in steps are described by their declared parameters, custom functions by their identity.
+    Per instance state (datetime format resolver, pattern match counters) is not part of the fingerprint,
+    it is bound to the plan of every parser separately (see `parseval.compiler.bind_state`).
+    The fingerprint is kept by the field parser until it is changed.
+    """
+    fp = getattr(parser, '_fingerprint', None)
+    if fp is not None:
+        return fp
+    steps = []
+    for f in parser._funcs:
+        if isinstance(f, Step):
+            steps.append((f.kind, _freeze(f.params)))
+        else:
+            steps.append(_Identity(f))
+    fp = parser._fingerprint = (type(parser), _freeze(parser.TYPE), parser.enforce_type,
+                                _freeze(getattr(parser, '_formats', None)), tuple(steps))
+    return fp
+
+
+def fingerprint(parser: any, encoding: str = None) -> typing.Hashable:
+    """
+    Structural fingerprint of a `Parser`: its input/output formats and the fingerprints of its schema.
+    `encoding` tells apart the row functions compiled for raw (bytes-like) rows of that encoding.
+    """
+    return (parser.input_row_format, parser.input_row_sep, parser.parsed_row_format, encoding,
+            getattr(parser, 'parsed_row_sep', None),
+            tuple((name, field_fingerprint(field_parser)) for name, field_parser in parser.schema))
+
+
+def _plan_size(plan: typing.Callable) -> int:
+    """
+    Approximate memory footprint of a compiled plan: its source, byte code and bound constants.
+    """
+    size = sys.getsizeof(getattr(plan, 'source', '')) + sys.getsizeof(plan.__code__.co_code)
+    for value in (plan.__kwdefaults__ or {}).values():
+        size += sys.getsizeof(value)
+    return size
+
+
+class PlanCache:
+    """
+    LRU registry of compiled plans keyed by the structural fingerprint of the schema.
+    Structurally identical schemas share their plan, the per instance state of their field parsers (e.g. format
+    and pattern match counters) is bound to a copy of the plan for every parser.
+    Plans are evicted in least recently used order whenever the number of plans exceeds `maxsize`
+    or their approximate memory footprint exceeds `maxbytes`.
+    """
+
+    def __init__(self, maxsize: int = 256, maxbytes: int = None):
+        """
+        :param maxsize: int
+            Maximum number of plans to be retained. `0` disables caching, `None` means unbounded.
+            By default, 256
+        :param maxbytes: int
+            Maximum approximate memory footprint (in bytes) of the retained plans. `None` means unbounded.
+            By default, `None`
+        """
+        self.maxsize: int = maxsize
+        self.maxbytes: int = maxbytes
+        self._plans: collections.OrderedDict = collections.OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Compiled plans can not be pickled, another process starts with an empty cache of the same bounds.
+        return {'maxsize': self.maxsize, 'maxbytes': self.maxbytes}
+
+    def __setstate__(self, state: typing.Dict):
+        self.__init__(**state)
+
+    def get(self, key: typing.Hashable, factory: typing.Callable) -> typing.Callable:
+        """
+        Return the plan cached against `key`, compiling it using `factory` if it is not cached yet.
+        :param key: typing.Hashable
+            Fingerprint of the schema.
+        :param factory: typing.Callable
+            Zero argument callable compiling the plan.
+        :return: typing.Callable
+            Compiled plan
+        """
+        with self._lock:
+            entry = self._plans.get(key)
+            if entry is not None:
+                self._plans.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+        plan = factory()
+        if self.maxsize == 0:
+            return plan
+        size = _plan_size(plan)
+        with self._lock:
+            if key not in self._plans:
+                self._plans[key] = (plan, size)
+                self._bytes += size
+                self._evict()
+        return plan
+
+    def _evict(self):
+        while self._plans and ((self.maxsize is not None and len(self._plans) > self.maxsize)
+                               or (self.maxbytes is not None and self._bytes > self.maxbytes)):
+            _, (_, size) = self._plans.popitem(last=False)
+            self._bytes -= size
+            self._evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report the hit/miss/eviction counters and the current size of the cache.
+        :return: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, len(self._plans), self._bytes,
+                             self.maxsize, self.maxbytes)
+
+    def cache_clear(self):
+        """
+        Drop all cached plans and reset the counters.
+        """
+        with self._lock:
+            self._plans.clear()
+            self._bytes = self._hits = self._misses = self._evictions = 0
+
+
+# Process-wide registry used by every `Parser` unless it is given its own.
+PLAN_CACHE = PlanCache()
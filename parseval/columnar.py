@@ -0,0 +1,405 @@
+import collections
+import datetime
+import mmap
+import os
+import typing
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from parseval.exceptions import UnexpectedSystemException, UnexpectedParsingException
+    from parseval.steps import Step
+    from parseval.status import VALID, FORMAT_ERROR, NULL_ERROR, MAX_VALUE_ERROR, MIN_VALUE_ERROR, VALUE_SET_ERROR, \
+        OTHER_ERROR, error_code
+    from parseval.compiler import compile_row, fixed_width_layout, _ascii_compatible
+    from parseval.formats import _layout, _DIRECTIVES, _DEFAULTS
+    from parseval.parser import Parser, DatetimeParser
+except ImportError:
+    from exceptions import UnexpectedSystemException, UnexpectedParsingException
+    from steps import Step
+    from status import VALID, FORMAT_ERROR, NULL_ERROR, MAX_VALUE_ERROR, MIN_VALUE_ERROR, VALUE_SET_ERROR, \
+        OTHER_ERROR, error_code
+    from compiler import compile_row, fixed_width_layout, _ascii_compatible
+    from formats import _layout, _DIRECTIVES, _DEFAULTS
+    from parser import Parser, DatetimeParser
+
+# Longest digit strings casted in vectorized way: integers must fit int64, floats must be exactly representable
+# as a float64 mantissa, so that dividing by a power of ten rounds exactly like `float()`.
+_MAX_DIGITS = {int: 18, float: 15}
+_BOUND = 2 ** 62
+
+
+def _vector_plan(parser: any) -> typing.Optional[typing.List[Step]]:
+    """
+    Steps of an integer or float field parser, which can be applied in vectorized way, following its
+    slicing and casting. `None` if any step of the parser has to be applied row by row.
+    """
+    if parser.TYPE not in (int, float) or not parser.enforce_type:
+        return None
+    funcs = parser._funcs
+    if len(funcs) < 2 or not all(isinstance(f, Step) for f in funcs) or \
+            [f.kind for f in funcs[:2]] != ['slice', 'type_cast']:
+        return None
+    plan = []
+    for f in funcs[2:]:
+        if f.kind in ('max_value', 'min_value'):
+            bound = f.params['value']
+            if not -_BOUND < bound < _BOUND:
+                return None
+        elif f.kind == 'value_set':
+            if f.params['values'].prefix or not all(v in ('', None) or type(v) in (int, float) and -_BOUND < v < _BOUND
+                       for v in f.params['values']):
+                return None
+        elif f.kind != 'not_null':
+            return None
+        plan.append(f)
+    return plan
+
+
+def _cast(field: 'np.ndarray', kind: type) -> typing.Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    Cast a fixed-width column, given as 2-D `uint8` array (one row per record), like `int(b'...')`/`float(b'...')`.
+    Values made of blanks, a sign, digits and (for floats) a decimal point are decided here, anything else
+    (e.g. exponents, underscores, other white spaces) is left undecided.
+    :return: typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+        values, whether the value could be casted, whether the outcome is decided
+    """
+    n, width = field.shape
+    is_digit = (field >= 48) & (field <= 57)
+    is_space = field == 32
+    is_minus = field == 45
+    is_sign = is_minus | (field == 43)
+    is_dot = field == 46 if kind is float else np.zeros_like(is_digit)
+    decided = (is_digit | is_space | is_sign | is_dot).all(1)
+    solid = ~is_space
+    count = solid.sum(1)
+    first = solid.argmax(1)
+    last = width - 1 - solid[:, ::-1].argmax(1)
+    rows = np.arange(n)
+    signs = is_sign.sum(1)
+    digits = is_digit.sum(1)
+    ok = (decided & (digits > 0) & (last - first + 1 == count) & (is_dot.sum(1) <= 1)
+          & ((signs == 0) | (signs == 1) & is_sign[rows, first]))
+    decided &= (digits <= _MAX_DIGITS[kind]) | ~ok
+    ok &= decided
+    # Weight of a digit is the number of digits following it.
+    following = is_digit[:, ::-1].cumsum(1)[:, ::-1] - is_digit
+    powers = 10 ** np.arange(_MAX_DIGITS[kind] + 1, dtype=np.int64)
+    weights = powers[np.minimum(following, _MAX_DIGITS[kind])]
+    values = np.where(is_digit, (field.astype(np.int64) - 48) * weights, 0).sum(1)
+    values = np.where(is_minus.any(1), -values, values)
+    if kind is float:
+        scale = np.where(is_dot.any(1), following[rows, is_dot.argmax(1)], 0)
+        values = values / 10.0 ** scale
+    return values, ok, decided
+
+
+def _apply(plan: typing.List[Step], parser: any, values: 'np.ndarray', ok: 'np.ndarray') -> 'np.ndarray':
+    """
+    Apply the vectorized steps on the casted values, like the compiled pipeline would on each value.
+    :return: np.ndarray
+        Whether the value passes all the steps
+    """
+    for f in plan:
+        if f.kind == 'not_null':
+            if f.params['default_value'] is None:
+                ok = ok & (values != 0)
+            else:
+                values = np.where(values == 0, parser.TYPE(f.params['default_value']), values)
+        elif f.kind == 'max_value':
+            ok = ok & ~((values != 0) & (values > f.params['value']))
+        elif f.kind == 'min_value':
+            ok = ok & ~((values != 0) & (values < f.params['value']))
+        else:
+            valid = [v for v in f.params['values'] if v not in ('', None)]
+            ok = ok & np.isin(values, np.array(valid, dtype=values.dtype))
+    return ok
+
+
+class FixedWidthEngine:
+    """
+    Columnar validation engine for fixed-width data of constant record length.
+    The data is viewed as a 2-D `uint8` array (one row per record) and every integer and float column,
+    whose steps allow it, is casted and checked (`not_null`, `value_set`, `max_value`, `min_value`, `range`)
+    by vectorized NumPy operations on its strided slice. Values which can not be decided this way and all
+    the other columns are validated row by row, by the compiled row function. Positions are byte positions.
+    Requires `numpy` (`pip install parseval[columnar]`).
+    """
+
+    def __init__(self, parser: Parser, encoding: str = 'ascii', block_size: int = 1 << 20):
+        """
+        :param parser: Parser
+            Parser with "fixed-width" input format
+        :param encoding: str
+            Encoding of the records, must be ASCII compatible.
+            By default, 'ascii'
+        :param block_size: int
+            Number of records processed at once, bounds the memory used by the vectorized operations.
+            By default, 1048576
+        """
+        if np is None:
+            raise UnexpectedSystemException(
+                "`numpy` is required for the columnar engine. Please install it using `pip install parseval[columnar]`."
+            )
+        if parser.input_row_format != "fixed-width":
+            raise UnexpectedSystemException("Columnar engine is only available for `fixed-width` formatted input.")
+        if not _ascii_compatible(encoding):
+            raise UnexpectedSystemException("Columnar engine is only available for ASCII compatible encodings.")
+        self.parser: Parser = parser
+        self.encoding: str = encoding
+        self.block_size: int = block_size
+        self._columns: typing.List[typing.Tuple] = []
+        vectorized = set()
+        for i, start, end in fixed_width_layout(parser.schema):
+            field_parser = parser.schema[i][1]
+            plan = _vector_plan(field_parser)
+            if plan is not None:
+                self._columns.append((start - 1, end, field_parser, plan))
+                vectorized.add(i)
+        scalar = [column for i, column in enumerate(parser.schema) if i not in vectorized]
+        self._scalar_func: typing.Callable = None
+        if scalar:
+            # The remaining columns are validated together, by a row function of the partial schema.
+            partial = Parser(schema=scalar, input_row_format='fixed-width', parsed_row_format='dict')
+            self._scalar_func = compile_row(partial, encoding, warn_layout=False)
+        self._row_func: typing.Callable = parser._raw_row_func(encoding)
+
+    def validate(self, data: typing.Union[str, bytes, bytearray, memoryview]) -> 'np.ndarray':
+        """
+        Validate fixed-width records.
+        :param data: typing.Union[str, bytes, bytearray, memoryview]
+            Path of a file (memory mapped) or the records themselves, separated by `\\n` or `\\r\\n`.
+            The last record might not be terminated.
+        :return: np.ndarray
+            Boolean validity mask, one entry per record
+        """
+        if isinstance(data, str):
+            if not os.path.getsize(data):
+                return np.zeros(0, dtype=bool)
+            with open(data, 'rb') as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return self._validate(memoryview(mapped))
+            finally:
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass
+        return self._validate(memoryview(data).cast('B'))
+
+    def _validate(self, buffer: memoryview) -> 'np.ndarray':
+        size = len(buffer)
+        newline = _find_newline(buffer)
+        if newline < 0:
+            return np.array([self._check_row(buffer, self._row_func)], dtype=bool)
+        record_length = newline + 1
+        terminator = 2 if newline and buffer[newline - 1] == 13 else 1
+        count = size // record_length
+        tail = size - count * record_length
+        if tail and tail != record_length - terminator:
+            raise UnexpectedParsingException("Records are not of constant length - {} bytes.".format(record_length))
+        records = np.frombuffer(buffer, dtype=np.uint8, count=count * record_length).reshape(count, record_length)
+        mask = np.empty(count + bool(tail), dtype=bool)
+        for start in range(0, count, self.block_size):
+            block = records[start:start + self.block_size]
+            if not (block[:, -1] == 10).all() or terminator == 2 and not (block[:, -2] == 13).all():
+                raise UnexpectedParsingException("Records are not of constant length - {} bytes.".format(record_length))
+            mask[start:start + len(block)] = self._validate_block(buffer, block, start, record_length, terminator)
+        if tail:
+            mask[-1] = self._check_row(buffer[count * record_length:], self._row_func)
+        return mask
+
+    def _validate_block(self, buffer: memoryview, block: 'np.ndarray', first: int, record_length: int,
+                        terminator: int) -> 'np.ndarray':
+        valid = np.ones(len(block), dtype=bool)
+        undecided = np.zeros(len(block), dtype=bool)
+        content = record_length - terminator
+        for start, end, field_parser, plan in self._columns:
+            if start >= content:
+                # The column is entirely past the end of the records.
+                undecided[:] = True
+                continue
+            # Positions past the end of the record give shorter values, like slicing does.
+            values, ok, decided = _cast(block[:, start:min(end, content)], field_parser.TYPE)
+            valid &= _apply(plan, field_parser, values, ok) | ~decided
+            undecided |= ~decided
+        for i in np.flatnonzero(undecided & valid):
+            valid[i] = self._check_row(self._record(buffer, first + i, record_length, terminator), self._row_func)
+        if self._scalar_func is not None:
+            for i in np.flatnonzero(valid & ~undecided):
+                valid[i] = self._check_row(self._record(buffer, first + i, record_length, terminator),
+                                           self._scalar_func)
+        return valid
+
+    @staticmethod
+    def _record(buffer: memoryview, i: int, record_length: int, terminator: int) -> memoryview:
+        return buffer[i * record_length:(i + 1) * record_length - terminator]
+
+    @staticmethod
+    def _check_row(record: memoryview, row_func: typing.Callable) -> bool:
+        try:
+            row_func(record, 0, report=_ignore)
+        except Exception:
+            return False
+        return True
+
+
+def _find_newline(buffer: memoryview) -> int:
+    """
+    Position of the first `\\n` of a large buffer, without copying more than a block of it.
+    """
+    position = 0
+    while position < len(buffer):
+        found = bytes(buffer[position:position + (1 << 16)]).find(b'\n')
+        if found >= 0:
+            return position + found
+        position += 1 << 16
+    return -1
+
+
+def _ignore(line_number: int, column: str):
+    pass
+
+
+_VECTOR_STEPS = {'type_cast', 'datetime_format', 'datetime_not_null', 'datetime_max_value', 'datetime_min_value',
+                 'datetime_value_set'}
+
+DatetimeColumn = collections.namedtuple('DatetimeColumn', ['values', 'valid', 'codes'])
+
+
+def _days_in_month(years: 'np.ndarray', months: 'np.ndarray') -> 'np.ndarray':
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.clip(months, 0, 12)]
+    return days + (leap & (months == 2))
+
+
+def _to_datetime64(texts: typing.List[str], layout: typing.List[typing.Tuple[str, int, int]]
+                   ) -> typing.Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convert strings of the exact length of a fixed width layout to `datetime64[s]`, like `strptime` would.
+    :return: typing.Tuple[np.ndarray, np.ndarray]
+        values, whether the string is a zero padded valid value of the layout
+    """
+    width = layout[-1][2]
+    chars = np.array(texts, dtype='U{}'.format(width)).view(np.uint32).reshape(len(texts), width)
+    ok = np.ones(len(texts), dtype=bool)
+    fields = [np.full(len(texts), default, dtype=np.int64) for default in _DEFAULTS]
+    for part, start, end in layout:
+        block = chars[:, start:end]
+        if len(part) == 1:
+            ok &= block[:, 0] == ord(part)
+            continue
+        ok &= ((block >= 48) & (block <= 57)).all(1)
+        fields[_DIRECTIVES[part[1]][1]] = ((block.astype(np.int64) - 48) * 10 ** np.arange(end - start - 1, -1, -1)).sum(1)
+    year, month, day, hour, minute, second = fields
+    ok &= (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= _days_in_month(year, month))
+    ok &= (hour < 24) & (minute < 60) & (second < 60)
+    year, month, day = np.where(ok, year, 1970), np.where(ok, month, 1), np.where(ok, day, 1)
+    values = ((year - 1970).astype('M8[Y]').astype('M8[M]') + (month - 1).astype('m8[M]')).astype('M8[D]') \
+        + (day - 1).astype('m8[D]')
+    values = values.astype('M8[s]') + (hour * 3600 + minute * 60 + second).astype('m8[s]')
+    return values, ok
+
+
+def _vector_datetime_plan(parser: DatetimeParser) -> typing.Optional[typing.List[Step]]:
+    """
+    Steps of a datetime parser which are applied in vectorized way, `None` if any step has to be applied
+    value by value.
+    """
+    funcs = parser._funcs
+    if not all(isinstance(f, Step) and f.kind in _VECTOR_STEPS for f in funcs):
+        return None
+    plan = []
+    for f in funcs:
+        if f.kind in ('datetime_max_value', 'datetime_min_value'):
+            bound = f.params['max_val' if f.kind == 'datetime_max_value' else 'min_val']
+            if bound.tzinfo is not None:
+                return None
+        elif f.kind == 'datetime_value_set':
+            if any(v.tzinfo is not None for v in f.params['valid_values']):
+                return None
+        else:
+            # Values converted in vectorized way are not empty, they pass the format and not null checks.
+            continue
+        plan.append(f)
+    return plan
+
+
+def parse_datetime_column(parser: DatetimeParser, values: typing.Sequence, format: str = None) -> DatetimeColumn:
+    """
+    Convert and validate a whole column at once.
+    Strings of the exact shape of `format` (a fixed width numeric format, see `parseval.formats.compile_format`)
+    are converted in that format by vectorized slicing and checked (`max_value`, `min_value`, `range`, `value_set`)
+    by array comparisons. Any other value, and every value of a parser with other steps (e.g. `convert` or custom
+    functions), goes through the compiled parser one by one. Scalar parsing of the values is not affected.
+    Requires `numpy` (`pip install parseval[columnar]`).
+    :param parser: DatetimeParser
+        Parser of the column
+    :param values: typing.Sequence
+        Column values
+    :param format: str
+        One of the allowed formats of the parser.
+        By default, the first one
+    :return: DatetimeColumn
+        `values`: `datetime64[us]` array of the converted values (`NaT` for failing and empty values),
+        `valid`: boolean validity mask,
+        `codes`: `int8` array of error codes (`VALID`, `FORMAT_ERROR`, `NULL_ERROR`, `MAX_VALUE_ERROR`,
+        `MIN_VALUE_ERROR`, `VALUE_SET_ERROR`, `OTHER_ERROR`)
+    """
+    if np is None:
+        raise UnexpectedSystemException(
+            "`numpy` is required for the columnar engine. Please install it using `pip install parseval[columnar]`."
+        )
+    format = format if format is not None else parser._formats[0]
+    if format not in parser._formats:
+        raise UnexpectedSystemException("'{}' is not an allowed format of the parser.".format(format))
+    n = len(values)
+    result = np.full(n, np.datetime64('NaT'), dtype='M8[us]')
+    codes = np.zeros(n, dtype=np.int8)
+    plan = _vector_datetime_plan(parser)
+    layout = _layout(format)
+    scalar = np.ones(n, dtype=bool)
+    if plan is not None and layout is not None:
+        width = layout[-1][2]
+        candidates = np.flatnonzero(np.fromiter((type(v) is str and len(v) == width for v in values), bool, n))
+        if len(candidates):
+            converted, ok = _to_datetime64([values[i] for i in candidates], layout)
+            rows = candidates[ok]
+            converted = converted[ok]
+            row_codes = np.zeros(len(rows), dtype=np.int8)
+            for f in plan:
+                if f.kind == 'datetime_max_value':
+                    failed = converted > np.datetime64(f.params['max_val'])
+                    code = MAX_VALUE_ERROR
+                elif f.kind == 'datetime_min_value':
+                    failed = converted < np.datetime64(f.params['min_val'])
+                    code = MIN_VALUE_ERROR
+                elif f.kind == 'datetime_value_set':
+                    failed = ~np.isin(converted, np.array(list(f.params['valid_values']), dtype='M8[us]'))
+                    code = VALUE_SET_ERROR
+                else:
+                    continue
+                row_codes[(row_codes == VALID) & failed] = code
+            codes[rows] = row_codes
+            result[rows[row_codes == VALID]] = converted[row_codes == VALID]
+            scalar[rows] = False
+            parser._resolver.hits[format] += len(rows)
+    func = parser.build(compiled=True)
+    for i in np.flatnonzero(scalar):
+        value = values[i]
+        try:
+            parsed = func(value)
+        except Exception as e:
+            codes[i] = error_code(e)
+            continue
+        if parsed and type(parsed) is not datetime.datetime:
+            try:
+                parsed = parser._parse_datetime(parsed)
+            except Exception:
+                parsed = None
+        if type(parsed) is datetime.datetime and parsed.tzinfo is None:
+            result[i] = np.datetime64(parsed)
+    return DatetimeColumn(result, codes == VALID, codes)
@@ -0,0 +1,904 @@
+import datetime
+import functools
+import linecache
+import logging
+import struct
+import types
+import typing
+
+try:
+    from parseval.exceptions import (
+        SchemaBuildException,
+        UnexpectedParsingException,
+        NullValueInNotNullFieldException,
+        ValidValueCheckException,
+        MaximumValueConstraintException,
+        MinimumValueConstraintException,
+        RegexMatchException,
+        StringParsingException,
+        BooleanParsingException,
+        DateTimeParsingException
+    )
+    from parseval.steps import Step
+    from parseval.status import FORMAT_ERROR, error_code, failure_bit
+except ImportError:
+    from exceptions import (
+        SchemaBuildException,
+        UnexpectedParsingException,
+        NullValueInNotNullFieldException,
+        ValidValueCheckException,
+        MaximumValueConstraintException,
+        MinimumValueConstraintException,
+        RegexMatchException,
+        StringParsingException,
+        BooleanParsingException,
+        DateTimeParsingException
+    )
+    from steps import Step
+    from status import FORMAT_ERROR, error_code, failure_bit
+
+# Names visible to every generated function. Only the exception classes live here, they are touched on the
+# failure path alone; everything used on the happy path is bound as a keyword-only default, i.e. a fast local.
+_GLOBALS: typing.Dict = {
+    'UnexpectedParsingException': UnexpectedParsingException,
+    'NullValueInNotNullFieldException': NullValueInNotNullFieldException,
+    'ValidValueCheckException': ValidValueCheckException,
+    'MaximumValueConstraintException': MaximumValueConstraintException,
+    'MinimumValueConstraintException': MinimumValueConstraintException,
+    'RegexMatchException': RegexMatchException,
+    'StringParsingException': StringParsingException,
+    'BooleanParsingException': BooleanParsingException,
+    'DateTimeParsingException': DateTimeParsingException,
+}
+
+_EMITTERS: typing.Dict[str, typing.Callable] = {}
+
+_strftime = datetime.datetime.strftime
+
+_DATETIME_MAX_TEMPLATE = "Column value - '{}' is higher than maximum allowed value - {}."
+_DATETIME_MIN_TEMPLATE = "Column value - '{}' is lower than minimum allowed value - {}."
+
+_counter = 0
+
+
+def emitter(kind: str):
+    """
+    Register a code emitter for a step kind.
+    An emitter receives the `Source` being generated, the parser owning the step, the step parameters,
+    the name of the variable holding the column value and the indentation level. It writes straight-line code
+    which behaves exactly like the closure the parser builds for the step. If it returns `False` the step
+    can not be inlined and the compiler falls back to calling the closure.
+    """
+    def register(f):
+        _EMITTERS[kind] = f
+        return f
+
+    return register
+
+
+class Source:
+    """
+    Accumulates the lines of a generated function along with the constants those lines refer to.
+    """
+
+    def __init__(self):
+        self.lines: typing.List[str] = []
+        self.consts: typing.Dict[str, typing.Any] = {}
+        self._const_ids: typing.Dict[int, str] = {}
+        # Per instance state of the field parsers (e.g. datetime format resolver, match counters) is bound like
+        # constants, but left out of the plan fingerprint: `states` tells how to fetch it out of another, structurally
+        # identical parser, see `bind_state`. `field` is the column of the field parser being emitted, if any.
+        self.states: typing.Dict[str, typing.Tuple[typing.Optional[int], typing.Callable]] = {}
+        self._state_names: typing.Dict[typing.Tuple, str] = {}
+        self.field: typing.Optional[int] = None
+        # Variable holding the parsed datetime of a column value, while the value is not reassigned.
+        self.parsed: typing.Dict[str, str] = {}
+        self._temps: int = 0
+        # Status mode (see `compile_row`): failures set the status bits of the current column instead of raising,
+        # failures outside of any column (`column` is `None`) set the bits of the row slot, i.e. column `columns`.
+        self.status: bool = False
+        self.column: typing.Optional[int] = None
+        self.columns: int = 0
+        # Check-only mode (see `compile_row`): status mode without output, the value of a column is only checked.
+        # `final` tells whether the step being emitted is the last one of its column.
+        self.check: bool = False
+        self.final: bool = False
+
+    def const(self, value: any, hint: str = 'k') -> str:
+        """
+        Bind a constant to the generated function and return the local name it is reachable by.
+        The same object is always bound only once.
+        """
+        name = self._const_ids.get(id(value))
+        if name is None:
+            name = '_{}{}'.format(hint, len(self.consts))
+            self.consts[name] = value
+            self._const_ids[id(value)] = name
+        return name
+
+    def state(self, parser: any, key: typing.Hashable, get: typing.Callable, hint: str = 's') -> str:
+        """
+        Bind a piece of per instance state of the field parser being emitted and return its local name.
+        :param key: typing.Hashable
+            Tells the pieces of state of a field parser apart, the same piece is bound only once.
+        :param get: typing.Callable
+            Fetches the piece of state out of a field parser.
+        """
+        name = self._state_names.get((self.field, key))
+        if name is None:
+            name = self._state_names[(self.field, key)] = '_{}{}'.format(hint, len(self.consts))
+            self.consts[name] = get(parser)
+            self.states[name] = (self.field, get)
+        return name
+
+    def resolver(self, parser: any) -> str:
+        """
+        Bind the datetime format resolver of a parser and return the local name of its `parse` method.
+        """
+        return self.state(parser, 'resolve', _resolver_parse, 'resolve')
+
+    def temp(self, hint: str = 't') -> str:
+        """
+        Reserve a fresh temporary variable name.
+        """
+        self._temps += 1
+        return '_{}{}'.format(hint, self._temps)
+
+    def line(self, indent: int, text: str):
+        self.lines.append('    ' * indent + text)
+
+    def fail(self, indent: int, exception: str, value: str = None, bound: str = None, template: str = None):
+        """
+        Emit the failure of a validation rule.
+        In status mode, the status bit of the rule is set and the column is left,
+        a failure outside of any column ends the row.
+        :param exception: str
+            Name of the exception class to be raised.
+        :param value: str
+            Python expression of the offending value, if any.
+        :param bound: str
+            Python expression of the bound of the rule, if any.
+        :param template: str
+            Message template, if other than the template of the exception class.
+        """
+        if not self.status:
+            kwargs = [(k, v) for k, v in (('value', value), ('bound', bound)) if v is not None]
+            if template is not None:
+                kwargs.append(('template', self.const(template, 'template')))
+            self.line(indent, 'raise {}({})'.format(exception, ', '.join('{}={}'.format(k, v) for k, v in kwargs)))
+        elif self.column is None:
+            self.line(indent, 'return {}{}'.format('' if self.check else 'None, ',
+                                                   failure_bit(self.columns, error_code(_GLOBALS[exception]))))
+        else:
+            self.line(indent, '_status |= {}'.format(failure_bit(self.column, error_code(_GLOBALS[exception]))))
+            self.line(indent, 'break')
+
+    def pipeline(self, parser: any, var: str, indent: int, skip: int = 0):
+        """
+        Emit the complete step chain of a field parser, operating in place on `var`.
+        The first `skip` steps are left out, when the caller has already emitted them in a specialized way.
+        A datetime parsed out of the value is shared by the following steps, until a step reassigns the value.
+        """
+        funcs = parser._funcs[skip:]
+        if self.check:
+            # Trailing conversions of the output format can not fail, they are left out of a check.
+            while funcs and isinstance(funcs[-1], Step) and funcs[-1].kind == 'datetime_convert':
+                funcs = funcs[:-1]
+        i = 0
+        while i < len(funcs):
+            fused = _emit_sortable_checks(self, parser, funcs[i:], var, indent)
+            if fused:
+                i += fused
+                self.parsed.pop(var, None)
+                continue
+            f = funcs[i]
+            self.final = self.check and i == len(funcs) - 1
+            if not isinstance(f, Step):
+                self.line(indent, '{0} = {1}({0})'.format(var, self.const(f, 'f')))
+            elif not (f.kind in _EMITTERS and _EMITTERS[f.kind](self, parser, f.params, var, indent) is not False):
+                # Closures of the steps refer to their parser.
+                closure = self.state(parser, ('closure', skip + i), functools.partial(_step_closure, skip + i), 'f')
+                self.line(indent, '{0} = {1}({0})'.format(var, closure))
+            if not (isinstance(f, Step) and f.kind in _PRESERVING):
+                self.parsed.pop(var, None)
+            i += 1
+        self.final = False
+
+    def function(self, name: str, args: typing.List[str]) -> typing.Callable:
+        """
+        Compile the accumulated lines as the body of a function and return it.
+        """
+        global _counter
+        _counter += 1
+        signature = ', '.join(args)
+        if self.consts:
+            signature += ', *, ' + ', '.join('{0}={0}'.format(c) for c in self.consts)
+        text = '\n'.join(['def {}({}):'.format(name, signature)] + (self.lines or ['    pass'])) + '\n'
+        filename = '<parseval:{}:{}>'.format(name, _counter)
+        namespace = dict(_GLOBALS)
+        namespace.update(self.consts)
+        exec(compile(text, filename, 'exec'), namespace)
+        # Registering the source lets tracebacks and `logging.exception` show the generated lines.
+        linecache.cache[filename] = (len(text), None, text.splitlines(True), filename)
+        func = namespace[name]
+        func.source = text
+        func.states = self.states
+        return func
+
+
+def _resolver_parse(parser: any) -> typing.Callable:
+    return parser._resolver.parse
+
+
+def _resolver_hits(parser: any) -> typing.Counter:
+    return parser._resolver.hits
+
+
+def _match_counter(parser: any) -> typing.Counter:
+    return parser._matches
+
+
+def _step_closure(index: int, parser: any) -> typing.Callable:
+    return parser._closure(parser._funcs[index])
+
+
+def bind_state(plan: typing.Callable, owner: any) -> typing.Callable:
+    """
+    Copy of a cached plan bound to the per instance state of `owner`, the `Parser` (or field parser) it is used by.
+    Plans are shared by structurally identical parsers, while e.g. datetime format counters belong to each parser.
+    """
+    states = getattr(plan, 'states', None)
+    if not states:
+        return plan
+    return rebind(plan, **{name: get(owner if field is None else owner.schema[field][1])
+                           for name, (field, get) in states.items()})
+
+
+def compile_parser(parser: any) -> typing.Callable:
+    """
+    Compile a field parser into one flat function.
+    The generated function behaves like the closure chain returned by `FieldParser.build()`:
+    same return values and same exceptions. The per step `logging` banners of the closures are not emitted.
+    :param parser: FieldParser
+        Parser to be compiled.
+    :return: typing.Callable
+        Compiled parser function.
+    """
+    src = Source()
+    src.pipeline(parser, 'v', 1)
+    src.line(1, 'return v')
+    return src.function('pipeline', ['v'])
+
+
+def _emit_datetime_value(src: Source, parser: any, var: str, indent: int) -> str:
+    """
+    Emit the code resolving the (non empty) column value into a datetime object and return the variable
+    holding it. The value is parsed only once, the variable is reused by the following steps.
+    """
+    p = src.parsed.get(var)
+    if p is not None:
+        return p
+    p = src.parsed[var] = src.temp('p')
+    dt = src.const(datetime.datetime, 'datetime')
+    src.line(indent, 'if type({}) is not {}:'.format(var, dt))
+    src.line(indent + 1, '{} = {}({})'.format(p, src.resolver(parser), var))
+    src.line(indent, 'else:')
+    src.line(indent + 1, '{} = {}'.format(p, var))
+    return p
+
+
+@emitter('slice')
+def _emit_slice(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, '{0} = str({0})[{1}:{2}]'.format(var, params['start'] - 1, params['end']))
+
+
+@emitter('strip_quotes')
+def _emit_strip_quotes(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, '{0} = {0}.lstrip({1!r}).rstrip({1!r})'.format(var, params['quote']))
+
+
+@emitter('type_cast')
+def _emit_type_cast(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    if not parser.TYPE or parser.TYPE == bool:
+        return
+    t = src.const(parser.TYPE, 'type')
+    src.line(indent, 'try:')
+    if parser.enforce_type and not src.final:
+        src.line(indent + 1, 'if {}:'.format(var))
+        src.line(indent + 2, '{0} = {1}({0})'.format(var, t))
+    elif parser.TYPE is int:
+        # The value is only checked, digit strings are valid integers without being converted.
+        src.line(indent + 1, 'if {0} and not (type({0}) is str and {0}.isdecimal()):'.format(var))
+        src.line(indent + 2, '{}({})'.format(t, var))
+    else:
+        src.line(indent + 1, 'if {}:'.format(var))
+        src.line(indent + 2, '{}({})'.format(t, var))
+    src.line(indent, 'except Exception:')
+    src.fail(indent + 1, 'UnexpectedParsingException', var, t)
+
+
+@emitter('string_cast')
+def _emit_string_cast(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, 'try:')
+    src.line(indent + 1, 'if {0}:'.format(var))
+    src.line(indent + 2, '{0} = str({0})'.format(var))
+    src.line(indent, 'except Exception:')
+    src.fail(indent + 1, 'StringParsingException', var)
+
+
+@emitter('boolean_cast')
+def _emit_boolean_cast(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    table, truthy, falsy = parser._boolean_table(params['tokens'])
+    table = src.const(table, 'table')
+    s = src.temp('s')
+    b = src.temp('b')
+    src.line(indent, 'if {0} or {0} == 0:'.format(var))
+    src.line(indent + 1, 'if type({}) is str:'.format(var))
+    src.line(indent + 2, '{} = {}.get({})'.format(b, table, var))
+    src.line(indent + 2, 'if {} is None:'.format(b))
+    src.line(indent + 3, '{} = {}.strip()'.format(s, var))
+    src.line(indent + 3, 'if {}:'.format(s))
+    src.line(indent + 4, '{} = {}.get({}.lower())'.format(b, table, s))
+    src.line(indent + 4, 'if {} is None:'.format(b))
+    src.line(indent + 5, 'if {}({}):'.format(src.const(truthy, 'true'), s))
+    src.line(indent + 6, '{} = True'.format(b))
+    src.line(indent + 5, 'elif {}({}):'.format(src.const(falsy, 'false'), s))
+    src.line(indent + 6, '{} = False'.format(b))
+    src.line(indent + 5, 'else:')
+    src.fail(indent + 6, 'BooleanParsingException', var)
+    src.line(indent + 3, 'else:')
+    src.line(indent + 4, '{} = bool({})'.format(b, var))
+    src.line(indent + 1, 'else:')
+    src.line(indent + 2, '{} = bool({})'.format(b, var))
+    if parser.enforce_type:
+        src.line(indent + 1, '{} = {}'.format(var, b))
+
+
+@emitter('not_null')
+def _emit_not_null(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    default_value = params['default_value']
+    src.line(indent, 'if not {}:'.format(var))
+    if default_value is None:
+        src.fail(indent + 1, 'NullValueInNotNullFieldException')
+    elif parser.enforce_type:
+        src.line(indent + 1, '{} = {}({})'.format(var, src.const(parser.TYPE, 'type'), src.const(default_value, 'default')))
+    else:
+        src.line(indent + 1, '{} = {}'.format(var, src.const(default_value, 'default')))
+
+
+@emitter('string_not_null')
+def _emit_string_not_null(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    default_value = params['default_value']
+    if params['allow_white_space']:
+        src.line(indent, 'if {} is None:'.format(var))
+    else:
+        src.line(indent, 'if {} is not None:'.format(var))
+        src.line(indent + 1, '{0} = type({0})(str({0}).strip())'.format(var))
+        src.line(indent, 'if not {}:'.format(var))
+    if default_value is None:
+        src.fail(indent + 1, 'NullValueInNotNullFieldException')
+    elif parser.enforce_type:
+        src.line(indent + 1, '{} = str({})'.format(var, src.const(default_value, 'default')))
+    else:
+        src.line(indent + 1, '{} = {}'.format(var, src.const(default_value, 'default')))
+
+
+@emitter('value_set')
+def _emit_value_set(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    values = params['values']
+    check = '{} not in {}'.format(var, src.const(values.members, 'members'))
+    if values.prefix:
+        check += ' and not (type({0}) is str and {1}({0}))'.format(var, src.const(values.match_prefix, 'prefix'))
+    src.line(indent, 'if {}:'.format(check))
+    src.fail(indent + 1, 'ValidValueCheckException', var, src.const(values, 'values'))
+
+
+@emitter('reference_set')
+def _emit_reference_set(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    reference = src.const(params['reference'], 'reference')
+    if params['nullable']:
+        src.line(indent, 'if {0} is not None and {0} != \'\' and {0} not in {1}:'.format(var, reference))
+    else:
+        src.line(indent, 'if {} not in {}:'.format(var, reference))
+    src.fail(indent + 1, 'ValidValueCheckException', var, reference,
+             "Provided value - '{}' is not part of reference set - {}.")
+
+
+@emitter('max_value')
+def _emit_max_value(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    value = src.const(params['value'], 'max')
+    src.line(indent, 'if {0} and {0} > {1}:'.format(var, value))
+    src.fail(indent + 1, 'MaximumValueConstraintException', var, value)
+
+
+@emitter('min_value')
+def _emit_min_value(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    value = src.const(params['value'], 'min')
+    src.line(indent, 'if {0} and {0} < {1}:'.format(var, value))
+    src.fail(indent + 1, 'MinimumValueConstraintException', var, value)
+
+
+@emitter('regex_match')
+def _emit_regex_match(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    regex = params['regex']
+    match = src.const(regex.fullmatch if params['full_match'] else regex.match, 'match')
+    pattern = src.const(params['pattern'], 'pattern')
+    if params['nullable']:
+        src.line(indent, 'if not {}({}) and {}:'.format(match, var, var))
+    else:
+        src.line(indent, 'if not {}({}):'.format(match, var))
+    src.fail(indent + 1, 'RegexMatchException', var, pattern)
+
+
+@emitter('regex_any')
+def _emit_regex_any(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    regex = params['regex']
+    match = src.const(regex.fullmatch if params['full_match'] else regex.match, 'match')
+    found = src.temp('m')
+    src.line(indent, '{} = {}({})'.format(found, match, var))
+    src.line(indent, 'if {} is not None:'.format(found))
+    src.line(indent + 1, '{}[{}[{}.lastgroup]] += 1'.format(src.state(parser, 'matches', _match_counter, 'matches'),
+                                                           src.const(params['groups'], 'groups'), found))
+    src.line(indent, 'elif {}:'.format(var) if params['nullable'] else 'else:')
+    src.fail(indent + 1, 'RegexMatchException', var, src.const(params['patterns'], 'patterns'),
+             "Data - '{}' does not match with any of the expected patterns - {}.")
+
+
+@emitter('change_case')
+def _emit_change_case(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    if not isinstance(params['case_type'], str):
+        return False
+    method = {'S': 'capitalize', 'L': 'lower', 'U': 'upper'}.get(params['case_type'].upper())
+    if method is None:
+        return
+    src.line(indent, 'try:')
+    src.line(indent + 1, '{0} = {0}.{1}()'.format(var, method))
+    src.line(indent, 'except Exception:')
+    src.fail(indent + 1, 'UnexpectedParsingException')
+
+
+@emitter('constant')
+def _emit_constant(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, '{} = {}'.format(var, src.const(params['value'], 'constant')))
+
+
+# Steps which never reassign the column value, hence keep its parsed datetime valid.
+# `datetime_format` only replaces the value by the parsed datetime itself.
+_PRESERVING = {'datetime_format', 'datetime_max_value', 'datetime_min_value', 'datetime_value_set'}
+
+
+@emitter('datetime_format')
+def _emit_datetime_format(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, 'if {}:'.format(var))
+    p = _emit_datetime_value(src, parser, var, indent + 1)
+    if parser.enforce_type:
+        src.line(indent + 1, '{} = {}'.format(var, p))
+
+
+@emitter('datetime_not_null')
+def _emit_datetime_not_null(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    default_value = params['default_value']
+    src.line(indent, 'if not {}:'.format(var))
+    if default_value:
+        src.line(indent + 1, '{} = {}'.format(var, src.const(default_value, 'default')))
+    else:
+        src.fail(indent + 1, 'NullValueInNotNullFieldException')
+
+
+@emitter('datetime_convert')
+def _emit_datetime_convert(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    format = params['format']
+    if '%' not in format and format != 'iso8601':
+        # Epoch format tokens are rendered by the closure.
+        return False
+    # The conversion closure swallows its own failures and hands `None` over to the next step.
+    src.line(indent, 'try:')
+    src.line(indent + 1, 'if {}:'.format(var))
+    p = _emit_datetime_value(src, parser, var, indent + 2)
+    if format == 'iso8601':
+        src.line(indent + 2, '{} = {}.isoformat()'.format(var, p))
+    else:
+        src.line(indent + 2, '{} = {}({}, {!r})'.format(var, src.const(_strftime, 'strftime'), p, format))
+    src.line(indent, 'except Exception:')
+    src.line(indent + 1, '{} = None'.format(var))
+
+
+@emitter('datetime_max_value')
+def _emit_datetime_max_value(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, 'if {}:'.format(var))
+    p = _emit_datetime_value(src, parser, var, indent + 1)
+    src.line(indent + 1, 'if {} > {}:'.format(p, src.const(params['max_val'], 'max')))
+    src.fail(indent + 2, 'MaximumValueConstraintException', var, src.const(params['value'], 'bound'),
+             _DATETIME_MAX_TEMPLATE)
+
+
+@emitter('datetime_min_value')
+def _emit_datetime_min_value(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, 'if {}:'.format(var))
+    p = _emit_datetime_value(src, parser, var, indent + 1)
+    src.line(indent + 1, 'if {} < {}:'.format(p, src.const(params['min_val'], 'min')))
+    src.fail(indent + 2, 'MinimumValueConstraintException', var, src.const(params['value'], 'bound'),
+             _DATETIME_MIN_TEMPLATE)
+
+
+@emitter('datetime_value_set')
+def _emit_datetime_value_set(src: Source, parser: any, params: typing.Dict, var: str, indent: int):
+    src.line(indent, 'if {}:'.format(var))
+    p = _emit_datetime_value(src, parser, var, indent + 1)
+    src.line(indent + 1, 'if {} not in {}:'.format(p, src.const(params['valid_values'].members, 'members')))
+    src.fail(indent + 2, 'ValidValueCheckException', var, src.const(params['valid_values'], 'values'))
+
+
+def _emit_sortable_checks(src: Source, parser: any, funcs: typing.List, var: str, indent: int) -> int:
+    """
+    Emit the format check of a date/datetime column along with the bound and valid value checks following it,
+    checking valid strings of the sortable format as they are (see `DatetimeParser._sortable_format`)
+    and any other value on its parsed datetime.
+    :return: int
+        Number of steps emitted, `0` if the steps can not be checked as strings.
+    """
+    if not (isinstance(funcs[0], Step) and funcs[0].kind == 'datetime_format'):
+        return 0
+    sortable = parser._sortable_format()
+    if sortable is None:
+        return 0
+    checks = []
+    for f in funcs[1:]:
+        if not isinstance(f, Step):
+            break
+        if f.kind == 'datetime_max_value':
+            bound = sortable.render(f.params['max_val'])
+        elif f.kind == 'datetime_min_value':
+            bound = sortable.render(f.params['min_val'])
+        elif f.kind == 'datetime_value_set':
+            bound = frozenset(sortable.render(v) for v in f.params['valid_values'])
+        else:
+            break
+        if bound is None:
+            break
+        checks.append((f, bound))
+    src.line(indent, 'if {}:'.format(var))
+    src.line(indent + 1, 'if type({}) is str and {}({}):'.format(var, src.const(sortable.valid, 'valid'), var))
+    src.line(indent + 2, '{}[{}] += 1'.format(src.state(parser, 'hits', _resolver_hits, 'hits'),
+                                              src.const(sortable.format, 'format')))
+    for f, bound in checks:
+        if f.kind == 'datetime_max_value':
+            src.line(indent + 2, 'if {} > {}:'.format(var, src.const(bound, 'max')))
+            src.fail(indent + 3, 'MaximumValueConstraintException', var, src.const(f.params['value'], 'bound'),
+                     _DATETIME_MAX_TEMPLATE)
+        elif f.kind == 'datetime_min_value':
+            src.line(indent + 2, 'if {} < {}:'.format(var, src.const(bound, 'min')))
+            src.fail(indent + 3, 'MinimumValueConstraintException', var, src.const(f.params['value'], 'bound'),
+                     _DATETIME_MIN_TEMPLATE)
+        else:
+            src.line(indent + 2, 'if {} not in {}:'.format(var, src.const(bound, 'values')))
+            src.fail(indent + 3, 'ValidValueCheckException', var, src.const(f.params['valid_values'], 'bound'))
+    src.line(indent + 1, 'else:')
+    for f in funcs[:len(checks) + 1]:
+        _EMITTERS[f.kind](src, parser, f.params, var, indent + 2)
+    return len(checks) + 1
+
+
+def rebind(func: typing.Callable, **consts) -> typing.Callable:
+    """
+    Copy of a generated function with some of its bound constants (keyword-only defaults) replaced,
+    e.g. `rebind(row, report=...)`. Unlike `functools.partial`, the copy costs nothing more per call.
+    """
+    copy = types.FunctionType(func.__code__, func.__globals__, func.__name__, func.__defaults__, func.__closure__)
+    copy.__kwdefaults__ = dict(func.__kwdefaults__ or {}, **consts)
+    copy.source = getattr(func, 'source', None)
+    copy.states = getattr(func, 'states', None)
+    return copy
+
+
+def _report_cell_error(line_number: int, column: str):
+    """
+    Log the position of a failing cell. Called by the row kernels on the failure path only.
+    """
+    logging.error("<" * 50 + ">" * 50)
+    logging.error('LINE NUMBER: {}'.format(line_number + 1))
+    logging.error('COLUMN NAME: {}'.format(column))
+    logging.error("<" * 50 + ">" * 50)
+
+
+def compile_row(parser: any,
+                encoding: str = None,
+                warn_layout: bool = True,
+                status: bool = False,
+                check: bool = False) -> typing.Callable:
+    """
+    Compile the schema of a `Parser` into one row function, specialized for its input and output formats.
+    Pipelines of all the columns are inlined in the row function, so a row is parsed by a single call
+    without any per cell dispatch. The function takes the row and its (0 based) line number and returns
+    the parsed row, formatted as per `parsed_row_format`. For `json` formatted output the parsed row is
+    returned as `dict`, serialization is left to the caller. The position of a failing cell is passed to the
+    keyword argument `report`, which logs it by default.
+    :param parser: Parser
+        Parser to be compiled.
+    :param encoding: str
+        If provided, delimited and fixed-width rows are taken as bytes-like objects (e.g. `memoryview`) in this
+        encoding. For ASCII compatible encodings, delimited rows are split and fixed-width columns are sliced
+        (positions are byte positions) without decoding the row. Integer and float columns are casted straight
+        from bytes, only the other columns are decoded. Rows of other encodings are decoded as a whole.
+    :param warn_layout: bool
+        Whether to log the overlaps and gaps of a fixed-width layout, see `fixed_width_layout`.
+    :param status: bool
+        If `True`, the row function raises no validation exception, it returns the parsed row (`None` for a failed
+        row) along with the row status: a bitmask of the failed rules of every column (see `parseval.status`).
+        All the columns are validated, a failed column does not stop the row. Failures of the row itself
+        (e.g. too many columns) are reported as column `len(schema)`.
+    :param check: bool
+        If `True`, the row function only checks the row and returns its status (see `status`), no parsed row
+        is assembled. Values nobody reads afterwards are checked without being converted, e.g. digit-only values
+        of an integer column are not casted and the output format of a datetime column is not rendered.
+    :return: typing.Callable
+        Compiled row function.
+    """
+    src = Source()
+    names = [name for name, _ in parser.schema]
+    status = status or check
+    src.status, src.columns, src.check = status, len(names), check
+    columns = []
+    raw = encoding is not None and parser.input_row_format != "json" and _ascii_compatible(encoding)
+    enc = src.const(encoding, 'encoding') if raw else None
+    src.line(1, 'try:')
+    if encoding is not None and parser.input_row_format != "json" and not raw:
+        # Bytes of other encodings can not be split, sliced or casted as they are.
+        src.line(2, 'd = str(d, {})'.format(src.const(encoding, 'encoding')))
+    if parser.input_row_format == "delimited":
+        if raw:
+            src.line(2, '_cells = bytes(d).split({})'.format(src.const(parser.input_row_sep.encode(encoding), 'sep')))
+        else:
+            src.line(2, '_cells = d.split({})'.format(src.const(parser.input_row_sep, 'sep')))
+        _emit_column_count_check(src, '_cells', len(names), 2)
+    elif parser.input_row_format == "json":
+        _emit_column_count_check(src, 'd', len(names), 2)
+        if not check:
+            src.line(2, '_parsed = {}')
+    else:
+        fields = _emit_fields(src, fixed_width_layout(parser.schema, warn_layout), raw, 2)
+        if raw and (parser.parsed_row_format == "fixed-width"
+                    or not all(i in fields or _raw_steps(field_parser) for i, (_, field_parser) in enumerate(parser.schema))):
+            # The whole line is decoded only if a column or the output needs it.
+            src.line(2, '_line = str(d, {})'.format(enc))
+    for i, (name, field_parser) in enumerate(parser.schema):
+        src.field = i
+        var = '_c{}'.format(i)
+        indent = 2
+        skip = 0
+        if status:
+            # A failed rule leaves the loop, any other failure of the column is caught.
+            src.column = i
+            src.line(indent, 'while True:')
+            src.line(indent + 1, 'try:')
+            indent += 2
+        else:
+            src.line(indent, '_col = {}'.format(i))
+        if parser.input_row_format == "json":
+            key = src.const(name, 'key')
+            src.line(indent, 'if {} in d:'.format(key))
+            indent += 1
+            src.line(indent, '{} = d[{}]'.format(var, key))
+        elif parser.input_row_format == "delimited":
+            cell = '_cells[{}]'.format(i)
+            if not raw:
+                src.line(indent, '{} = {}'.format(var, cell))
+            elif _raw_steps(field_parser):
+                skip = _raw_steps(field_parser)
+                _emit_raw_cast(src, field_parser, var, cell, skip, encoding, indent)
+            else:
+                src.line(indent, '{} = str({}, {})'.format(var, cell, enc))
+        elif i in fields:
+            # The slicing step is replaced by the field extracted along with the others.
+            skip = 1
+            if not raw:
+                src.line(indent, '{} = {}'.format(var, fields[i]))
+            elif _raw_steps(field_parser):
+                skip = _raw_steps(field_parser)
+                _emit_raw_cast(src, field_parser, var, fields[i], skip, encoding, indent, first=1)
+            else:
+                src.line(indent, '{} = str({}, {})'.format(var, fields[i], enc))
+        elif raw and _raw_steps(field_parser):
+            skip = _raw_steps(field_parser)
+            _emit_raw_cast(src, field_parser, var, 'd', skip, encoding, indent)
+        else:
+            src.line(indent, '{} = {}'.format(var, '_line' if raw else 'd'))
+        src.pipeline(field_parser, var, indent, skip)
+        if parser.input_row_format == "json" and not check:
+            src.line(indent, '_parsed[{}] = {}'.format(src.const(name, 'key'), var))
+        columns.append(var)
+        if status:
+            src.line(3, 'except Exception as _e:')
+            src.line(4, '_status |= {}({}, {}(_e))'.format(src.const(failure_bit, 'bit'), i,
+                                                           src.const(error_code, 'code')))
+            src.line(3, 'break')
+            src.column = None
+    if check:
+        src.line(1, 'except Exception:')
+        src.line(2, 'return {}'.format(failure_bit(len(names), FORMAT_ERROR)))
+        src.line(1, 'return _status')
+        src.lines.insert(0, '    _status = 0')
+        return src.function('row', ['d', 'line_number'])
+    if status:
+        src.line(1, 'except Exception:')
+        src.line(2, 'return None, {}'.format(failure_bit(len(names), FORMAT_ERROR)))
+        src.line(1, 'if _status:')
+        src.line(2, 'return None, _status')
+        src.lines.insert(0, '    _status = 0')
+        _emit_row_output(src, parser, names, columns, raw, ', 0')
+        return src.function('row', ['d', 'line_number'])
+    src.line(1, 'except Exception:')
+    src.line(2, 'if _col is not None:')
+    # Bound under a fixed name, so a caller can divert the report by passing `report=...`.
+    src.consts['report'] = _report_cell_error
+    src.line(3, 'report(line_number, {}[_col])'.format(src.const(names, 'names')))
+    src.line(2, 'raise')
+    # `_col` must be bound before the `try` block, the failure might occur before the first column.
+    src.lines.insert(0, '    _col = None')
+    _emit_row_output(src, parser, names, columns, raw)
+    return src.function('row', ['d', 'line_number'])
+
+
+def _emit_row_output(src: Source, parser: any, names: typing.List[str], columns: typing.List[str], raw: bool,
+                     suffix: str = ''):
+    """
+    Emit the return of the parsed row, formatted as per `parsed_row_format`, followed by `suffix`.
+    """
+    if parser.input_row_format == "json":
+        src.line(1, 'return _parsed' + suffix)
+    elif parser.parsed_row_format == "delimited":
+        src.line(1, 'return {}([{}]){}'.format(src.const(parser.parsed_row_sep.join, 'join'),
+                                              ', '.join('str({})'.format(c) for c in columns), suffix))
+    elif parser.parsed_row_format == "fixed-width":
+        src.line(1, ('return _line' if raw else 'return d') + suffix)
+    else:
+        src.line(1, 'return {{{}}}{}'.format(', '.join('{}: {}'.format(src.const(n, 'key'), c)
+                                                       for n, c in zip(names, columns)), suffix))
+
+
+def _ascii_compatible(encoding: str) -> bool:
+    """
+    Whether the ASCII characters are encoded as single bytes of the same value, i.e. bytes of the encoding
+    can be split, sliced and casted like ASCII.
+    """
+    probe = ''.join(chr(c) for c in range(128))
+    try:
+        return probe.encode(encoding) == probe.encode('ascii')
+    except (UnicodeError, LookupError):
+        return False
+
+
+def _raw_steps(parser: any) -> int:
+    """
+    Number of leading steps of a field parser which can be applied to the undecoded (bytes) value:
+    the slicing, quote stripping and casting of integer and float columns. `0` if the value has to be decoded.
+    """
+    if parser.TYPE not in (int, float) or not parser.enforce_type:
+        return 0
+    for i, f in enumerate(parser._funcs):
+        if not isinstance(f, Step) or f.kind not in ('slice', 'strip_quotes', 'type_cast'):
+            return 0
+        if f.kind == 'type_cast':
+            return i + 1
+    return 0
+
+
+def _emit_raw_cast(src: Source,
+                   parser: any,
+                   var: str,
+                   cell: str,
+                   steps: int,
+                   encoding: str,
+                   indent: int,
+                   first: int = 0):
+    """
+    Emit the steps `first` to `steps` (see `_raw_steps`) of a field parser on the undecoded value `cell`.
+    Like the type casting of text, an empty value becomes an empty string.
+    """
+    src.line(indent, '{} = {}'.format(var, cell))
+    for f in parser._funcs[first:steps]:
+        if f.kind == 'slice':
+            src.line(indent, '{0} = {0}[{1}:{2}]'.format(var, f.params['start'] - 1, f.params['end']))
+        elif f.kind == 'strip_quotes':
+            src.line(indent, '{0} = bytes({0}).lstrip({1!r}).rstrip({1!r})'
+                     .format(var, f.params['quote'].encode(encoding)))
+    t = src.const(parser.TYPE, 'type')
+    enc = src.const(encoding, 'encoding')
+    src.line(indent, 'try:')
+    if src.check and steps == len(parser._funcs):
+        # Nothing needs the casted value, digit bytes are valid integers without being converted.
+        digits = ' and not (type({0}) is bytes and {0}.isdigit())'.format(var) if parser.TYPE is int else ''
+        src.line(indent + 1, 'if {}{}:'.format(var, digits))
+        src.line(indent + 2, '{}({})'.format(t, var))
+    else:
+        src.line(indent + 1, "{0} = {1}({0}) if {0} else ''".format(var, t))
+    src.line(indent, 'except Exception:')
+    # Bytes are casted as ASCII only, other digits and white spaces (e.g. NBSP) are casted as text.
+    src.line(indent + 1, 'try:')
+    if src.check and steps == len(parser._funcs):
+        src.line(indent + 2, '{}(str({}, {}))'.format(t, var, enc))
+    else:
+        src.line(indent + 2, '{0} = {1}(str({0}, {2}))'.format(var, t, enc))
+    src.line(indent + 1, 'except Exception:')
+    src.fail(indent + 2, 'UnexpectedParsingException', 'str({}, {}, "replace")'.format(var, enc), t)
+
+
+def fixed_width_layout(schema: typing.List[typing.Tuple],
+                       warn: bool = True) -> typing.List[typing.Tuple[int, int, int]]:
+    """
+    Gather the record layout of a fixed-width schema, out of the `start`/`end` positions of its field parsers.
+    Columns without positions (which get the whole line) are not part of the layout.
+    Positions are validated once: a column starting before the first position or ending before its start is a
+    schema error, overlapping columns and gaps between the columns are logged as warnings.
+    :param schema: typing.List[typing.Tuple]
+        Schema of a `Parser`
+    :param warn: bool
+        Whether to log the overlaps and gaps.
+        By default, `True`
+    :return: typing.List[typing.Tuple[int, int, int]]
+        (column index, start, end) of the positioned columns, in the order of their start position
+    """
+    layout = []
+    for i, (name, field_parser) in enumerate(schema):
+        f = field_parser._funcs[0] if field_parser._funcs else None
+        if not (isinstance(f, Step) and f.kind == 'slice'):
+            continue
+        start, end = f.params['start'], f.params['end']
+        if start < 1 or end < start:
+            raise SchemaBuildException("Invalid positions of fixed-width column - '{}': start - {}, end - {}."
+                                       .format(name, start, end))
+        layout.append((i, start, end))
+    layout.sort(key=lambda field: field[1:])
+    if not warn:
+        return layout
+    position = 0
+    for i, start, end in layout:
+        if start <= position:
+            logging.warning("Fixed-width column - '{}' ({}-{}) overlaps with the previous column."
+                            .format(schema[i][0], start, end))
+        elif start > position + 1:
+            logging.warning("Fixed-width layout has a gap before column - '{}' ({}-{})."
+                            .format(schema[i][0], start, end))
+        position = max(position, end)
+    return layout
+
+
+def _emit_fields(src: Source, layout: typing.List[typing.Tuple[int, int, int]], raw: bool,
+                 indent: int) -> typing.Dict[int, str]:
+    """
+    Emit the extraction of the fields of a fixed-width record and return the expression of each field by column.
+    Raw records with a layout free of overlaps are split by a single `struct` unpacking, if they are long enough.
+    Otherwise fields are sliced by precomputed `slice` objects.
+    """
+    if not layout:
+        return {}
+    slices = {i: src.const(slice(start - 1, end), 'slice') for i, start, end in layout}
+    if not raw:
+        # Column parsers used to slice `str(d)`, the line is turned into a string once instead.
+        src.line(indent, 'if type(d) is not str:')
+        src.line(indent + 1, 'd = str(d)')
+        return {i: 'd[{}]'.format(name) for i, name in slices.items()}
+    if any(start <= previous[2] for previous, (_, start, _) in zip(layout, layout[1:])):
+        return {i: 'd[{}]'.format(name) for i, name in slices.items()}
+    fmt = ''
+    position = 0
+    for i, start, end in layout:
+        if start > position + 1:
+            fmt += '{}x'.format(start - 1 - position)
+        fmt += '{}s'.format(end - start + 1)
+        position = end
+    record = struct.Struct(fmt)
+    fields = {i: '_f{}'.format(i) for i, _, _ in layout}
+    src.line(indent, 'if len(d) >= {}:'.format(record.size))
+    targets = ', '.join(fields[i] for i, _, _ in layout) + (',' if len(layout) == 1 else '')
+    src.line(indent + 1, '{} = {}(d)'.format(targets, src.const(record.unpack_from, 'unpack')))
+    src.line(indent, 'else:')
+    for i, name in slices.items():
+        src.line(indent + 1, '{} = d[{}]'.format(fields[i], name))
+    return fields
+
+
+def _emit_column_count_check(src: Source, cells: str, count: int, indent: int):
+    src.line(indent, 'if len({}) > {}:'.format(cells, count))
+    src.fail(indent + 1, 'UnexpectedParsingException', 'line_number + 1', None,
+             "Number of columns in line - {} is higher that number of declared columns in schema.")
@@ -1,152 +1,154 @@
-class UnexpectedSystemException(Exception):
-    def __init__(self, msg="Unexpected error occurred."):
-        self.msg = msg
+import datetime
+import typing
+
+# Bounds of these types travel along with a pickled exception, other bounds (e.g. value sets) by their representation.
+_PLAIN_BOUNDS = (str, int, float, bool, datetime.datetime, type(None))
+
+
+class ParsevalException(Exception):
+    """
+    Base of the parseval exceptions.
+    Validation failures carry their context as fields: the failing `column` (set by the `Parser`), the failed
+    `rule`, the offending `value` and the `bound` of the rule (e.g. maximum allowed value). The message is rendered
+    out of the `template` only when it is asked for (`str()`, `msg`, `args`), a failure nobody reads costs
+    no formatting.
+    """
+    MESSAGE = "Unexpected error occurred."
+    TEMPLATE = None
+    RULE = None
+
+    def __init__(self,
+                 msg: str = None,
+                 *,
+                 value: any = None,
+                 bound: any = None,
+                 template: str = None,
+                 column: str = None,
+                 rule: str = None):
+        """
+        :param msg: str
+            Message, rendered out of the template if not provided.
+        :param value: any
+            Offending value
+        :param bound: any
+            Bound of the failed rule
+        :param template: str
+            Message template, formatted with the value and the bound. By default, the template of the class.
+        :param column: str
+            Failing column
+        :param rule: str
+            Failed rule. By default, the rule of the class.
+        """
+        super().__init__(*(() if msg is None else (msg,)))
+        self._msg = msg
+        self._template = template
+        self.value = value
+        self.bound = bound
+        self.column = column
+        self.rule = rule if rule is not None else self.RULE
+
+    @property
+    def msg(self) -> str:
+        if self._msg is None:
+            template = self._template
+            if template is None and (self.value is not None or self.bound is not None):
+                template = self.TEMPLATE
+            self._msg = template.format(self.value, self.bound) if template is not None else self.MESSAGE
+        return self._msg
+
+    @property
+    def args(self) -> typing.Tuple[str]:
+        return (self.msg,)
+
+    @args.setter
+    def args(self, args: typing.Tuple):
+        self._msg = str(args[0]) if args else None
 
     def __str__(self):
         return self.msg
 
     def __repr__(self):
-        return f"<UnexpectedSystemException({self.msg})>"
+        return f"<{type(self).__name__}({self.msg})>"
 
+    def __reduce__(self):
+        bound = self.bound if isinstance(self.bound, _PLAIN_BOUNDS) else repr(self.bound)
+        return _restore, (type(self), self.msg, self.value, bound, self.column, self.rule)
 
-class UnexpectedParsingException(Exception):
-    def __init__(self, msg="Unexpected error occurred while parsing the data."):
-        self.msg = msg
 
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<UnexpectedParsingException({self.msg})>"
-
-
-class UnsupportedDatatypeException(Exception):
-    def __init__(self, msg="Unsupported datatype for column."):
-        self.msg = msg
-
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<UnsupportedDatatypeException({self.msg})>"
-
-
-class SchemaBuildException(Exception):
-    def __init__(self, msg="Unexpected error occurred while building the schema. Please declare the schema properly."):
-        self.msg = msg
-
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<SchemaBuildException({self.msg})>"
-
-
-class NullValueInNotNullFieldException(Exception):
-    def __init__(self, msg="NULL value detected in Not NULL field."):
-        self.msg = msg
-
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<NullValueInNotNullFieldException({self.msg})>"
-
-
-class ValidValueCheckException(Exception):
-    def __init__(self, msg="Provided value is not part of valid value list."):
-        self.msg = msg
-
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<ValidValueCheckException({self.msg})>"
+def _restore(cls: type, msg: str, value: any, bound: any, column: str, rule: str) -> ParsevalException:
+    return cls(msg, value=value, bound=bound, column=column, rule=rule)
 
 
-class MaximumValueConstraintException(Exception):
-    def __init__(self, msg="Provided value is higher than maximum allowed value for the column."):
-        self.msg = msg
+class UnexpectedSystemException(ParsevalException):
+    MESSAGE = "Unexpected error occurred."
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<MaximumValueConstraintException({self.msg})>"
+class UnexpectedParsingException(ParsevalException):
+    MESSAGE = "Unexpected error occurred while parsing the data."
+    TEMPLATE = "Column value - {} could not be casted into {}."
+    RULE = 'format'
 
 
-class MinimumValueConstraintException(Exception):
-    def __init__(self, msg="Provided value is lower than maximum allowed value for the column."):
-        self.msg = msg
+class UnsupportedDatatypeException(ParsevalException):
+    MESSAGE = "Unsupported datatype for column."
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<MinimumValueConstraintException({self.msg})>"
-
-
-class RegexMatchException(Exception):
-    def __init__(self, msg="Provided value does not match with expected pattern."):
-        self.msg = msg
-
-    def __str__(self):
-        return self.msg
-
-    def __repr__(self):
-        return f"<RegexMatchException({self.msg})>"
+class SchemaBuildException(ParsevalException):
+    MESSAGE = "Unexpected error occurred while building the schema. Please declare the schema properly."
 
 
-class StringParsingException(Exception):
-    def __init__(self, msg="Column value could not be casted to String."):
-        self.msg = msg
+class NullValueInNotNullFieldException(ParsevalException):
+    MESSAGE = "NULL value detected in Not NULL field."
+    RULE = 'not_null'
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<StringParsingException({self.msg})>"
+class ValidValueCheckException(ParsevalException):
+    MESSAGE = "Provided value is not part of valid value list."
+    TEMPLATE = "Provided value - '{}' is not part of valid value list - {}."
+    RULE = 'value_set'
 
 
-class IntegerParsingException(Exception):
-    def __init__(self, msg="Column value could not be casted to Integer."):
-        self.msg = msg
+class MaximumValueConstraintException(ParsevalException):
+    MESSAGE = "Provided value is higher than maximum allowed value for the column."
+    TEMPLATE = "Provided value - '{}' is higher than maximum allowed value - {}."
+    RULE = 'max_value'
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<IntegerParsingException({self.msg})>"
+class MinimumValueConstraintException(ParsevalException):
+    MESSAGE = "Provided value is lower than maximum allowed value for the column."
+    TEMPLATE = "Provided value - '{}' is lower than minimum allowed value - {}."
+    RULE = 'min_value'
 
 
-class FloatParsingException(Exception):
-    def __init__(self, msg="Column value could not be casted to Float."):
-        self.msg = msg
+class RegexMatchException(ParsevalException):
+    MESSAGE = "Provided value does not match with expected pattern."
+    TEMPLATE = "Data - '{}' does not match with expected pattern - {}."
+    RULE = 'regex'
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<FloatParsingException({self.msg})>"
+class StringParsingException(ParsevalException):
+    MESSAGE = "Column value could not be casted to String."
+    TEMPLATE = "Column value - {} could not be casted into String."
+    RULE = 'format'
 
 
-class BooleanParsingException(Exception):
-    def __init__(self, msg="Column value could not be casted to Boolean."):
-        self.msg = msg
+class IntegerParsingException(ParsevalException):
+    MESSAGE = "Column value could not be casted to Integer."
+    RULE = 'format'
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<BooleanParsingException({self.msg})>"
+class FloatParsingException(ParsevalException):
+    MESSAGE = "Column value could not be casted to Float."
+    RULE = 'format'
 
 
-class DateTimeParsingException(Exception):
-    def __init__(self, msg="Column value is not aligned to the provided formats."):
-        self.msg = msg
+class BooleanParsingException(ParsevalException):
+    MESSAGE = "Column value could not be casted to Boolean."
+    TEMPLATE = "'{}' is not a valid value for boolean type column."
+    RULE = 'format'
 
-    def __str__(self):
-        return self.msg
 
-    def __repr__(self):
-        return f"<DateTimeParsingException({self.msg})>"
+class DateTimeParsingException(ParsevalException):
+    MESSAGE = "Column value is not aligned to the provided formats."
+    TEMPLATE = "Column data - '{}' is not in any of the following formats - {}."
+    RULE = 'format'
@@ -0,0 +1,363 @@
+import calendar
+import collections
+import datetime
+import functools
+import re
+import typing
+
+try:
+    from parseval.exceptions import DateTimeParsingException
+    from parseval.compiler import Source
+except ImportError:
+    from exceptions import DateTimeParsingException
+    from compiler import Source
+
+_strptime = datetime.datetime.strptime
+_fromisoformat = datetime.datetime.fromisoformat
+
+# Fixed width numeric directives: width and position in the `datetime` constructor arguments.
+_DIRECTIVES = {'Y': (4, 0), 'm': (2, 1), 'd': (2, 2), 'H': (2, 3), 'M': (2, 4), 'S': (2, 5)}
+# `strptime` defaults of the missing components.
+_DEFAULTS = (1900, 1, 1, 0, 0, 0)
+# Layouts `datetime.fromisoformat` reads exactly like `strptime` does.
+_SORTABLE = ['%Y', '%m', '%d', '%H', '%M', '%S']
+_MONTH_DAYS = {'01': '31', '02': '29', '03': '31', '04': '30', '05': '31', '06': '30',
+               '07': '31', '08': '31', '09': '30', '10': '31', '11': '30', '12': '31'}
+_ISO_FORMATS = {'%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S'}
+# Format tokens which are not `strptime` formats, and the unit of the epoch based ones.
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_UNITS = {'epoch_s': datetime.timedelta(seconds=1), 'epoch_ms': datetime.timedelta(milliseconds=1)}
+TOKENS = ('epoch_s', 'epoch_ms', 'iso8601')
+_NUMBER = re.compile(r'[+-]?\d+(\.\d+)?', re.ASCII).fullmatch
+
+
+def _layout(format: str) -> typing.Optional[typing.List[typing.Tuple[str, int, int]]]:
+    """
+    Split a format into fixed width numeric directives and literal characters.
+    :return: typing.Optional[typing.List[typing.Tuple[str, int, int]]]
+        (directive or literal, start, end) of every part, `None` if the format is not of fixed width
+        or uses any other directive.
+    """
+    parts = []
+    position = 0
+    i = 0
+    while i < len(format):
+        c = format[i]
+        if c == '%':
+            if i + 1 == len(format):
+                return None
+            c = format[i + 1]
+            i += 2
+            if c in _DIRECTIVES:
+                if any(part[0] == '%' + c for part in parts):
+                    return None
+                width = _DIRECTIVES[c][0]
+                parts.append(('%' + c, position, position + width))
+                position += width
+                continue
+            if c != '%':
+                return None
+        else:
+            i += 1
+        parts.append((c, position, position + 1))
+        position += 1
+    if not any(len(part[0]) == 2 for part in parts):
+        return None
+    return parts
+
+
+def _shape(src: Source, layout: typing.List[typing.Tuple[str, int, int]]) -> str:
+    """
+    Expression checking that the value `v` is of the exact shape of a fixed width layout:
+    ASCII digits in place of the directives and the literal characters in between.
+    """
+    if all(len(part) == 2 for part, _, _ in layout):
+        return 'len(v) == {} and v.isdigit() and v.isascii()'.format(layout[-1][2])
+    pattern = ''.join(r'\d{{{}}}'.format(end - start) if len(part) == 2 else re.escape(part)
+                      for part, start, end in layout)
+    return '{}(v)'.format(src.const(re.compile(pattern, re.ASCII).fullmatch, 'shape'))
+
+
+def _utc(value: datetime.datetime) -> datetime.datetime:
+    """
+    Naive UTC equivalent of a datetime with an offset, naive datetimes are returned as they are.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _epoch_parser(format: str) -> typing.Callable[[str], datetime.datetime]:
+    unit = _EPOCH_UNITS[format]
+
+    def parse_epoch(v: str) -> datetime.datetime:
+        if not _NUMBER(v):
+            raise ValueError("time data {!r} is not a number of {} since the epoch".format(v, format))
+        try:
+            return _EPOCH + unit * (float(v) if '.' in v else int(v))
+        except OverflowError:
+            raise ValueError("time data {!r} is out of range".format(v))
+
+    return parse_epoch
+
+
+def _parse_iso8601(v: str) -> datetime.datetime:
+    if v[-1:] in ('Z', 'z'):
+        v = v[:-1] + '+00:00'
+    return _utc(_fromisoformat(v))
+
+
+def format_datetime(value: datetime.datetime, format: str) -> str:
+    """
+    Render a datetime in a format: a `strftime` format or one of the format tokens.
+    `iso8601` is rendered by `datetime.isoformat`, `epoch_s`/`epoch_ms` as the whole number of seconds/milliseconds
+    since the epoch (UTC).
+    :param value: datetime.datetime
+        Value to be rendered
+    :param format: str
+        Format or format token
+    :return: str
+        Rendered value
+    """
+    if format == 'iso8601':
+        return value.isoformat()
+    if format in _EPOCH_UNITS:
+        return str((_utc(value) - _EPOCH) // _EPOCH_UNITS[format])
+    return value.strftime(format)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_format(format: str) -> typing.Callable[[str], datetime.datetime]:
+    """
+    Build the parse function of a datetime format.
+    Fixed width numeric formats (made of `%Y`, `%m`, `%d`, `%H`, `%M`, `%S` and literal characters, e.g. `%Y%m%d`
+    or `%Y-%m-%d %H:%M:%S`) are parsed by slicing and `int`, ISO like ones by `datetime.fromisoformat`, once the
+    value is checked to be of the exact shape of the format. Any other format, and any value the fast path
+    can not read (e.g. not zero padded), is parsed by `datetime.strptime`, with the same outcome.
+    Format tokens are parsed without `strptime` as well:
+        - `epoch_s`/`epoch_ms`: (signed, possibly fractional) number of seconds/milliseconds since the epoch
+        - `iso8601`: any ISO 8601 value `datetime.fromisoformat` reads, `Z` suffix included
+    Values of these tokens are returned as naive UTC datetimes, values with an offset are converted to UTC.
+    :param format: str
+        `strptime` format or format token
+    :return: typing.Callable[[str], datetime.datetime]
+        Parse function, raising `ValueError` when the value does not fit the format
+    """
+    if format in _EPOCH_UNITS:
+        return _epoch_parser(format)
+    if format == 'iso8601':
+        return _parse_iso8601
+    src = Source()
+    strptime = src.const(_strptime, 'strptime')
+    layout = _layout(format)
+    if layout is not None:
+        src.line(1, 'if {}:'.format(_shape(src, layout)))
+        src.line(2, 'try:')
+        if format in _ISO_FORMATS:
+            src.line(3, 'return {}(v)'.format(src.const(_fromisoformat, 'fromisoformat')))
+        else:
+            arguments = [str(default) for default in _DEFAULTS]
+            for part, start, end in layout:
+                if len(part) == 2:
+                    arguments[_DIRECTIVES[part[1]][1]] = 'int(v[{}:{}])'.format(start, end)
+            src.line(3, 'return {}({})'.format(src.const(datetime.datetime, 'datetime'), ', '.join(arguments)))
+        src.line(2, 'except ValueError:')
+        src.line(3, 'pass')
+    src.line(1, 'return {}(v, {!r})'.format(strptime, format))
+    return src.function('parse_datetime', ['v'])
+
+
+class SortableFormat:
+    """
+    Fixed width numeric format whose directives are a prefix of `%Y`, `%m`, `%d`, `%H`, `%M`, `%S` in this order
+    (e.g. `%Y%m%d`, `%Y-%m-%d %H:%M:%S`). String order of such values is their chronological order,
+    hence they can be validated and compared as strings, without building `datetime` objects.
+    """
+
+    def __init__(self, format: str, layout: typing.List[typing.Tuple[str, int, int]]):
+        """
+        :param format: str
+            `strptime` format
+        :param layout: typing.List[typing.Tuple[str, int, int]]
+            Layout of the format, see `_layout`
+        """
+        self.format: str = format
+        self._layout: typing.List[typing.Tuple[str, int, int]] = layout
+        self.valid: typing.Callable[[str], bool] = self._compile_valid()
+
+    def __getstate__(self):
+        return {'format': self.format, 'layout': self._layout}
+
+    def __setstate__(self, state: typing.Dict):
+        self.__init__(state['format'], state['layout'])
+
+    def _compile_valid(self) -> typing.Callable[[str], bool]:
+        """
+        Build the function telling whether a string is a valid value of the format, i.e. whether `strptime`
+        reads it as it is (zero padded, in range).
+        """
+        src = Source()
+        fields = {part: 'v[{}:{}]'.format(start, end) for part, start, end in self._layout if len(part) == 2}
+        conditions = [_shape(src, self._layout), "{} != '0000'".format(fields['%Y'])]
+        if '%m' in fields:
+            conditions.append('{} in {}'.format(fields['%m'], src.const(_MONTH_DAYS, 'months')))
+        if '%d' in fields:
+            conditions.append("'01' <= {} <= {}[{}]".format(fields['%d'], src.const(_MONTH_DAYS, 'months'),
+                                                             fields['%m']))
+            conditions.append("({} != '0229' or {}(int({})))".format(fields['%m'] + ' + ' + fields['%d'],
+                                                                      src.const(calendar.isleap, 'isleap'),
+                                                                      fields['%Y']))
+        for part, limit in (('%H', '24'), ('%M', '60'), ('%S', '60')):
+            if part in fields:
+                conditions.append("{} < '{}'".format(fields[part], limit))
+        src.line(1, 'return {}'.format(' and '.join(conditions)))
+        return src.function('valid_datetime', ['v'])
+
+    def render(self, value: datetime.datetime) -> typing.Optional[str]:
+        """
+        Render a datetime as a string of the format.
+        :param value: datetime.datetime
+            Value to be rendered
+        :return: typing.Optional[str]
+            String value, `None` if the value can not be written in the format without loss
+            (e.g. a time of the day in a date only format).
+        """
+        if type(value) != datetime.datetime or value.tzinfo is not None or value.microsecond:
+            return None
+        fields = (value.year, value.month, value.day, value.hour, value.minute, value.second)
+        text = []
+        used = set()
+        for part, start, end in self._layout:
+            if len(part) == 2:
+                position = _DIRECTIVES[part[1]][1]
+                used.add(position)
+                text.append('{:0{}d}'.format(fields[position], end - start))
+            else:
+                text.append(part)
+        if any(fields[i] != _DEFAULTS[i] for i in range(6) if i not in used):
+            return None
+        return ''.join(text)
+
+
+@functools.lru_cache(maxsize=None)
+def sortable_format(format: str) -> typing.Optional[SortableFormat]:
+    """
+    :param format: str
+        `strptime` format
+    :return: typing.Optional[SortableFormat]
+        The format, if its values can be validated and compared as strings, otherwise `None`
+    """
+    layout = _layout(format)
+    if layout is None:
+        return None
+    directives = [part for part, _, _ in layout if len(part) == 2]
+    if directives != _SORTABLE[:len(directives)]:
+        return None
+    return SortableFormat(format, layout)
+
+
+class FormatResolver:
+    """
+    Resolves column values of a date/datetime column against its allowed formats.
+    Every format is parsed by its own parse function, see `compile_format`.
+    Formats are tried in declared order. Optionally they are tried from the last successful one onwards
+    (adaptive order), so a column mostly made of one format pays a single parsing attempt per value, wherever that
+    format is declared; the outcome of a value fitting several formats then depends on the values seen before.
+    Every successful format is counted, which tells the format mix of the column.
+    Optionally the resolver locks onto a format once that many consecutive values used it; a locked format is
+    the only one tried, until a value does not fit it and all the formats are tried again.
+    """
+
+    def __init__(self, formats: typing.List[str], adaptive: bool = False, lock_after: int = None):
+        """
+        :param formats: typing.List[str]
+            Allowed formats, in declared order. The list is referred to, not copied, formats appended to it
+            later on are taken into account.
+        :param adaptive: bool
+            If set to `True`, the last successful format is tried first. If a value fits several formats,
+            the first tried wins, hence the result depends on the values seen before.
+            By default, `False`, i.e. formats are always tried in declared order
+        :param lock_after: int
+            Number of consecutive values of the same format after which the resolver locks onto that format.
+            `None` disables locking.
+            By default, `None`
+        """
+        self.formats: typing.List[str] = formats
+        self.adaptive: bool = adaptive
+        self.lock_after: int = lock_after
+        self.hits: typing.Counter = collections.Counter()
+        self.fallbacks: int = 0
+        self.locked: str = None
+        self._order: typing.List[str] = []
+        self._known: int = 0
+        self._parsers: typing.Dict[str, typing.Callable] = {}
+        self._last: str = None
+        self._streak: int = 0
+
+    def parse(self, data: any) -> datetime.datetime:
+        """
+        Parse a column value using the allowed formats.
+        :param data: any
+            Column value
+        :return: datetime.datetime
+            Parsed value
+        """
+        value = str(data)
+        locked = self.locked
+        if locked is not None:
+            try:
+                parsed = self._parsers[locked](value)
+            except Exception:
+                self.locked = None
+                self.fallbacks += 1
+            else:
+                self.hits[locked] += 1
+                return parsed
+        order = self._order
+        if self._known != len(self.formats):
+            self._learn()
+        parsers = self._parsers
+        for i, f in enumerate(order):
+            try:
+                parsed = parsers[f](value)
+            except Exception:
+                continue
+            self.hits[f] += 1
+            if f == self._last:
+                self._streak += 1
+            else:
+                self._last = f
+                self._streak = 1
+                if i and self.adaptive:
+                    order.insert(0, order.pop(i))
+            if self.lock_after is not None and self._streak >= self.lock_after:
+                self.locked = f
+            return parsed
+        raise DateTimeParsingException(value=data, bound=self.formats)
+
+    def _learn(self):
+        """
+        Take the formats appended to the allowed formats into account, keeping the order learnt so far.
+        """
+        for f in self.formats[self._known:]:
+            if f not in self._order:
+                self._order.append(f)
+                self._parsers[f] = compile_format(f)
+        self._known = len(self.formats)
+
+    def __getstate__(self):
+        # Parse functions are generated, they are generated again by the receiving side.
+        state = self.__dict__.copy()
+        state['_parsers'] = {}
+        return state
+
+    def __setstate__(self, state: typing.Dict):
+        self.__dict__.update(state)
+        self._parsers = {f: compile_format(f) for f in self._order}
+
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Number of values parsed by each of the allowed formats, in declared order.
+        :return: typing.Dict[str, int]
+        """
+        return {f: self.hits[f] for f in self.formats}
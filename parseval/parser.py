@@ -4,9 +4,16 @@ import typing
 import datetime
 import functools
 import logging
+import os
+import pickle
+import itertools
+import collections
+import contextlib
+import concurrent.futures
 
 try:
     from parseval.exceptions import (
+        ParsevalException,
         UnexpectedSystemException,
         UnexpectedParsingException,
         UnsupportedDatatypeException,
@@ -24,6 +31,7 @@ try:
     )
 except ImportError:
     from exceptions import (
+        ParsevalException,
         UnexpectedSystemException,
         UnexpectedParsingException,
         UnsupportedDatatypeException,
@@ -40,9 +48,56 @@ except ImportError:
         DateTimeParsingException
     )
 
+try:
+    from parseval.steps import Step
+    from parseval.compiler import compile_parser, compile_row, rebind, bind_state, _report_cell_error
+    from parseval.cache import PlanCache, PLAN_CACHE, fingerprint, field_fingerprint, generation, touch
+    from parseval.reader import file_ranges, read_lines, map_lines
+    from parseval.formats import FormatResolver, SortableFormat, sortable_format, compile_format, format_datetime
+    from parseval.valueset import ValueSet
+    from parseval.refset import ReferenceSet
+    from parseval.status import FORMAT_ERROR, RULES, error_code, failure_bit, failures
+    from parseval.sinks import RejectSink
+    from parseval.summary import ErrorSummary
+except ImportError:
+    from steps import Step
+    from compiler import compile_parser, compile_row, rebind, bind_state, _report_cell_error
+    from cache import PlanCache, PLAN_CACHE, fingerprint, field_fingerprint, generation, touch
+    from reader import file_ranges, read_lines, map_lines
+    from formats import FormatResolver, SortableFormat, sortable_format, compile_format, format_datetime
+    from valueset import ValueSet
+    from refset import ReferenceSet
+    from status import FORMAT_ERROR, RULES, error_code, failure_bit, failures
+    from sinks import RejectSink
+    from summary import ErrorSummary
+
 logging.basicConfig(format='%(levelname)s:%(asctime)s:: %(message)s', level=logging.DEBUG)
 
 
+def _compile_pattern(pattern: typing.Union[str, typing.Pattern]) -> typing.Pattern:
+    """
+    Compile a regular expression declared by a validator, reporting an invalid one as `UnexpectedParsingException`.
+    """
+    try:
+        return re.compile(pattern)
+    except Exception:
+        logging.error('~' * 100)
+        logging.exception("Pattern compilation exception:")
+        logging.error('~' * 100)
+        raise UnexpectedParsingException("Provided pattern - '{}' is not a valid regular expression.".format(pattern))
+
+
+def _inline_pattern(pattern: typing.Union[str, typing.Pattern]) -> str:
+    """
+    Source of a pattern to be combined with others, the flags of a compiled pattern are scoped to it.
+    """
+    if isinstance(pattern, str):
+        return pattern
+    flags = ''.join(letter for flag, letter in ((re.ASCII, 'a'), (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'),
+                                                (re.DOTALL, 's'), (re.VERBOSE, 'x')) if pattern.flags & flag)
+    return '(?{}:{})'.format(flags, pattern.pattern) if flags else pattern.pattern
+
+
 class FieldParser:
     """
     Base class for all parsers apart from Constant.
@@ -75,16 +130,40 @@ class FieldParser:
             By default this parameter is set to True.
         """
         self._nullable: bool = False
+        self._fingerprint: typing.Hashable = None
         self._funcs: typing.List = []
         self.enforce_type: bool = enforce_type
 
         if start and end:
-            self.add_func(lambda s: str(s)[start - 1:end])
+            self.add_func(Step('slice', start=start, end=end))
         if quoted == 1:
-            self.add_func(lambda s: s.lstrip('"').rstrip('"'))
+            self.add_func(Step('strip_quotes', quote='"'))
         elif quoted == 2:
-            self.add_func(lambda s: s.lstrip("'").rstrip("'"))
+            self.add_func(Step('strip_quotes', quote="'"))
+        self.add_func(Step('type_cast'))
 
+    def _build_slice(self, start: int, end: int):
+        """
+        Build the closure of `slice` step.
+        :return: typing.Callable
+            Closure
+        """
+        return lambda s: str(s)[start - 1:end]
+
+    def _build_strip_quotes(self, quote: str):
+        """
+        Build the closure of `strip_quotes` step.
+        :return: typing.Callable
+            Closure
+        """
+        return lambda s: s.lstrip(quote).rstrip(quote)
+
+    def _build_type_cast(self):
+        """
+        Build the closure of `type_cast` step.
+        :return: typing.Callable
+            Closure
+        """
         def type_casting(data: any):
             """
             Closure to cast the data to respective type
@@ -98,26 +177,37 @@ class FieldParser:
                     if self.TYPE and self.TYPE != bool:
                         if self.enforce_type:
                             data = self.TYPE(data)
-                        else:
+                        elif not (self.TYPE is int and type(data) is str and data.isdecimal()):
+                            # Digit strings are valid integers, the value is not converted just to be discarded.
                             self.TYPE(data)
                 return data
             except Exception:
                 logging.error('~' * 100)
                 logging.exception("Datatype casting exception:")
                 logging.error('~' * 100)
-                raise UnexpectedParsingException("Column value - {} could not be casted into {}.".format(data, self.TYPE))
+                raise UnexpectedParsingException(value=data, bound=self.TYPE)
 
-        self.add_func(type_casting)
+        return type_casting
 
-    def build(self):
+    def build(self, compiled: bool = False):
         """
         Builder function to accumulate all closures that need to be applied on top of the data.
+        :param compiled: bool
+            If set to `True`, instead of chaining the closures, the parser is compiled into one flat function
+            with all built-in steps inlined. Custom functions added using `add_func` are called as they are.
+            The compiled function returns the same values and raises the same exceptions as the closure chain,
+            but it does not log the exceptions. Compiled functions are cached in the process-wide plan cache,
+            structurally identical parsers share the same function.
+            By default, `False`
         :return:
             Master function to be applied on data
         """
         try:
+            if compiled:
+                return bind_state(PLAN_CACHE.get(('field', field_fingerprint(self)), lambda: compile_parser(self)), self)
             if self._funcs:
-                return functools.reduce(lambda parser1, parser2: lambda s: parser2(parser1(s)), self._funcs)
+                return functools.reduce(lambda parser1, parser2: lambda s: parser2(parser1(s)),
+                                        [self._closure(f) for f in self._funcs])
             else:
                 return lambda x: x
         except Exception as e:
@@ -126,17 +216,40 @@ class FieldParser:
             logging.error('~' * 100)
             raise UnexpectedSystemException()
 
+    def __getstate__(self):
+        # The fingerprint may refer to unpicklable custom functions, the receiving side computes it again.
+        state = self.__dict__.copy()
+        state['_fingerprint'] = None
+        return state
+
+    def _closure(self, f: any) -> typing.Callable:
+        """
+        Rebuild the closure of a declared step. Custom functions are returned as they are.
+        :param f: any
+            `Step` record or custom function.
+        :return: typing.Callable
+            Closure
+        """
+        if isinstance(f, Step):
+            return getattr(self, '_build_' + f.kind)(**f.params)
+        return f
+
     def add_func(self, f: any):
         """
         Add closure to the list of closure.
         :param f: any
             Although this parameter is typed as any, but it accepts a closure
              and adds it to the list of closures for this object.
+            Built-in validators add `Step` records, which are turned into closures only while building the parser.
+            Unlike closures the records can be pickled, hence parsers built only out of built-in validators
+            and module level custom functions can be sent to other processes.
         :return: FieldParser
             self
         """
         try:
             self._funcs.append(f)
+            self._fingerprint = None
+            touch()
         except Exception as e:
             logging.error('~' * 100)
             logging.exception("Custom function addition exception:")
@@ -157,6 +270,14 @@ class FieldParser:
                                                f" {self.TYPE} type column. Please provide default value of"
                                                f" {self.TYPE} type.")
 
+        return self.add_func(Step('not_null', default_value=default_value))
+
+    def _build_not_null(self, default_value: any):
+        """
+        Build the closure of `not_null` step.
+        :return: typing.Callable
+            Closure
+        """
         def null_check(data: any):
             """
             Null Check closure.
@@ -182,20 +303,30 @@ class FieldParser:
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(null_check)
+        return null_check
 
-    def value_set(self, values: typing.List, nullable: bool = True):
+    def value_set(self, values: typing.Union[typing.List, ValueSet], nullable: bool = True, prefix: bool = False,
+                  ordered: bool = False):
         """
         Building valid value check closure.
-        :param values: typing.List
+        :param values: typing.Union[typing.List, ValueSet]
             Set of valid values for this column.
         :param nullable: bool
             If set to `True` then empty string and None will be treated as valid value,
              along with the provided value list.
             By default, `True`
+        :param prefix: bool
+            If set to `True` then values starting with a valid value are valid too, e.g. for hierarchical codes.
+            By default, `False`
+        :param ordered: bool
+            If set to `True` then the valid values are kept sorted as well, to be queried by range
+            (see `ValueSet.between`). By default, `False`
         :return: FieldParser
             self
         """
+        if isinstance(values, ValueSet):
+            prefix, ordered = prefix or values.prefix, ordered or values.ordered
+            values = [v for v in values if v not in ('', None)]
         dtypes = set(type(v) for v in values)
         if len(dtypes) > 1 or list(dtypes)[0] != self.TYPE:
             raise UnsupportedDatatypeException(f"Provided valid values are not fit for"
@@ -203,10 +334,23 @@ class FieldParser:
                                                f" {self.TYPE} type.")
         if self.enforce_type:
             values = [self.TYPE(value) for value in values]
+        else:
+            values = list(values)
 
         if nullable:
             values.extend(['', None])
 
+        return self.add_func(Step('value_set', values=ValueSet(values, prefix=prefix, ordered=ordered)))
+
+    def _build_value_set(self, values: ValueSet):
+        """
+        Build the closure of `value_set` step.
+        :return: typing.Callable
+            Closure
+        """
+        members = values.members
+        match_prefix = values.match_prefix if values.prefix else None
+
         def valid_value_check(data: any):
             """
             Valid value check closure.
@@ -216,9 +360,8 @@ class FieldParser:
                 Column value
             """
             try:
-                if data not in values:
-                    raise ValidValueCheckException(
-                        "Provided value - '{}' is not part of valid value list - {}.".format(data, values))
+                if data not in members and not (match_prefix and type(data) == str and match_prefix(data)):
+                    raise ValidValueCheckException(value=data, bound=values)
                 else:
                     return data
             except Exception as e:
@@ -227,7 +370,58 @@ class FieldParser:
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
+
+    def reference_set(self, reference: typing.Union[str, ReferenceSet], nullable: bool = True):
+        """
+        Building reference key check closure, for sets of valid values too large to be kept in memory.
+        Values are looked up in an on-disk sorted key file (see `ReferenceSet`) by their string representation.
+        :param reference: typing.Union[str, ReferenceSet]
+            Reference set, or path of its sorted key file.
+        :param nullable: bool
+            If set to `True` then empty string and None will be treated as valid value.
+            By default, `True`
+        :return: FieldParser
+            self
+        """
+        if not isinstance(reference, ReferenceSet):
+            try:
+                reference = ReferenceSet(reference)
+            except Exception:
+                logging.error('~' * 100)
+                logging.exception("Reference set loading exception:")
+                logging.error('~' * 100)
+                raise UnexpectedParsingException("Reference key file - '{}' can not be loaded.".format(reference))
+        return self.add_func(Step('reference_set', reference=reference, nullable=nullable))
+
+    def _build_reference_set(self, reference: ReferenceSet, nullable: bool):
+        """
+        Build the closure of `reference_set` step.
+        :return: typing.Callable
+            Closure
+        """
+        def reference_check(data: any):
+            """
+            Reference key check closure.
+            :param data: any
+                Column data.
+            :return: any
+                Column value
+            """
+            try:
+                if nullable and (data is None or data == ''):
+                    return data
+                if data not in reference:
+                    raise ValidValueCheckException(value=data, bound=reference,
+                                                   template="Provided value - '{}' is not part of reference set - {}.")
+                return data
+            except Exception as e:
+                logging.error('~' * 100)
+                logging.exception("Reference set check exception:")
+                logging.error('~' * 100)
+                raise e
+
+        return reference_check
 
     def max_value(self, value: any):
         """
@@ -244,6 +438,14 @@ class FieldParser:
         if self.enforce_type:
             value = self.TYPE(value)
 
+        return self.add_func(Step('max_value', value=value))
+
+    def _build_max_value(self, value: any):
+        """
+        Build the closure of `max_value` step.
+        :return: typing.Callable
+            Closure
+        """
         def valid_value_check(data: any):
             """
             Maximum value check closure.
@@ -255,9 +457,7 @@ class FieldParser:
             try:
                 if data:
                     if data > value:
-                        raise MaximumValueConstraintException(
-                            "Provided value - '{}' is higher than maximum allowed value - {}.".format(data, value)
-                        )
+                        raise MaximumValueConstraintException(value=data, bound=value)
                 return data
             except Exception as e:
                 logging.error('~' * 100)
@@ -265,7 +465,7 @@ class FieldParser:
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
 
     def min_value(self, value: any):
         """
@@ -283,6 +483,14 @@ class FieldParser:
         if self.enforce_type:
             value = self.TYPE(value)
 
+        return self.add_func(Step('min_value', value=value))
+
+    def _build_min_value(self, value: any):
+        """
+        Build the closure of `min_value` step.
+        :return: typing.Callable
+            Closure
+        """
         def valid_value_check(data: any):
             """
             Minimum value check closure.
@@ -294,9 +502,7 @@ class FieldParser:
             try:
                 if data:
                     if data < value:
-                        raise MinimumValueConstraintException(
-                            "Provided value - '{}' is lower than minimum allowed value - {}.".format(data, value)
-                        )
+                        raise MinimumValueConstraintException(value=data, bound=value)
                 return data
             except Exception as e:
                 logging.error('\n')
@@ -305,7 +511,7 @@ class FieldParser:
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
 
     def range(self, lower_bound: any, upper_bound: any):
         """
@@ -331,6 +537,7 @@ class StringParser(FieldParser):
     Inherits from `FieldParser` class.
     String specific features:
         - regex_match
+        - regex_any
         - change_case
     Overridden features:
         - not_null (to handle prolonged white spaces)
@@ -343,6 +550,14 @@ class StringParser(FieldParser):
         """
         super().__init__(*args, **kwargs)
 
+        self.add_func(Step('string_cast'))
+
+    def _build_string_cast(self):
+        """
+        Build the closure of `string_cast` step.
+        :return: typing.Callable
+            Closure
+        """
         def string_casting(data: any):
             """
             Closure to cast the data to string
@@ -361,23 +576,37 @@ class StringParser(FieldParser):
                 logging.error('~' * 100)
                 logging.exception("String casting exception:")
                 logging.error('~' * 100)
-                raise StringParsingException("Column value - {} could not be casted into String.".format(data))
+                raise StringParsingException(value=data)
 
-        self.add_func(string_casting)
+        return string_casting
 
-    def regex_match(self, pattern: str, nullable: bool = True):
+    def regex_match(self, pattern: str, nullable: bool = True, full_match: bool = False):
         """
         Building regex match closure.
         :param pattern: str
-            Patter to match with the data.
+            Patter to match with the data. The pattern is compiled once, here.
         :param nullable: bool
             If set to `True` then empty string and None will be treated as valid value,
              along with the values that matches provided `pattern`.
             By default, `True`
+        :param full_match: bool
+            If set to `True` the whole value has to match the pattern, otherwise only its beginning.
+            By default, `False`
         :return: StringParser
             any
         """
 
+        return self.add_func(Step('regex_match', pattern=pattern, nullable=nullable, full_match=full_match,
+                                  regex=_compile_pattern(pattern)))
+
+    def _build_regex_match(self, pattern: str, nullable: bool, full_match: bool, regex: typing.Pattern):
+        """
+        Build the closure of `regex_match` step.
+        :return: typing.Callable
+            Closure
+        """
+        match = regex.fullmatch if full_match else regex.match
+
         def pattern_match(data: str):
             """
             Regex match closure.
@@ -387,11 +616,84 @@ class StringParser(FieldParser):
                 Parsed column value
             """
             try:
-                if not re.match(pattern, data):
+                if not match(data):
+                    if not (not data and nullable):
+                        raise RegexMatchException(value=data, bound=pattern)
+                return data
+            except Exception as e:
+                logging.error('\n')
+                logging.error('~' * 100)
+                logging.exception("Pattern match exception:")
+                logging.error('~' * 100)
+                raise e
+
+        return pattern_match
+
+    def regex_any(self,
+                  patterns: typing.Union[typing.List[str], typing.Dict[str, str]],
+                  nullable: bool = True,
+                  full_match: bool = False):
+        """
+        Building multiple regex match closure: the data has to match any of the patterns.
+        The patterns are combined into one pattern, compiled once, so the data is scanned only once.
+        The alternative matched by every value is counted, see `match_stats`.
+        Alternatives must not refer to their own groups by number (e.g. `\\1`), nor share group names.
+        :param patterns: typing.Union[typing.List[str], typing.Dict[str, str]]
+            Alternative patterns, or alternative patterns by name.
+            If several alternatives match, the first one is counted.
+        :param nullable: bool
+            If set to `True` then empty string and None will be treated as valid value,
+             along with the values that matches any of the `patterns`.
+            By default, `True`
+        :param full_match: bool
+            If set to `True` the whole value has to match an alternative, otherwise only its beginning.
+            By default, `False`
+        :return: StringParser
+            self
+        """
+        names = list(patterns) if isinstance(patterns, dict) else None
+        alternatives = list(patterns.values()) if names is not None else list(patterns)
+        if names is None:
+            names = [getattr(p, 'pattern', p) for p in alternatives]
+        combined = '|'.join('(?P<_{}>{})'.format(i, _inline_pattern(p)) for i, p in enumerate(alternatives))
+        if not hasattr(self, '_matches'):
+            self._matches: typing.Counter = collections.Counter()
+        return self.add_func(Step('regex_any', patterns=alternatives, nullable=nullable, full_match=full_match,
+                                  regex=_compile_pattern(combined),
+                                  groups={'_{}'.format(i): name for i, name in enumerate(names)}))
+
+    def _build_regex_any(self,
+                         patterns: typing.List[str],
+                         nullable: bool,
+                         full_match: bool,
+                         regex: typing.Pattern,
+                         groups: typing.Dict[str, str]):
+        """
+        Build the closure of `regex_any` step.
+        :return: typing.Callable
+            Closure
+        """
+        match = regex.fullmatch if full_match else regex.match
+        matches = self._matches
+
+        def any_pattern_match(data: str):
+            """
+            Multiple regex match closure.
+            :param data: str
+                Column data.
+            :return: str
+                Parsed column value
+            """
+            try:
+                found = match(data)
+                if found is None:
                     if not (not data and nullable):
                         raise RegexMatchException(
-                            "Data - '{}' does not match with expected pattern - {}.".format(data, pattern)
+                            value=data, bound=patterns,
+                            template="Data - '{}' does not match with any of the expected patterns - {}."
                         )
+                else:
+                    matches[groups[found.lastgroup]] += 1
                 return data
             except Exception as e:
                 logging.error('\n')
@@ -400,7 +702,16 @@ class StringParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(pattern_match)
+        return any_pattern_match
+
+    def match_stats(self) -> typing.Dict[str, int]:
+        """
+        Number of values matched by each alternative of the `regex_any` validators so far.
+        Values parsed by other processes (e.g. `parse(workers=...)`) are not counted.
+        :return: typing.Dict[str, int]
+            Counters by alternative (its name, or the pattern itself)
+        """
+        return dict(getattr(self, '_matches', {}))
 
     def change_case(self, case_type: str = 'S'):
         """
@@ -411,6 +722,14 @@ class StringParser(FieldParser):
             self
         """
 
+        return self.add_func(Step('change_case', case_type=case_type))
+
+    def _build_change_case(self, case_type: str):
+        """
+        Build the closure of `change_case` step.
+        :return: typing.Callable
+            Closure
+        """
         def change_case(data: str):
             """
             Change case closure.
@@ -435,7 +754,7 @@ class StringParser(FieldParser):
                 logging.error('~' * 100)
                 raise UnexpectedParsingException()
 
-        return self.add_func(change_case)
+        return change_case
 
     def not_null(self, default_value: any = None, allow_white_space: bool = False):
         """
@@ -450,6 +769,15 @@ class StringParser(FieldParser):
             self
         """
 
+        return self.add_func(Step('string_not_null', default_value=default_value,
+                                  allow_white_space=allow_white_space))
+
+    def _build_string_not_null(self, default_value: any, allow_white_space: bool):
+        """
+        Build the closure of `string_not_null` step.
+        :return: typing.Callable
+            Closure
+        """
         def null_check(data: any):
             """
             Null Check closure.
@@ -480,7 +808,7 @@ class StringParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(null_check)
+        return null_check
 
 
 class FloatParser(FieldParser):
@@ -529,16 +857,55 @@ class BooleanParser(FieldParser):
         None
     """
     TYPE = bool
+    TRUTHY_PATTERNS = (r'\b[Tt][Rr][Uu][Ee]\b', r'\b[TtyY]\b', r'\b[Yy][eE][sS]\b', r'\-?\d+(\.\d+)?')
+    FALSY_PATTERNS = (r'\b[fF][aA][lL][sS][Ee]\b', r'\b[FfnN]\b', r'\b[Nn][Oo]\b', r'0+(\.0+)?')
+    TRUTHY_TOKENS = ('true', 't', 'y', 'yes')
+    FALSY_TOKENS = ('false', 'f', 'n', 'no')
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, true_values: typing.List[str] = None, false_values: typing.List[str] = None, **kwargs):
         """
             Handing over object initialization to parent class.
+        :param true_values: typing.List[str]
+            Additional (case insensitive) values to be read as `True`, e.g. `['on', 'enabled']`.
+        :param false_values: typing.List[str]
+            Additional (case insensitive) values to be read as `False`, e.g. `['off', '0']`.
         """
         super().__init__(*args, **kwargs)
 
+        tokens = {token: True for token in self.TRUTHY_TOKENS}
+        tokens.update({token: False for token in self.FALSY_TOKENS})
+        extras = [(str(v).strip().lower(), True) for v in true_values or []] + \
+                 [(str(v).strip().lower(), False) for v in false_values or []]
+        for token, value in extras:
+            if any(token == other and value != other_value for other, other_value in extras):
+                raise UnexpectedParsingException("Provided value - '{}' can not be both true and false.".format(token))
+            tokens[token] = value
+        self.add_func(Step('boolean_cast', tokens=tokens))
+
+    def _boolean_table(self, tokens: typing.Dict[str, bool]) -> typing.Tuple[typing.Dict, typing.Callable, typing.Callable]:
+        """
+        Lookup table of the boolean tokens, along with the usual spellings of each (lower, upper and capitalized case),
+        and the matchers of the truthy and the falsy patterns, each combined into one pattern.
+        """
+        table = {}
+        for token, value in tokens.items():
+            table.update({token: value, token.upper(): value, token.capitalize(): value})
+        truthy = re.compile('|'.join('(?:{})'.format(p) for p in self.TRUTHY_PATTERNS)).match
+        falsy = re.compile('|'.join('(?:{})'.format(p) for p in self.FALSY_PATTERNS)).match
+        return table, truthy, falsy
+
+    def _build_boolean_cast(self, tokens: typing.Dict[str, bool]):
+        """
+        Build the closure of `boolean_cast` step.
+        :return: typing.Callable
+            Closure
+        """
+        table, truthy, falsy = self._boolean_table(tokens)
+
         def boolean_casting(data: any):
             """
-            Closure to cast the data to boolean
+            Closure to cast the data to boolean.
+            Values are looked up in the token table first, the truthy and falsy patterns are tried only on a miss.
             :param data: any
                 Column value
             :return: any
@@ -546,20 +913,21 @@ class BooleanParser(FieldParser):
             """
             try:
                 if data or data == 0:
-                    if type(data) == str and data.strip():
-                        if re.match(r'\b[Tt][Rr][Uu][Ee]\b', data.strip()) \
-                                or re.match(r'\b[TtyY]\b', data.strip()) \
-                                or re.match(r'\b[Yy][eE][sS]\b', data.strip()) \
-                                or re.match(r'\-?\d+(\.\d+)?', data.strip()):
-                            bool_data = True
-                        elif re.match(r'\b[fF][aA][lL][sS][Ee]\b', data.strip()) \
-                                or re.match(r'\b[FfnN]\b', data.strip()) \
-                                or re.match(r'\b[Nn][Oo]\b', data.strip()) \
-                                or re.match(r'0+(\.0+)?', data.strip()):
-                            bool_data = False
-                        else:
-                            raise BooleanParsingException("'{}' is not a valid value for boolean type column."\
-                                                          .format(data))
+                    if type(data) == str:
+                        bool_data = table.get(data)
+                        if bool_data is None:
+                            stripped = data.strip()
+                            if stripped:
+                                bool_data = table.get(stripped.lower())
+                                if bool_data is None:
+                                    if truthy(stripped):
+                                        bool_data = True
+                                    elif falsy(stripped):
+                                        bool_data = False
+                                    else:
+                                        raise BooleanParsingException(value=data)
+                            else:
+                                bool_data = bool(data)
                     else:
                         bool_data = bool(data)
                     if self.enforce_type:
@@ -574,7 +942,7 @@ class BooleanParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        self.add_func(boolean_casting)
+        return boolean_casting
 
 
 class DatetimeParser(FieldParser):
@@ -596,7 +964,9 @@ class DatetimeParser(FieldParser):
                  end: int = 0,
                  formats: typing.List = ['%Y%m%d', '%Y%m%d%H%M%S'],
                  quoted: int = 0,
-                 enforce_type: bool = True
+                 enforce_type: bool = True,
+                 adaptive: bool = False,
+                 lock_after: int = None
                  ):
         """
         Initiating DateTime Parser object with a little help of parents.
@@ -619,11 +989,78 @@ class DatetimeParser(FieldParser):
             If set to False, type conversion will not happen, whatever type vale was provided,
             will be returned.
             By default this parameter is set to True.
+        :param adaptive: bool
+            If set to `True`, the last successful format is tried first on the next value.
+            If a value fits several formats, the first tried wins, hence the result depends on the values parsed
+            before (by this parser object, across `parse` calls).
+            By default, `False`, i.e. formats are always tried in the provided order
+        :param lock_after: int
+            Number of consecutive values of the same format after which only that format is tried,
+            until a value does not fit it. `None` disables locking.
+            By default, `None`
         """
         self._formats = formats
+        self._resolver: FormatResolver = FormatResolver(formats, adaptive=adaptive, lock_after=lock_after)
+        self._parsed: typing.Tuple = (None, None)
         super().__init__(start=start, end=end, quoted=quoted, enforce_type=False)
         self.enforce_type: bool = enforce_type
 
+        self.add_func(Step('datetime_format'))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['_parsed'] = (None, None)
+        return state
+
+    def _parse_datetime(self, data: any) -> datetime.datetime:
+        """
+        Parse a column value using the declared formats.
+        The last parsed value is remembered (by identity), so the validators following each other in the chain
+        parse the same value only once.
+        :param data: any
+            Column value
+        :return: datetime.datetime
+            Parsed value
+        """
+        value, parsed = self._parsed
+        if value is data and value is not None:
+            return parsed
+        parsed = self._resolver.parse(data)
+        self._parsed = (data, parsed)
+        return parsed
+
+    def _sortable_format(self) -> typing.Optional[SortableFormat]:
+        """
+        Format the column values can be validated and compared in as strings: the only allowed format,
+        if it is sortable and the values are not converted to `datetime`.
+        :return: typing.Optional[SortableFormat]
+        """
+        if self.enforce_type or len(set(self._formats)) != 1:
+            return None
+        return sortable_format(self._formats[0])
+
+    def _sortable_string(self, sortable: typing.Optional[SortableFormat], data: any) -> bool:
+        """
+        Whether a column value is a valid string of the sortable format, hence can be checked as it is.
+        """
+        return sortable is not None and type(data) is str and sortable.valid(data)
+
+    def format_stats(self) -> typing.Dict[str, int]:
+        """
+        Number of values parsed by each of the allowed formats so far, in the provided order.
+        Values parsed by other processes (e.g. `parse(workers=...)`) are not counted.
+        :return: typing.Dict[str, int]
+        """
+        return self._resolver.stats()
+
+    def _build_datetime_format(self):
+        """
+        Build the closure of `datetime_format` step.
+        :return: typing.Callable
+            Closure
+        """
+        sortable = self._sortable_format()
+
         def format_checker(data: typing.Union[str, datetime.datetime]):
             """
             Closure to read and format date/datetime data. This closure validates the data format,
@@ -636,23 +1073,15 @@ class DatetimeParser(FieldParser):
             """
             if not data or type(data) == datetime.datetime:
                 return data
-            for f in self._formats:
-                try:
-                    if self.enforce_type:
-                        data = datetime.datetime.strptime(str(data), f)
-                        break
-                    else:
-                        datetime.datetime.strptime(str(data), f)
-                        break
-                except:
-                    pass
-            else:
-                raise DateTimeParsingException("Column data - '{}' is not in any of the following formats - {}."
-                                               .format(data, self._formats)
-                                               )
+            if self._sortable_string(sortable, data):
+                self._resolver.hits[sortable.format] += 1
+                return data
+            parsed = self._parse_datetime(data)
+            if self.enforce_type:
+                data = parsed
             return data
 
-        self.add_func(format_checker)
+        return format_checker
 
     def not_null(self,
                  default_value: typing.Union[str, datetime.datetime] = None,
@@ -670,9 +1099,9 @@ class DatetimeParser(FieldParser):
             if type(default_value) != datetime.datetime:
                 try:
                     if self.enforce_type:
-                        default_value = datetime.datetime.strptime(str(default_value), format)
+                        default_value = compile_format(format)(str(default_value))
                     else:
-                        datetime.datetime.strptime(str(default_value), format)
+                        compile_format(format)(str(default_value))
                 except Exception:
                     logging.error('\n')
                     logging.error('~' * 100)
@@ -683,6 +1112,14 @@ class DatetimeParser(FieldParser):
                                                      )
             self._formats += [format]
 
+        return self.add_func(Step('datetime_not_null', default_value=default_value))
+
+    def _build_datetime_not_null(self, default_value: typing.Union[str, datetime.datetime]):
+        """
+        Build the closure of `datetime_not_null` step.
+        :return: typing.Callable
+            Closure
+        """
         def null_check(data: any):
             """
             Null Check closure.
@@ -706,7 +1143,7 @@ class DatetimeParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(null_check)
+        return null_check
 
     def convert(self, format: str = '%Y%m%d%H%M%S'):
         """
@@ -718,6 +1155,14 @@ class DatetimeParser(FieldParser):
         """
         self._formats += [format]
 
+        return self.add_func(Step('datetime_convert', format=format))
+
+    def _build_datetime_convert(self, format: str):
+        """
+        Build the closure of `datetime_convert` step.
+        :return: typing.Callable
+            Closure
+        """
         def str_from_date(data: any):
             """
             Format conversion closure.
@@ -730,27 +1175,17 @@ class DatetimeParser(FieldParser):
                 if not data:
                     return data
                 if type(data) != datetime.datetime:
-                    for f in self._formats:
-                        try:
-                            data = datetime.datetime.strptime(str(data), f)
-                            break
-                        except:
-                            pass
-                    else:
-                        raise DateTimeParsingException("Column data - '{}' is not in any of the following formats - {}."
-                                                       .format(data, self._formats)
-                                                       )
-                return datetime.datetime.strftime(data, format)
+                    data = self._parse_datetime(data)
+                return format_datetime(data, format)
             except Exception as e:
                 logging.error('\n')
                 logging.error('~' * 100)
                 logging.exception("Date format conversion exception:")
                 logging.error('~' * 100)
-                DateTimeParsingException("It was not possible to convert column data - '{}' to '{}' format."
-                                         .format(data, format)
-                                         )
+                DateTimeParsingException(value=data, bound=format,
+                                         template="It was not possible to convert column data - '{}' to '{}' format.")
 
-        return self.add_func(str_from_date)
+        return str_from_date
 
     def max_value(self,
                   value: typing.Union[str, datetime.datetime],
@@ -766,7 +1201,7 @@ class DatetimeParser(FieldParser):
         """
         if type(value) != datetime.datetime:
             try:
-                max_val = datetime.datetime.strptime(str(value), format)
+                max_val = compile_format(format)(str(value))
             except Exception:
                 logging.error('~' * 100)
                 logging.exception("Max value check exception:")
@@ -777,6 +1212,19 @@ class DatetimeParser(FieldParser):
         else:
             max_val = value
 
+        return self.add_func(Step('datetime_max_value', max_val=max_val, value=value))
+
+    def _build_datetime_max_value(self,
+                                  max_val: datetime.datetime,
+                                  value: typing.Union[str, datetime.datetime]):
+        """
+        Build the closure of `datetime_max_value` step.
+        :return: typing.Callable
+            Closure
+        """
+        sortable = self._sortable_format()
+        bound = sortable.render(max_val) if sortable is not None else None
+
         def valid_value_check(data: str):
             """
             Maximum value check closure.
@@ -788,23 +1236,16 @@ class DatetimeParser(FieldParser):
             try:
                 if not data:
                     return data
-                if type(data) != datetime.datetime:
-                    for f in self._formats:
-                        try:
-                            pd = datetime.datetime.strptime(str(data), f)
-                            break
-                        except Exception:
-                            pass
-                    else:
-                        raise DateTimeParsingException("Column data - '{}' is not in any of the following formats - {}."
-                                                       .format(data, self._formats)
-                                                       )
+                if bound is not None and self._sortable_string(sortable, data):
+                    pd, limit = data, bound
+                elif type(data) != datetime.datetime:
+                    pd, limit = self._parse_datetime(data), max_val
                 else:
-                    pd = data
+                    pd, limit = data, max_val
 
-                if pd > max_val:
+                if pd > limit:
                     raise MaximumValueConstraintException(
-                        "Column value - '{}' is higher than maximum allowed value - {}.".format(data, value)
+                        value=data, bound=value, template="Column value - '{}' is higher than maximum allowed value - {}."
                     )
                 return data
             except Exception as e:
@@ -813,7 +1254,7 @@ class DatetimeParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
 
     def min_value(self,
                   value: typing.Union[str, datetime.datetime],
@@ -829,7 +1270,7 @@ class DatetimeParser(FieldParser):
         """
         if type(value) != datetime.datetime:
             try:
-                min_val = datetime.datetime.strptime(str(value), format)
+                min_val = compile_format(format)(str(value))
             except Exception:
                 logging.error('~' * 100)
                 logging.exception("Min value check exception:")
@@ -840,6 +1281,19 @@ class DatetimeParser(FieldParser):
         else:
             min_val = value
 
+        return self.add_func(Step('datetime_min_value', min_val=min_val, value=value))
+
+    def _build_datetime_min_value(self,
+                                  min_val: datetime.datetime,
+                                  value: typing.Union[str, datetime.datetime]):
+        """
+        Build the closure of `datetime_min_value` step.
+        :return: typing.Callable
+            Closure
+        """
+        sortable = self._sortable_format()
+        bound = sortable.render(min_val) if sortable is not None else None
+
         def valid_value_check(data: str):
             """
             Minimum value check closure.
@@ -851,23 +1305,16 @@ class DatetimeParser(FieldParser):
             try:
                 if not data:
                     return data
-                if type(data) != datetime.datetime:
-                    for f in self._formats:
-                        try:
-                            pd = datetime.datetime.strptime(str(data), f)
-                            break
-                        except Exception:
-                            pass
-                    else:
-                        raise DateTimeParsingException("Column data - '{}' is not in any of the following formats - {}."
-                                                       .format(data, self._formats)
-                                                       )
+                if bound is not None and self._sortable_string(sortable, data):
+                    pd, limit = data, bound
+                elif type(data) != datetime.datetime:
+                    pd, limit = self._parse_datetime(data), min_val
                 else:
-                    pd = data
+                    pd, limit = data, min_val
 
-                if pd < min_val:
+                if pd < limit:
                     raise MinimumValueConstraintException(
-                        "Column value - '{}' is lower than minimum allowed value - {}.".format(data, value)
+                        value=data, bound=value, template="Column value - '{}' is lower than minimum allowed value - {}."
                     )
                 return data
             except Exception as e:
@@ -876,7 +1323,7 @@ class DatetimeParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
 
     def range(self,
               lower_bound: typing.Union[str, datetime.datetime],
@@ -921,7 +1368,7 @@ class DatetimeParser(FieldParser):
             for value in values:
                 if type(value) != datetime.datetime:
                     try:
-                        valid_values.append(datetime.datetime.strptime(str(value), format))
+                        valid_values.append(compile_format(format)(str(value)))
                     except Exception:
                         logging.error('~' * 100)
                         logging.exception("Value set check exception:")
@@ -932,8 +1379,17 @@ class DatetimeParser(FieldParser):
                 else:
                     valid_values.append(value)
 
-        if nullable:
-            values.extend(['', None])
+        return self.add_func(Step('datetime_value_set', valid_values=ValueSet(valid_values)))
+
+    def _build_datetime_value_set(self, valid_values: ValueSet):
+        """
+        Build the closure of `datetime_value_set` step.
+        :return: typing.Callable
+            Closure
+        """
+        sortable = self._sortable_format()
+        members = valid_values.members
+        strings = frozenset(sortable.render(v) for v in members) if sortable is not None else None
 
         def valid_value_check(data: any):
             """
@@ -946,22 +1402,14 @@ class DatetimeParser(FieldParser):
             try:
                 if not data:
                     return data
-                if type(data) != datetime.datetime:
-                    for f in self._formats:
-                        try:
-                            pd = datetime.datetime.strptime(str(data), f)
-                            break
-                        except:
-                            pass
-                    else:
-                        raise DateTimeParsingException("Column data - '{}' is not in any of the following formats - {}."
-                                                       .format(data, self._formats)
-                                                       )
+                if self._sortable_string(sortable, data):
+                    pd, valid = data, strings
+                elif type(data) != datetime.datetime:
+                    pd, valid = self._parse_datetime(data), members
                 else:
-                    pd = data
-                if pd not in valid_values:
-                    raise ValidValueCheckException(
-                        "Provided value - '{}' is not part of valid value list - {}.".format(data, values))
+                    pd, valid = data, members
+                if pd not in valid:
+                    raise ValidValueCheckException(value=data, bound=valid_values)
                 else:
                     return data
             except Exception as e:
@@ -970,7 +1418,7 @@ class DatetimeParser(FieldParser):
                 logging.error('~' * 100)
                 raise e
 
-        return self.add_func(valid_value_check)
+        return valid_value_check
 
 
 class ConstantParser(FieldParser):
@@ -985,7 +1433,15 @@ class ConstantParser(FieldParser):
             It will always return the same value.
         """
         super().__init__()
-        self.add_func(lambda x: value)
+        self.add_func(Step('constant', value=value))
+
+    def _build_constant(self, value: str):
+        """
+        Build the closure of `constant` step.
+        :return: typing.Callable
+            Closure
+        """
+        return lambda x: value
 
 
 class Parser:
@@ -1000,7 +1456,11 @@ class Parser:
                  input_row_sep: str = "|",
                  parsed_row_format: str = "delimited",
                  parsed_row_sep: str = None,
-                 stop_on_error: int = 0):
+                 stop_on_error: int = 0,
+                 plan_cache: PlanCache = None,
+                 input_encoding: str = None,
+                 reject_sink: RejectSink = None,
+                 summary_top_k: int = 10):
         """
         :param input_row_format: str
             Format of the input data stream, simple delimited/fixed-width line or json/dict
@@ -1020,6 +1480,23 @@ class Parser:
             and return only valid rows,
             When `stop_on_error` value is set to `any specific positive number`, the process will allow those many
             erroneous rows, if erroneous rows exceeds that number, the process will fail..
+        :param plan_cache: PlanCache
+            Registry of compiled row functions, keyed by the structural fingerprint of the schema.
+            If not provided, the process-wide registry `parseval.cache.PLAN_CACHE` is used.
+        :param input_encoding: str
+            If provided, input rows are taken as bytes in this encoding. For ASCII compatible encodings
+            (e.g. utf-8, latin-1) delimited rows are split and fixed-width columns are sliced without decoding
+            the row (fixed-width positions are byte positions), integer and float columns are casted straight
+            from bytes and only the other columns are decoded. Rows of other encodings are decoded as a whole.
+            json rows are decoded before loading them.
+            By default, `None`, i.e. input rows are strings.
+        :param reject_sink: RejectSink
+            If provided, the rows skipped as per `stop_on_error` are handed over to this sink
+            (see `parseval.sinks`) instead of being logged.
+            By default, `None`
+        :param summary_top_k: int
+            Number of most frequent offending values kept per column and rule in the error summary (`summary`).
+            By default, `10`
         """
         if input_row_format not in ["delimited", "fixed-width", "json"]:
             raise Exception("Only list of lines and list of jsons are supported a input.")
@@ -1054,174 +1531,695 @@ class Parser:
                 "Only `json` formatted input can be converted to `jaon` formatted output."
             )
         self.stop_on_error = stop_on_error
-        self._parser_funcs: typing.Dict = {}
+        self.plan_cache: PlanCache = plan_cache if plan_cache is not None else PLAN_CACHE
+        self.input_encoding: str = input_encoding
+        self.reject_sink: RejectSink = reject_sink
+        self.summary_top_k: int = summary_top_k
+        self.summary: ErrorSummary = None
+        self._row_func: typing.Callable = None
+        self._plans: typing.Dict[typing.Tuple, typing.Callable] = {}
+        self._plans_key: typing.Tuple = None
+
+    def __getstate__(self):
+        # The compiled row function can not be pickled, the receiving side compiles the schema again.
+        # Rejects are handed over to the sink by the parent process only.
+        state = self.__dict__.copy()
+        state['_row_func'] = None
+        state['_plans'] = {}
+        state['_plans_key'] = None
+        state['reject_sink'] = None
+        state['summary'] = None
+        return state
 
     def _build(self):
         """
         To build/compile the schema, this API is used. A schema can be used for parsing only after it is built
-        Builds the list of parsable functions.
+        Compiles the schema into a single row function, specialized for the input and output formats.
+        Already compiled row functions of structurally identical schemas are taken from the plan cache.
 
         :return: bool
             True
         """
-        for k, v in self.schema:
-            self._parser_funcs[k] = v.build()
+        self._row_func = self._raw_row_func(self.input_encoding)
         return True
 
-    def parse(self, data: typing.Union[typing.List[typing.Union[str, typing.Dict]], typing.TextIO]):
+    def _plan(self, encoding: str, mode: str = None) -> typing.Callable:
         """
-        :param data: typing.List[typing.Union[str, typing.Dict, typing.IO]]
-            Takes input data as list of string or list of json
-        :return(yield): typing.Union[str, typing.Dict]
-            Yields parsed line one be one
+        Row function of the given mode (`None`, 'status' or 'check', see `compile_row`) for the given encoding,
+        bound to the state of this parser. Row functions are taken from the plan cache once and kept by the parser,
+        until the parser or a field parser changes (see `parseval.cache.touch`), so a repeated parsing neither
+        fingerprints the schema nor looks up the plan cache again.
+        """
+        key = (generation(), self.input_row_format, self.input_row_sep, self.parsed_row_format,
+               getattr(self, 'parsed_row_sep', None), id(self.schema), len(self.schema), id(self.plan_cache))
+        if key != self._plans_key:
+            self._plans, self._plans_key = {}, key
+        plan = self._plans.get((encoding, mode))
+        if plan is None:
+            fp = fingerprint(self, encoding)
+            plan = self.plan_cache.get(fp if mode is None else (fp, mode),
+                                       lambda: compile_row(self, encoding, warn_layout=mode is None,
+                                                           status=mode == 'status', check=mode == 'check'))
+            plan = self._plans[(encoding, mode)] = bind_state(plan, self)
+        return plan
+
+    def _raw_row_func(self, encoding: str = None) -> typing.Callable:
+        """
+        Row function taking raw (bytes-like) rows of the given encoding, or strings without encoding.
+        See `compile_row`.
+        """
+        return self._plan(encoding)
+
+    def _status_row_func(self, encoding: str = None) -> typing.Callable:
+        """
+        Row function returning the parsed row along with the row status instead of raising.
+        See `compile_row`.
+        """
+        return self._plan(encoding, 'status')
+
+    def _check_row_func(self, encoding: str = None) -> typing.Callable:
+        """
+        Row function returning only the row status, without assembling the parsed row.
+        See `compile_row`.
+        """
+        return self._plan(encoding, 'check')
+
+    def _prepare(self):
+        """
+        Build the schema, reporting any failure as `SchemaBuildException`.
         """
         try:
             self._build()
-        except Exception:
+        except Exception as e:
             logging.error('~' * 100)
             logging.exception("Parser function builder exception:")
             logging.error('~' * 100)
+            if isinstance(e, SchemaBuildException):
+                raise e
             raise SchemaBuildException()
-        if self.input_row_format == "delimited":
-            line_number = 0
-            errornous_line_count = 0
-            for d in data:
-                try:
-                    dlist: typing.List = d.split(self.input_row_sep)
-                    if len(dlist) > len(self.schema):
-                        raise UnexpectedParsingException(
-                            "Number of columns in line - {} is higher that number of declared columns in schema.".format(
-                                line_number + 1
-                            )
+
+    def format_stats(self) -> typing.Dict[str, typing.Dict[str, int]]:
+        """
+        Format mix of the date/datetime columns: number of values parsed by each allowed format so far.
+        Values parsed by worker processes are not counted.
+        :return: typing.Dict[str, typing.Dict[str, int]]
+            Format counters by column name
+        """
+        return {name: field_parser.format_stats() for name, field_parser in self.schema
+                if isinstance(field_parser, DatetimeParser)}
+
+    def parse(self,
+              data: typing.Union[typing.List[typing.Union[str, typing.Dict]], typing.TextIO],
+              workers: int = None,
+              chunk_size: int = 1000):
+        """
+        :param data: typing.List[typing.Union[str, typing.Dict, typing.IO]]
+            Takes input data as list of string or list of json
+        :param workers: int
+            Number of worker processes to validate the data with. The input is read in chunks of `chunk_size` rows,
+            chunks are validated in a process pool and the parsed rows are yielded in the original order.
+            `stop_on_error` is applied across all the chunks and line numbers are global, exactly like
+            single process parsing. The parser (custom functions included) must be picklable.
+            By default, `None`, i.e. the data is parsed in the current process.
+        :param chunk_size: int
+            Number of rows sent to a worker process at once. Has no effect without `workers`.
+            By default, 1000
+        :return(yield): typing.Union[str, typing.Dict]
+            Yields parsed line one be one. The failures are aggregated into `summary`, an `ErrorSummary`
+            (see `parseval.summary`) of failure counts by column and rule along with the most frequent offending values.
+        """
+        self._prepare()
+        if workers and workers > 1:
+            yield from self._collect(self._parse_in_pool(data, workers, chunk_size))
+        else:
+            yield from self._collect(self._parse_rows(data, encoding=self.input_encoding))
+
+    def parse_with_status(self, data: typing.Iterable[typing.Union[str, typing.Dict]]):
+        """
+        Parse the data without raising (or logging) validation exceptions for the failed rows:
+        every row comes with its status, a bitmask of the failed rules of every column (see `parseval.status`).
+        Unlike `parse`, all the columns of a failed row are validated. The exception of a failed row is raised
+        only when it breaks the `stop_on_error` condition. Every failed rule of the other failed rows is handed over
+        to the reject sink, if any, and counted in the error summary (`summary`), which does not keep the offending
+        values here.
+        :param data: typing.Iterable[typing.Union[str, typing.Dict]]
+            Takes input data as list of string or list of json
+        :return(yield): typing.Tuple[typing.Union[str, typing.Dict], int]
+            Yields (parsed row, status) for every row, the parsed row is `None` if the status is not `0`.
+        """
+        self._prepare()
+        row_func = self._status_row_func(self.input_encoding)
+        json_input = self.input_row_format == "json"
+        json_output = self.parsed_row_format == "json"
+        json_allowed = None
+        text_types = (str, bytes, bytearray, memoryview) if self.input_encoding is not None else (str,)
+        errornous_line_count = 0
+        sink = self.reject_sink
+        summary = self.summary = ErrorSummary(self.summary_top_k)
+        names = [name for name, _ in self.schema] + [None]
+        line_number = -1
+        try:
+            for line_number, d in enumerate(data):
+                json_text = json_input and type(d) in text_types
+                error = None
+                if json_text:
+                    json_allowed = True
+                    try:
+                        d = json.loads(d if type(d) is str else str(d, self.input_encoding))
+                    except Exception as e:
+                        error = e
+                if error is None:
+                    parsed, status = row_func(d, line_number)
+                else:
+                    parsed, status = None, failure_bit(len(self.schema), FORMAT_ERROR)
+                if status:
+                    summary.add_row()
+                    for column, code in failures(status):
+                        summary.add(names[column], RULES[code])
+                    if not (self.stop_on_error < 0 or errornous_line_count < self.stop_on_error):
+                        raise error or self._row_exception(d, line_number)
+                    errornous_line_count += 1
+                    if sink is not None:
+                        if type(d) in text_types[1:]:
+                            d = str(d, self.input_encoding, 'replace')
+                        for column, code in failures(status):
+                            sink.add(line_number, None, names[column], RULES[code], d)
+                elif json_output:
+                    if not json_allowed:
+                        raise UnexpectedSystemException(
+                            "`json` formatted output is not supported for `dict` formatted input."
                         )
-                    plist: typing.List = []
-                    pdict: typing.Dict = {}
-                    for i, col in enumerate(self.schema):
-                        try:
-                            pd = self._parser_funcs[col[0]](dlist[i])
-                        except:
-                            logging.error("<" * 50, end='')
-                            logging.error(">" * 50)
-                            logging.error('LINE NUMBER: {}'.format(
-                                line_number + 1
-                            ))
-                            logging.error('COLUMN NAME: {}'.format(
-                                col[0]
-                            ))
-                            logging.error("<" * 50, end='')
-                            logging.error(">" * 50)
-                            raise
-                        if self.parsed_row_format == "delimited":
-                            plist.append(pd)
-                        else:
-                            pdict[col[0]] = pd
-                    if self.parsed_row_format == "delimited":
-                        yield self.parsed_row_sep.join((str(e) for e in plist))
-                    else:
-                        yield pdict
-                    line_number += 1
-                except Exception as e:
-                    if self.stop_on_error < 0 or errornous_line_count < self.stop_on_error:
-                        logging.error(str(e))
-                        logging.error("DATA >>> ")
-                        logging.error(d)
-                        logging.error("CONTINUING TO PARSE DATA BECAUSE STOP_ON_ERROR CONDITION NOT MET YET!")
-                        errornous_line_count += 1
-                    else:
-                        raise e
-        elif self.input_row_format == "fixed-width":
-            line_number = 0
-            errornous_line_count = 0
-            for d in data:
-                try:
-                    plist: typing.List = []
-                    pdict: typing.Dict = {}
-                    for i, col in enumerate(self.schema):
-                        try:
-                            pd = self._parser_funcs[col[0]](d)
-                        except:
-                            logging.error("<" * 50, end='')
-                            logging.error(">" * 50)
-                            logging.error('LINE NUMBER: {}'.format(
-                                line_number + 1
-                            ))
-                            logging.error('COLUMN NAME: {}'.format(
-                                col[0]
-                            ))
-                            logging.error("<" * 50, end='')
-                            logging.error(">" * 50)
-                            raise
-                        if self.parsed_row_format == "delimited":
-                            plist.append(pd)
-                        if self.parsed_row_format == "fixed-width":
-                            pass
-                        else:
-                            pdict[col[0]] = pd
-                    if self.parsed_row_format == "delimited":
-                        yield self.parsed_row_sep.join((str(e) for e in plist))
-                    elif self.parsed_row_format == "fixed-width":
-                        yield d
+                    parsed = json.dumps(d)
+                yield parsed, status
+        finally:
+            summary.checked = line_number + 1
+            if sink is not None:
+                sink.flush()
+
+    def _row_exception(self, d: any, line_number: int, encoding: str = None) -> Exception:
+        """
+        Exception of a failed row, as raised by the row function.
+        :param encoding: str
+            Encoding of a raw row, by default `input_encoding` of the parser.
+        """
+        encoding = encoding or self.input_encoding
+        if encoding == self.input_encoding or self.input_row_format == "json":
+            row_func = self._row_func
+        else:
+            row_func = self._raw_row_func(encoding)
+        try:
+            row_func(d, line_number)
+        except Exception as e:
+            return e
+        return UnexpectedParsingException("Validation of line - {} failed.".format(line_number + 1))
+
+    def validate(self, data: typing.Iterable[typing.Union[str, typing.Dict]]) -> ErrorSummary:
+        """
+        Validate the data without parsing it: rows are only checked, no parsed row is assembled and values are
+        casted only if a validator needs the casted value (e.g. digit-only integers are checked as they are).
+        Like `parse_with_status`, all the columns of a failed row are validated and the exception of a failed row
+        is raised only when it breaks the `stop_on_error` condition. Every failed rule of the other failed rows
+        is handed over to the reject sink, if any.
+        :param data: typing.Iterable[typing.Union[str, typing.Dict]]
+            Takes input data as list of string or list of json
+        :return: ErrorSummary
+            Failure counts by column and rule (see `parseval.summary`), without the offending values.
+            Also available as `summary`.
+        """
+        self._prepare()
+        return self._check(data, self._check_row_func(self.input_encoding), self.input_encoding)
+
+    def validate_file(self, path: str, encoding: str = None) -> ErrorSummary:
+        """
+        Validate a file without parsing it, see `validate`. Lines are checked straight out of the memory mapped
+        file, like `parse_file` does. Rejects handed over to the reject sink carry the byte offset of the line.
+        :param path: str
+            Path of the input file
+        :param encoding: str
+            Encoding of the input file.
+            By default, `input_encoding` of the parser or 'utf-8'
+        :return: ErrorSummary
+            Failure counts by column and rule, also available as `summary`.
+        """
+        self._prepare()
+        encoding = encoding or self.input_encoding or 'utf-8'
+        offsets = self.reject_sink is not None
+        end = os.path.getsize(path)
+        if self.input_row_format == "json":
+            return self._check(read_lines(path, 0, end, encoding, offsets), self._check_row_func(self.input_encoding),
+                               encoding, offsets)
+        return self._check(map_lines(path, 0, end, offsets), self._check_row_func(encoding), encoding, offsets)
+
+    def _check(self,
+               data: typing.Iterable,
+               row_func: typing.Callable,
+               encoding: str = None,
+               offsets: bool = False) -> ErrorSummary:
+        """
+        Run a check-only row function on every row, aggregating the failures into the error summary.
+        :param encoding: str
+            If provided, rows may be raw (bytes-like) rows in this encoding.
+        :param offsets: bool
+            If set to `True`, rows are (byte offset, row) pairs.
+        :return: ErrorSummary
+            Summary of the failures
+        """
+        json_input = self.input_row_format == "json"
+        text_types = (str, bytes, bytearray, memoryview) if encoding is not None else (str,)
+        row_failure = failure_bit(len(self.schema), FORMAT_ERROR)
+        errornous_line_count = 0
+        sink = self.reject_sink
+        summary = self.summary = ErrorSummary(self.summary_top_k)
+        names = [name for name, _ in self.schema] + [None]
+        offset = None
+        line_number = -1
+        try:
+            for line_number, d in enumerate(data):
+                if offsets:
+                    offset, d = d
+                error = None
+                if json_input and type(d) in text_types:
+                    try:
+                        d = json.loads(d if type(d) is str else str(d, encoding))
+                    except Exception as e:
+                        error = e
+                status = row_func(d, line_number) if error is None else row_failure
+                if not status:
+                    continue
+                summary.add_row()
+                for column, code in failures(status):
+                    summary.add(names[column], RULES[code])
+                if not (self.stop_on_error < 0 or errornous_line_count < self.stop_on_error):
+                    raise error or self._row_exception(d, line_number, None if json_input else encoding)
+                errornous_line_count += 1
+                if sink is not None:
+                    if type(d) in text_types[1:]:
+                        d = str(d, encoding, 'replace')
+                    for column, code in failures(status):
+                        sink.add(line_number, offset, names[column], RULES[code], d)
+        finally:
+            summary.checked = line_number + 1
+            if sink is not None:
+                sink.flush()
+        return summary
+
+    def parse_file(self,
+                   path: str,
+                   workers: int = None,
+                   encoding: str = None,
+                   output_dir: str = None,
+                   chunk_bytes: int = 64 * 1024 * 1024) -> typing.Union[typing.Iterator, typing.List[str]]:
+        """
+        Parse a file, optionally sharded into byte ranges validated in a process pool.
+        Every worker opens the file and reads its own ranges, no data is piped through the current process.
+        Line terminators (`\n` or `\r\n`) are removed from the lines.
+        Delimited and fixed-width lines are read out of the memory mapped file without being copied. For ASCII
+        compatible encodings, delimited lines are split as bytes and fixed-width columns are sliced out of the bytes,
+        integer and float columns are casted straight from bytes and only the other columns are decoded (lines of
+        other encodings are decoded as a whole). Hence fixed-width positions are byte positions here, which is only
+        different for multibyte characters.
+        :param path: str
+            Path of the input file
+        :param workers: int
+            Number of worker processes. The file is split into ranges of about `chunk_bytes` bytes,
+            aligned to line boundaries. Line numbers are global and `stop_on_error` is applied across all
+            the ranges, exactly like single process parsing. The parser (custom functions included) must be picklable.
+            By default, `None`, i.e. the file is parsed in the current process.
+        :param encoding: str
+            Encoding of the input file.
+            By default, `input_encoding` of the parser or 'utf-8'
+        :param output_dir: str
+            If provided, parsed rows are written (one per line, `dict` rows as json) to one `part-xxxxx` file
+            per range in this directory instead of being returned. If parsing fails, the written files are
+            incomplete.
+            By default, `None`
+        :param chunk_bytes: int
+            Targeted size of a range in bytes.
+            By default, 64 MiB
+        :return: typing.Union[typing.Iterator, typing.List[str]]
+            Iterator of the parsed rows in the file order, or the paths of the written files if `output_dir` is provided
+        """
+        self._prepare()
+        encoding = encoding or self.input_encoding or 'utf-8'
+        parallel = bool(workers and workers > 1)
+        if parallel:
+            chunk_bytes = min(chunk_bytes, -(-os.path.getsize(path) // workers))
+            ranges = file_ranges(path, chunk_bytes)
+        else:
+            ranges = [(0, os.path.getsize(path))]
+        if output_dir is None:
+            if parallel:
+                return self._collect(self._parse_file_in_pool(path, ranges, workers, encoding, None))
+            return self._collect(self._read_and_parse_rows(path, 0, ranges[0][1], 0, encoding,
+                                                           offsets=self.reject_sink is not None))
+        os.makedirs(output_dir, exist_ok=True)
+        part_paths = [os.path.join(output_dir, 'part-{:05d}'.format(i)) for i in range(len(ranges))]
+        if parallel:
+            rows = self._parse_file_in_pool(path, ranges, workers, encoding, part_paths)
+        else:
+            rows = _unpack(_parse_range(self, path, 0, ranges[0][1], 0, encoding, part_paths[0], self.stop_on_error,
+                                        self.reject_sink is not None)[1], None, self.reject_sink is None)
+        for _ in self._collect(rows):
+            pass
+        return part_paths
+
+    def _collect(self, rows: typing.Iterable[typing.Tuple]):
+        """
+        Yield the parsed rows, applying the `stop_on_error` condition on the failed ones.
+        Skipped rows are handed over to the reject sink if any, logged otherwise.
+        Failures are aggregated into the error summary (`summary`).
+        :param rows: typing.Iterable[typing.Tuple]
+            Rows as produced by `_parse_rows`
+        :return(yield): typing.Union[str, typing.Dict]
+            Yields parsed line one be one
+        """
+        errornous_line_count = 0
+        json_output = self.parsed_row_format == "json"
+        json_allowed = None
+        sink = self.reject_sink
+        summary = self.summary = ErrorSummary(self.summary_top_k)
+        checked = 0
+        try:
+            for checked, (d, parsed, e, json_text, failure) in enumerate(rows, 1):
+                if json_text:
+                    json_allowed = True
+                elif json_output and e is None:
+                    if not json_allowed:
+                        raise UnexpectedSystemException(
+                            "`json` formatted output is not supported for `dict` formatted input."
+                        )
+                    parsed = json.dumps(d)
+                if e is None:
+                    yield parsed
+                    continue
+                if isinstance(e, UnexpectedSystemException):
+                    raise e
+                rule = RULES[error_code(e)]
+                summary.add_row()
+                summary.add(failure[2], rule, e.value if isinstance(e, ParsevalException) else None)
+                if self.stop_on_error < 0 or errornous_line_count < self.stop_on_error:
+                    if sink is not None:
+                        sink.add(*failure, rule, d)
                     else:
-                        yield pdict
-                    line_number += 1
-                except Exception as e:
-                    if self.stop_on_error < 0 or errornous_line_count < self.stop_on_error:
                         logging.error(str(e))
                         logging.error("DATA >>> ")
                         logging.error(d)
-                        errornous_line_count += 1
                         logging.error("CONTINUING TO PARSE DATA BECAUSE STOP_ON_ERROR CONDITION NOT MET YET!")
-                    else:
-                        raise e
+                    errornous_line_count += 1
+                else:
+                    raise e
+        finally:
+            summary.checked = checked
+            # Rows are abandoned on failure, closing them releases their source (e.g. shuts the process pool down).
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                close()
+            if sink is not None:
+                sink.flush()
+
+    def _read_and_parse_rows(self,
+                             path: str,
+                             start: int,
+                             end: int,
+                             line_number: int,
+                             encoding: str,
+                             report: typing.Callable = None,
+                             offsets: bool = False):
+        """
+        Parse the lines of a byte range of a file. Delimited and fixed-width lines are read out of the memory
+        mapped file and handed over to the row function undecoded, json lines are decoded.
+        :param offsets: bool
+            Whether to locate the failed rows by their byte offset as well.
+        :return(yield): typing.Tuple
+            Same as `_parse_rows`
+        """
+        if self.input_row_format == "json":
+            return self._parse_rows(read_lines(path, start, end, encoding, offsets), line_number, report,
+                                    offsets=offsets)
+        return self._parse_rows(map_lines(path, start, end, offsets), line_number, report, encoding, offsets)
+
+    def _parse_rows(self,
+                    data: typing.Iterable,
+                    line_number: int = 0,
+                    report: typing.Callable = None,
+                    encoding: str = None,
+                    offsets: bool = False):
+        """
+        Run the compiled row function on every row. Failures are not raised, they are handed over to the caller.
+        :param data: typing.Iterable
+            Input rows
+        :param line_number: int
+            Line number (0 based) of the first row.
+        :param report: typing.Callable
+            Receives the line number and the column name of a failing cell. By default, failing cells are logged,
+            unless the parser has a reject sink.
+        :param encoding: str
+            If provided, rows are raw (bytes-like) rows in this encoding. Failed rows are handed over decoded.
+        :param offsets: bool
+            If set to `True`, rows are (byte offset, row) pairs.
+        :return(yield): typing.Tuple
+            (row, parsed row, exception, whether the row was json text, failure) for each row. For json formatted
+            output only json text rows are serialized, serializing `dict` rows is left to the caller.
+            The failure of a failed row is its (line number, byte offset, failing column), `None` otherwise;
+            the byte offset is `None` without `offsets` and the column is `None` if the row itself failed.
+        """
+        if encoding == self.input_encoding or self.input_row_format == "json":
+            row_func = self._row_func
         else:
+            row_func = self._raw_row_func(encoding)
+        if report is None and self.reject_sink is None:
+            report = _report_cell_error
+        failed_columns = {}
+        row_func = rebind(row_func, report=failed_columns.__setitem__)
+        json_input = self.input_row_format == "json"
+        json_output = self.parsed_row_format == "json"
+        text_types = (str, bytes, bytearray, memoryview) if encoding is not None else (str,)
+        offset = None
+        for line_number, d in enumerate(data, line_number):
+            if offsets:
+                offset, d = d
+            json_text = json_input and type(d) in text_types
+            try:
+                if json_text:
+                    d = json.loads(d if type(d) is str else str(d, encoding))
+                parsed = row_func(d, line_number)
+                if json_output and json_text:
+                    parsed = json.dumps(d)
+            except Exception as e:
+                column = failed_columns.pop(line_number, None)
+                if column is not None:
+                    if isinstance(e, ParsevalException) and e.column is None:
+                        e.column = column
+                    if report is not None:
+                        report(line_number, column)
+                if encoding is not None and type(d) in text_types[1:]:
+                    d = str(d, encoding, 'replace')
+                yield d, None, e, json_text, (line_number, offset, column)
+                continue
+            yield d, parsed, None, json_text, None
+
+    def _parse_in_pool(self, data: typing.Iterable, workers: int, chunk_size: int):
+        """
+        Validate the rows in chunks in a process pool.
+        :return(yield): typing.Tuple
+            Same as `_parse_rows`, in the original order of the rows.
+        """
+        rows = iter(data)
+
+        def tasks():
             line_number = 0
-            errornous_line_count = 0
-            json_allowed = None
-            for d in data:
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    return
+                yield chunk, (_parse_chunk, chunk, line_number, self.stop_on_error)
+                line_number += len(chunk)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                    initargs=(self,)) as executor, \
+                contextlib.closing(_in_order(executor, tasks(), 2 * workers)) as results:
+            for chunk, result in results:
+                yield from _unpack(result, chunk, self.reject_sink is None)
+
+    def _parse_file_in_pool(self,
+                            path: str,
+                            ranges: typing.List[typing.Tuple[int, int]],
+                            workers: int,
+                            encoding: str,
+                            part_paths: typing.List[str]):
+        """
+        Validate the byte ranges of a file in a process pool.
+        Workers number the lines of their range from 0 and send back their number of lines, the rows are renumbered
+        here as the ranges come in file order.
+        :return(yield): typing.Tuple
+            Same as `_parse_rows`, in the file order. Only the failed rows, if the parsed rows are written to files.
+        """
+        tasks = ((None, (_parse_file_range, path, start, end, encoding, part_paths[i] if part_paths else None,
+                         self.stop_on_error, self.reject_sink is not None))
+                 for i, (start, end) in enumerate(ranges))
+        line_number = 0
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                                    initargs=(self,)) as executor, \
+                contextlib.closing(_in_order(executor, tasks, 2 * workers)) as results:
+            for _, (count, result) in results:
+                if line_number:
+                    result = _renumber(result, line_number, self._raw_row_func(None))
+                yield from _unpack(result, None, self.reject_sink is None)
+                line_number += count
+
+
+def _in_order(executor: concurrent.futures.Executor, tasks: typing.Iterator[typing.Tuple], limit: int):
+    """
+    Submit tasks to an executor, keeping at most `limit` of them in flight, and yield the results in task order.
+    :param tasks: typing.Iterator[typing.Tuple]
+        (context, (function, *arguments)) for every task
+    :return(yield): typing.Tuple
+        (context, result) for every task
+    """
+    pending = collections.deque()
+    try:
+        while True:
+            for context, (func, *args) in itertools.islice(tasks, limit - len(pending)):
+                pending.append((context, executor.submit(func, *args)))
+            if not pending:
+                return
+            context, future = pending.popleft()
+            yield context, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _unpack(result: typing.List[typing.Tuple], chunk: typing.List = None, report: bool = True):
+    """
+    Turn the rows returned by a worker into `_parse_rows` rows, reporting the failing cells in the current process
+    (unless `report` is `False`), so that the log follows the order of the rows. Rows which are not sent back are
+    taken from `chunk`.
+    """
+    for line_number, d, parsed, e, json_text, failure in result:
+        if e is None:
+            if chunk is not None:
+                d = chunk[line_number - result[0][0]]
+        elif report and failure[2] is not None:
+            _report_cell_error(line_number, failure[2])
+        yield d, parsed, e, json_text, failure
+
+
+def _renumber(result: typing.List[typing.Tuple],
+              line_number: int,
+              row_func: typing.Callable) -> typing.List[typing.Tuple]:
+    """
+    Shift the line numbers of the rows returned by a worker by `line_number`.
+    The message of a row level failure may hold its line number, the row is failed again by the (text) row function
+    `row_func` to get the exception of its actual line.
+    """
+    renumbered = []
+    for row_number, d, parsed, e, json_text, failure in result:
+        row_number += line_number
+        if e is not None:
+            if failure[2] is None and isinstance(e, ParsevalException):
                 try:
-                    if type(d) == str:
-                        json_allowed = True
-                        d = json.loads(d)
-                    if len(list(d.keys())) > len(self.schema):
-                        raise UnexpectedParsingException(
-                            "Number of columns in line - {} is higher that number of declared columns in schema.".format(
-                                line_number + 1
-                            )
-                        )
-                    pdict: typing.Dict = {}
-                    for col, _ in self.schema:
-                        if col in list(d.keys()):
-                            try:
-                                pdict[col] = self._parser_funcs[col](d[col])
-                            except Exception as e:
-                                logging.error("<" * 50, end='')
-                                logging.error(">" * 50)
-                                logging.error('LINE NUMBER: {}'.format(
-                                    line_number + 1
-                                ))
-                                logging.error('COLUMN NAME: {}'.format(
-                                    col
-                                ))
-                                logging.error("<" * 50, end='')
-                                logging.error(">" * 50)
-                                raise e
-                    if self.parsed_row_format == "json":
-                        if not json_allowed:
-                            raise UnexpectedSystemException(
-                                "`json` formatted output is not supported for `dict` formatted input."
-                            )
-                        yield json.dumps(d)
-                    else:
-                        yield pdict
-                    line_number += 1
-                except Exception as e:
-                    if isinstance(e, UnexpectedSystemException):
-                        raise e
-                    if self.stop_on_error < 0 or errornous_line_count < self.stop_on_error:
-                        logging.error(str(e))
-                        logging.error("DATA >>> ")
-                        logging.error(d)
-                        errornous_line_count += 1
-                        logging.error("CONTINUING TO PARSE DATA BECAUSE STOP_ON_ERROR CONDITION NOT MET YET!")
-                    else:
-                        raise e
+                    row_func(d, row_number)
+                except Exception as row_exception:
+                    e = row_exception
+            failure = (row_number,) + failure[1:]
+        renumbered.append((row_number, d, parsed, e, json_text, failure))
+    return renumbered
+
+
+_worker_parser: Parser = None
+
+
+def _init_worker(parser: Parser):
+    """
+    Process pool initializer, compiles the schema once per worker process.
+    """
+    global _worker_parser
+    _worker_parser = parser
+    _worker_parser._build()
+
+
+def _validate(parse_rows: typing.Callable, line_number: int, stop_on_error: int):
+    """
+    Validate the rows of a worker task. `parse_rows` takes the cell error reporter and returns `_parse_rows` rows.
+    Failed rows carry their failure, their exception is replaced by `UnexpectedParsingException`
+    with the same message if it can not be pickled. Validation stops as soon as the failures of the task alone
+    break the `stop_on_error` condition, the remaining rows can not change the outcome.
+    :return(yield): typing.Tuple
+        (line number, row, parsed row, exception, whether the row was json text, failure) for every row.
+        The row is sent back only if it failed (the parent logs it).
+    """
+    failed_rows = 0
+    rows = parse_rows(_ignore_cell_error)
+    for line_number, (d, parsed, e, json_text, failure) in enumerate(rows, line_number):
+        if e is not None:
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = UnexpectedParsingException(str(e))
+            yield line_number, d, None, e, json_text, failure
+            failed_rows += 1
+            if 0 <= stop_on_error < failed_rows:
+                return
+        else:
+            yield line_number, None, parsed, None, json_text, None
+
+
+def _ignore_cell_error(line_number: int, column: str):
+    pass
+
+
+def _parse_chunk(chunk: typing.List, line_number: int, stop_on_error: int) -> typing.List[typing.Tuple]:
+    """
+    Validate a chunk of rows in a worker process.
+    """
+    return list(_validate(functools.partial(_worker_parser._parse_rows, chunk, line_number,
+                                            encoding=_worker_parser.input_encoding),
+                          line_number, stop_on_error))
+
+
+def _parse_file_range(path: str,
+                      start: int,
+                      end: int,
+                      encoding: str,
+                      part_path: str,
+                      stop_on_error: int,
+                      offsets: bool = False) -> typing.Tuple[int, typing.List[typing.Tuple]]:
+    """
+    Validate a byte range of a file in a worker process, numbering its lines from 0.
+    """
+    return _parse_range(_worker_parser, path, start, end, 0, encoding, part_path, stop_on_error, offsets)
+
+
+def _parse_range(parser: Parser,
+                 path: str,
+                 start: int,
+                 end: int,
+                 line_number: int,
+                 encoding: str,
+                 part_path: str = None,
+                 stop_on_error: int = -1,
+                 offsets: bool = False) -> typing.Tuple[int, typing.List[typing.Tuple]]:
+    """
+    Validate a byte range of a file. If `part_path` is provided, parsed rows are written to that file
+    and only the failed rows are returned.
+    :return: typing.Tuple[int, typing.List[typing.Tuple]]
+        Number of validated lines (all the lines of the range, unless the `stop_on_error` condition was broken)
+        and the rows, see `_validate`
+    """
+    rows = _validate(functools.partial(parser._read_and_parse_rows, path, start, end, line_number, encoding,
+                                       offsets=offsets),
+                     line_number, stop_on_error)
+    if part_path is None:
+        rows = list(rows)
+        return len(rows), rows
+    count = 0
+    failed = []
+    dict_output = parser.parsed_row_format == "dict"
+    with open(part_path, 'w', encoding=encoding) as part:
+        for count, row in enumerate(rows, 1):
+            if row[3] is not None:
+                failed.append(row)
+            else:
+                part.write((json.dumps(row[2]) if dict_output else row[2]) + '\n')
+    return count, failed
@@ -0,0 +1,126 @@
+import mmap
+import os
+import typing
+
+_BLOCK_SIZE = 1 << 20
+
+
+def file_ranges(path: str, chunk_bytes: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Split a file into byte ranges of about `chunk_bytes` bytes, each range ending at a line boundary.
+    :param path: str
+        Path of the file
+    :param chunk_bytes: int
+        Targeted size of a range in bytes
+    :return: typing.List[typing.Tuple[int, int]]
+        (start, end) byte offsets of the ranges, in file order
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, 'rb') as f:
+        while start < size:
+            # Reading the rest of the line from the last byte of the range moves the end to the next line boundary.
+            f.seek(min(start + max(chunk_bytes, 1), size) - 1)
+            f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def count_lines(path: str, start: int, end: int) -> int:
+    """
+    Count the lines of a byte range, a last line without line terminator included.
+    """
+    count = 0
+    last = b'\n'
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            count += block.count(b'\n')
+            last = block[-1:]
+            remaining -= len(block)
+    return count + (last != b'\n')
+
+
+def read_lines(path: str, start: int, end: int, encoding: str = 'utf-8',
+               offsets: bool = False) -> typing.Iterator[typing.Union[str, typing.Tuple[int, str]]]:
+    """
+    Read the lines of a byte range, without their line terminator (`\\n` or `\\r\\n`).
+    :param path: str
+        Path of the file
+    :param start: int
+        Byte offset of the first line
+    :param end: int
+        Byte offset following the last line
+    :param encoding: str
+        Encoding of the file
+    :param offsets: bool
+        If set to `True`, lines are yielded along with their byte offset.
+    :return(yield): typing.Union[str, typing.Tuple[int, str]]
+        Yields decoded lines one by one, or (byte offset, line) pairs
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            offset = position
+            position += len(line)
+            if line.endswith(b'\r\n'):
+                line = line[:-2]
+            elif line.endswith(b'\n'):
+                line = line[:-1]
+            yield (offset, line.decode(encoding)) if offsets else line.decode(encoding)
+
+
+def map_lines(path: str, start: int = 0, end: int = None,
+              offsets: bool = False) -> typing.Iterator[typing.Union[memoryview, typing.Tuple[int, memoryview]]]:
+    """
+    Read the lines of a byte range out of the memory mapped file, without copying or decoding them.
+    Line terminators (`\n` or `\r\n`) are not part of the lines.
+    Lines are views on the mapping, a line which has to outlive the iteration must be copied (e.g. decoded).
+    :param path: str
+        Path of the file
+    :param start: int
+        Byte offset of the first line
+    :param end: int
+        Byte offset following the last line, by default the end of the file
+    :param offsets: bool
+        If set to `True`, lines are yielded along with their byte offset.
+    :return(yield): typing.Union[memoryview, typing.Tuple[int, memoryview]]
+        Yields lines one by one, as views on the mapped file, or (byte offset, line) pairs
+    """
+    if end is None:
+        end = os.path.getsize(path)
+    if start >= end:
+        return
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        position = start
+        while position < end:
+            line_end = mapped.find(b'\n', position, end)
+            if line_end < 0:
+                line_end = following = end
+            else:
+                following = line_end + 1
+                if line_end > position and mapped[line_end - 1] == 13:  # \r
+                    line_end -= 1
+            yield (position, view[position:line_end]) if offsets else view[position:line_end]
+            position = following
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # A line is still referenced by the caller, the mapping is closed once it is garbage collected.
+            pass
@@ -0,0 +1,170 @@
+import functools
+import hashlib
+import mmap
+import os
+import struct
+import typing
+
+try:
+    from parseval.reader import map_lines
+except ImportError:
+    from reader import map_lines
+
+_BLOOM_HEADER = struct.Struct('<4sI')  # magic, number of hash functions
+_BLOOM_MAGIC = b'PVBF'
+
+
+def _bloom_hashes(key: bytes, bits: int, count: int) -> typing.Iterator[int]:
+    """
+    Bit positions of a key in a Bloom filter, by double hashing of a stable (not per process salted) digest.
+    """
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], 'little')
+    h2 = int.from_bytes(digest[8:], 'little') | 1
+    for i in range(count):
+        yield (h1 + i * h2) % bits
+
+
+def _map(path: str) -> typing.Optional[mmap.mmap]:
+    if not os.path.getsize(path):
+        return None
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class ReferenceSet:
+    """
+    Set of reference keys (e.g. master data keys) kept on disk, for value checks against sets too large to be loaded
+    in every process.
+    Keys are read from a file of UTF-8 encoded keys, one per line (`\\n` separated), sorted by their bytes. The file
+    is memory mapped and binary searched, so that the keys are shared by all the processes through the page cache.
+    If a Bloom filter file (`<path>.bloom`, see `build_bloom`) exists, most of the unknown keys are rejected
+    before searching the file. Outcomes of the recent lookups are kept in a LRU cache of the process.
+    Values are looked up by their string representation, e.g. the integer `42` as key '42'.
+    """
+
+    def __init__(self, path: str, cache_size: int = 4096):
+        """
+        :param path: str
+            Path of the sorted key file
+        :param cache_size: int
+            Number of lookups cached by the process, `0` disables the cache. By default, `4096`
+        """
+        self.path: str = os.path.abspath(path)
+        self.cache_size: int = cache_size
+        self._keys: typing.Optional[mmap.mmap] = _map(self.path)
+        self._size: int = len(self._keys) if self._keys is not None else 0
+        self._bloom: typing.Optional[mmap.mmap] = None
+        self._bloom_bits: int = 0
+        self._bloom_hashes: int = 0
+        if os.path.exists(self.path + '.bloom'):
+            self._bloom = _map(self.path + '.bloom')
+            magic, self._bloom_hashes = _BLOOM_HEADER.unpack_from(self._bloom)
+            if magic != _BLOOM_MAGIC:
+                raise ValueError("'{}' is not a Bloom filter file.".format(self.path + '.bloom'))
+            self._bloom_bits = (len(self._bloom) - _BLOOM_HEADER.size) * 8
+        self._lookup: typing.Callable[[bytes], bool] = \
+            functools.lru_cache(maxsize=cache_size)(self._search) if cache_size else self._search
+
+    @classmethod
+    def build(cls, keys: typing.Iterable, path: str, bits_per_key: int = 10, cache_size: int = 4096) -> 'ReferenceSet':
+        """
+        Write the sorted key file (and its Bloom filter) of the keys.
+        :param keys: typing.Iterable
+            Keys, in any order, duplicates allowed. Keys are taken by their string representation.
+        :param path: str
+            Path of the key file to write
+        :param bits_per_key: int
+            Size of the Bloom filter in bits per key (about 1% false positives with 10), `0` skips the Bloom filter.
+            By default, `10`
+        :param cache_size: int
+            Number of lookups cached by the process. By default, `4096`
+        :return: ReferenceSet
+            Reference set of the written file
+        """
+        encoded = sorted({str(key).encode('utf-8') for key in keys})
+        if any(b'\n' in key for key in encoded):
+            raise ValueError("Reference keys can not contain line breaks.")
+        with open(path, 'wb') as f:
+            f.write(b'\n'.join(encoded))
+        if bits_per_key:
+            cls.build_bloom(path, bits_per_key)
+        elif os.path.exists(path + '.bloom'):
+            os.remove(path + '.bloom')
+        return cls(path, cache_size)
+
+    @staticmethod
+    def build_bloom(path: str, bits_per_key: int = 10):
+        """
+        Write the Bloom filter file (`<path>.bloom`) of an existing key file.
+        :param path: str
+            Path of the sorted key file
+        :param bits_per_key: int
+            Size of the filter in bits per key. By default, `10`
+        """
+        count = sum(1 for _ in map_lines(path))
+        size = max(count * bits_per_key // 8, 1)
+        bits = size * 8
+        hashes = max(round(bits_per_key * 0.69), 1)
+        bitmap = bytearray(size)
+        for key in map_lines(path):
+            for position in _bloom_hashes(key.tobytes(), bits, hashes):
+                bitmap[position >> 3] |= 1 << (position & 7)
+        with open(path + '.bloom', 'wb') as f:
+            f.write(_BLOOM_HEADER.pack(_BLOOM_MAGIC, hashes))
+            f.write(bitmap)
+
+    def _search(self, key: bytes) -> bool:
+        """
+        Look a key up: Bloom filter check, then binary search of the lines of the mapped key file.
+        """
+        if self._keys is None:
+            return False
+        bloom = self._bloom
+        if bloom is not None:
+            offset = _BLOOM_HEADER.size
+            for position in _bloom_hashes(key, self._bloom_bits, self._bloom_hashes):
+                if not bloom[offset + (position >> 3)] >> (position & 7) & 1:
+                    return False
+        keys = self._keys
+        low, high = 0, self._size  # Both are line starts (or the end of the file)
+        while low < high:
+            middle = (low + high) // 2
+            start = keys.rfind(b'\n', low, middle) + 1 or low
+            end = keys.find(b'\n', start, high)
+            if end < 0:
+                end = high
+            line = keys[start:end]
+            if line == key:
+                return True
+            if line < key:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+    def __contains__(self, value: any) -> bool:
+        if value is None:
+            return False
+        return self._lookup((value if type(value) == str else str(value)).encode('utf-8'))
+
+    def cache_info(self) -> typing.Optional[typing.NamedTuple]:
+        """
+        Statistics of the lookup cache of this process, `None` if the cache is disabled.
+        """
+        return self._lookup.cache_info() if self.cache_size else None
+
+    def __eq__(self, other: any) -> bool:
+        return type(other) == ReferenceSet and (self.path, self.cache_size) == (other.path, other.cache_size)
+
+    def __hash__(self) -> int:
+        return hash((self.path, self.cache_size))
+
+    def __getstate__(self):
+        return self.path, self.cache_size
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        return "<ReferenceSet '{}'>".format(self.path)
@@ -0,0 +1,164 @@
+import collections
+import json
+import random
+import typing
+
+# A rejected row: its (0 based) line number, byte offset in the input file (`None` if unknown), the failing column
+# (`None` for a failure of the row itself), the failed rule and the row.
+Reject = collections.namedtuple('Reject', ['line_number', 'offset', 'column', 'rule', 'row'])
+
+
+class RejectSink:
+    """
+    Receiver of the rows rejected by a `Parser`, see `Parser(reject_sink=...)`.
+    Rejects are buffered and handed over to `write` in bulk, at most `buffer_size` at once.
+    Memory stays bounded by `limit`: only the first `limit` rejects are kept, or, with `sample=True`,
+    a uniform random sample of `limit` rejects (reservoir sampling), which is handed over when the sink is flushed.
+    The parser flushes its sink at the end of every parsing, a sample is drawn out of the rejects of one parsing.
+    Subclasses implement `write`.
+    """
+
+    def __init__(self, limit: int = None, sample: bool = False, buffer_size: int = 1024, seed: int = None):
+        """
+        :param limit: int
+            Maximum number of rejects kept per parsing, by default all of them.
+        :param sample: bool
+            If set to `True`, a random sample of `limit` rejects is kept instead of the first ones.
+            By default, `False`
+        :param buffer_size: int
+            Number of rejects buffered before writing them. By default, `1024`
+        :param seed: int
+            Seed of the sampling, for reproducible samples.
+        """
+        if sample and not limit:
+            raise ValueError("Sampling needs the `limit` of the sample.")
+        self.limit: typing.Optional[int] = limit
+        self.sample: bool = sample
+        self.buffer_size: int = max(buffer_size, 1)
+        self.count: int = 0
+        self.dropped: int = 0
+        self._kept: int = 0
+        self._seen: int = 0
+        self._buffer: typing.List[Reject] = []
+        self._random: random.Random = random.Random(seed)
+
+    def add(self, line_number: int, offset: typing.Optional[int], column: typing.Optional[str], rule: str, row: any):
+        """
+        Receive a rejected row.
+        """
+        self.count += 1
+        self._seen += 1
+        if self.sample:
+            if len(self._buffer) < self.limit:
+                self._buffer.append(Reject(line_number, offset, column, rule, row))
+                return
+            self.dropped += 1
+            position = self._random.randrange(self._seen)
+            if position < self.limit:
+                self._buffer[position] = Reject(line_number, offset, column, rule, row)
+            return
+        if self.limit is not None and self._kept >= self.limit:
+            self.dropped += 1
+            return
+        self._kept += 1
+        self._buffer.append(Reject(line_number, offset, column, rule, row))
+        if len(self._buffer) >= self.buffer_size:
+            self._write()
+
+    def _write(self):
+        records, self._buffer = self._buffer, []
+        if records:
+            self.write(records)
+
+    def flush(self):
+        """
+        Write the buffered rejects (the sample, if sampling) and start over the `limit`.
+        """
+        self._write()
+        self._kept = self._seen = 0
+
+    def write(self, records: typing.List[Reject]):
+        """
+        Deliver rejects, implemented by the subclasses.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ListSink(RejectSink):
+    """
+    Keeps the rejects in memory, in `records`.
+    """
+
+    def __init__(self, limit: int = None, sample: bool = False, buffer_size: int = 1024, seed: int = None):
+        super().__init__(limit, sample, buffer_size, seed)
+        self.records: typing.List[Reject] = []
+
+    def write(self, records: typing.List[Reject]):
+        self.records.extend(records)
+
+
+class FileSink(RejectSink):
+    """
+    Writes the rejects to a file, one json object per line, e.g.
+    `{"line_number": 9, "offset": 412, "column": "ID", "rule": "max_value", "row": "11|A"}`.
+    Bytes rows are written decoded and other objects by their string representation.
+    """
+
+    def __init__(self,
+                 path: str,
+                 limit: int = None,
+                 sample: bool = False,
+                 buffer_size: int = 1024,
+                 seed: int = None,
+                 encoding: str = 'utf-8'):
+        """
+        :param path: str
+            Path of the file, truncated if it exists
+        :param encoding: str
+            Encoding of the file, and of the bytes rows. By default, `utf-8`
+        """
+        super().__init__(limit, sample, buffer_size, seed)
+        self.path: str = path
+        self.encoding: str = encoding
+        self._file: typing.TextIO = open(path, 'w', encoding=encoding)
+
+    def _default(self, value: any) -> str:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return str(value, self.encoding, 'replace')
+        return str(value)
+
+    def write(self, records: typing.List[Reject]):
+        self._file.writelines(json.dumps(record._asdict(), default=self._default) + '\n' for record in records)
+        self._file.flush()
+
+    def close(self):
+        super().close()
+        self._file.close()
+
+
+class CallbackSink(RejectSink):
+    """
+    Calls `callback(line_number, offset, column, rule, row)` for every reject, when the rejects are written.
+    """
+
+    def __init__(self,
+                 callback: typing.Callable,
+                 limit: int = None,
+                 sample: bool = False,
+                 buffer_size: int = 1024,
+                 seed: int = None):
+        super().__init__(limit, sample, buffer_size, seed)
+        self.callback: typing.Callable = callback
+
+    def write(self, records: typing.List[Reject]):
+        for record in records:
+            self.callback(*record)
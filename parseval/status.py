@@ -0,0 +1,92 @@
+import typing
+
+try:
+    from parseval.exceptions import (
+        UnexpectedParsingException,
+        NullValueInNotNullFieldException,
+        ValidValueCheckException,
+        MaximumValueConstraintException,
+        MinimumValueConstraintException,
+        RegexMatchException,
+        StringParsingException,
+        BooleanParsingException,
+        DateTimeParsingException
+    )
+except ImportError:
+    from exceptions import (
+        UnexpectedParsingException,
+        NullValueInNotNullFieldException,
+        ValidValueCheckException,
+        MaximumValueConstraintException,
+        MinimumValueConstraintException,
+        RegexMatchException,
+        StringParsingException,
+        BooleanParsingException,
+        DateTimeParsingException
+    )
+
+# Rule codes of a failed validation.
+VALID = 0
+FORMAT_ERROR = 1
+NULL_ERROR = 2
+MAX_VALUE_ERROR = 3
+MIN_VALUE_ERROR = 4
+VALUE_SET_ERROR = 5
+OTHER_ERROR = 6
+REGEX_ERROR = 7
+
+RULES: typing.Dict[int, str] = {
+    FORMAT_ERROR: 'format',
+    NULL_ERROR: 'not_null',
+    MAX_VALUE_ERROR: 'max_value',
+    MIN_VALUE_ERROR: 'min_value',
+    VALUE_SET_ERROR: 'value_set',
+    OTHER_ERROR: 'other',
+    REGEX_ERROR: 'regex',
+}
+
+# Number of status bits of a column, one per rule code.
+RULE_BITS = 8
+
+_ERROR_CODES = [
+    (NullValueInNotNullFieldException, NULL_ERROR),
+    (MaximumValueConstraintException, MAX_VALUE_ERROR),
+    (MinimumValueConstraintException, MIN_VALUE_ERROR),
+    (ValidValueCheckException, VALUE_SET_ERROR),
+    (RegexMatchException, REGEX_ERROR),
+    ((UnexpectedParsingException, StringParsingException, BooleanParsingException, DateTimeParsingException),
+     FORMAT_ERROR),
+]
+
+
+def error_code(exception: typing.Union[BaseException, type]) -> int:
+    """
+    Rule code of a validation exception (or exception class), `OTHER_ERROR` for any unknown exception.
+    """
+    kind = exception if isinstance(exception, type) else type(exception)
+    return next((code for exceptions, code in _ERROR_CODES if issubclass(kind, exceptions)), OTHER_ERROR)
+
+
+def failure_bit(column: int, code: int) -> int:
+    """
+    Status bit of a failed rule of a column (0 based column index).
+    """
+    return 1 << (column * RULE_BITS + code)
+
+
+def failures(status: int) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Decode a row status into the failed rules.
+    :param status: int
+        Row status, a bitmask of `failure_bit`s
+    :return: typing.List[typing.Tuple[int, int]]
+        (column index, rule code) of every failure, in column order
+    """
+    result = []
+    column = 0
+    while status:
+        bits = status & ((1 << RULE_BITS) - 1)
+        result.extend((column, code) for code in range(RULE_BITS) if bits >> code & 1)
+        status >>= RULE_BITS
+        column += 1
+    return result
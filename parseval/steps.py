@@ -0,0 +1,30 @@
+import typing
+
+
+class Step:
+    """
+    Declarative record of a built-in validation/conversion step.
+    A step is described only by its kind and parameters, it is turned into code (closure or compiled function)
+    by the parser owning it while building. Unlike closures, steps can be pickled and sent to other processes.
+    """
+    __slots__ = ('kind', 'params')
+
+    def __init__(self, kind: str, **params):
+        """
+        :param kind: str
+            Kind of the step, e.g. 'not_null', 'max_value' etc.
+        :param params:
+            Parameters of the step.
+        """
+        self.kind: str = kind
+        self.params: typing.Dict = params
+
+    def __reduce__(self):
+        return _restore, (self.kind, self.params)
+
+    def __repr__(self):
+        return "<Step({})>".format(', '.join([self.kind] + ['{}={!r}'.format(k, v) for k, v in self.params.items()]))
+
+
+def _restore(kind: str, params: typing.Dict) -> Step:
+    return Step(kind, **params)
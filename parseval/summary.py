@@ -0,0 +1,125 @@
+import collections
+import typing
+
+
+class TopK:
+    """
+    Approximate most frequent values of a stream, in bounded memory (space-saving sketch).
+    At most `capacity` values are tracked. A value which is not tracked replaces the least frequent tracked value
+    and inherits its count, which becomes the error bound of the new value. Any value occurring more than
+    `total / capacity` times is guaranteed to be tracked.
+    """
+
+    def __init__(self, capacity: int = 10):
+        """
+        :param capacity: int
+            Number of tracked values
+        """
+        self.capacity: int = max(capacity, 1)
+        self.total: int = 0
+        self._counts: typing.Dict[any, typing.List[int]] = {}
+
+    def add(self, value: any):
+        self.total += 1
+        counter = self._counts.get(value)
+        if counter is not None:
+            counter[0] += 1
+            return
+        if len(self._counts) < self.capacity:
+            self._counts[value] = [1, 0]
+            return
+        evicted = min(self._counts, key=lambda v: self._counts[v][0])
+        count = self._counts.pop(evicted)[0]
+        self._counts[value] = [count + 1, count]
+
+    def top(self, k: int = None) -> typing.List[typing.Tuple[any, int, int]]:
+        """
+        :param k: int
+            Number of values, by default all the tracked values.
+        :return: typing.List[typing.Tuple[any, int, int]]
+            (value, count, error) of the most frequent values, most frequent first. The actual count of a value
+            is between `count - error` and `count`.
+        """
+        ranked = sorted(self._counts.items(), key=lambda item: -item[1][0])
+        return [(value, count, error) for value, (count, error) in ranked[:k]]
+
+
+class ErrorSummary:
+    """
+    Aggregated validation failures of a parsing: number of failures by (column, rule) and the most frequent
+    offending values of each of them, along with the number of checked (`checked`) and failed (`rows`) rows.
+    Memory is bounded by the number of columns and rules, whatever the number of failures.
+    Row level failures (e.g. too many columns, invalid json) are counted under the column `None`.
+    """
+
+    def __init__(self, top_k: int = 10):
+        """
+        :param top_k: int
+            Number of offending values tracked per (column, rule). By default, `10`
+        """
+        self.top_k: int = top_k
+        self.checked: int = 0
+        self.rows: int = 0
+        self.counts: typing.Counter = collections.Counter()
+        self._values: typing.Dict[typing.Tuple, TopK] = {}
+
+    def add(self, column: typing.Optional[str], rule: str, value: any = None):
+        """
+        Record a failed rule, along with the offending value if known (`None` otherwise).
+        """
+        key = (column, rule)
+        self.counts[key] += 1
+        if value is None or column is None:
+            return
+        values = self._values.get(key)
+        if values is None:
+            values = self._values[key] = TopK(self.top_k)
+        try:
+            values.add(value)
+        except TypeError:
+            values.add(repr(value))
+
+    def add_row(self):
+        """
+        Record a failed row.
+        """
+        self.rows += 1
+
+    @property
+    def total(self) -> int:
+        """
+        Number of failed rules
+        """
+        return sum(self.counts.values())
+
+    def top(self, column: str, rule: str, k: int = None) -> typing.List[typing.Tuple[any, int, int]]:
+        """
+        Most frequent offending values of a column for a rule, see `TopK.top`.
+        """
+        values = self._values.get((column, rule))
+        return values.top(k) if values is not None else []
+
+    @property
+    def passed(self) -> int:
+        """
+        Number of valid rows
+        """
+        return self.checked - self.rows
+
+    def to_dict(self) -> typing.Dict:
+        """
+        :return: typing.Dict
+            {'checked': number of checked rows, 'rows': number of failed rows, 'failures': [{'column': ..., 'rule': ..., 'count': ...,
+            'top_values': [(value, count, error), ...]}, ...]}, most frequent failures first
+        """
+        return {
+            'checked': self.checked,
+            'rows': self.rows,
+            'failures': [{'column': column, 'rule': rule, 'count': count, 'top_values': self.top(column, rule)}
+                         for (column, rule), count in self.counts.most_common()]
+        }
+
+    def __repr__(self):
+        return '<ErrorSummary of {} failed row(s) out of {}: {}>'.format(
+            self.rows, self.checked, ', '.join('{}.{}={}'.format(column, rule, count)
+                                 for (column, rule), count in self.counts.most_common()))
@@ -0,0 +1,103 @@
+import bisect
+import typing
+
+_END = None  # Key marking the end of a code in a trie node
+_SHOWN = 5  # Number of members shown in the representation
+
+
+class ValueSet:
+    """
+    Immutable set of allowed values of a column.
+    Membership is checked against a `frozenset`, other lookups are served by optional indexes:
+        - `ordered=True` keeps the members sorted, to query them by range (see `between`).
+        - `prefix=True` accepts any string starting with one of the (string) members too, which suits hierarchical
+          codes (e.g. 'A01' allows 'A01', 'A01.1', 'A012' etc.). Prefixes are kept in a trie, pruned below every
+          member as longer members are covered by it anyway.
+    Empty string and `None` are members like any other value, but are never taken as prefix nor indexed.
+    """
+    __slots__ = ('members', 'prefix', 'ordered', '_sorted', '_trie')
+
+    def __init__(self, values: typing.Iterable, prefix: bool = False, ordered: bool = False):
+        """
+        :param values: typing.Iterable
+            Allowed values
+        :param prefix: bool
+            If set to `True`, strings starting with a (string) member are members too. By default, `False`
+        :param ordered: bool
+            If set to `True`, members are kept sorted to be queried by range. By default, `False`
+        """
+        self.members: typing.FrozenSet = frozenset(values)
+        self.prefix: bool = prefix
+        self.ordered: bool = ordered
+        self._sorted: typing.Tuple = tuple(sorted(v for v in self.members if v not in ('', None))) if ordered else ()
+        self._trie: typing.Dict = self._build_trie() if prefix else {}
+
+    def _build_trie(self) -> typing.Dict:
+        trie = {}
+        for code in sorted(v for v in self.members if type(v) == str and v):
+            node = trie
+            for char in code:
+                if _END in node:
+                    break
+                node = node.setdefault(char, {})
+            else:
+                node.clear()
+                node[_END] = True
+        return trie
+
+    def match_prefix(self, value: str) -> bool:
+        """
+        Check whether a member is a prefix of the value (the value itself included).
+        """
+        node = self._trie
+        for char in value:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
+
+    def between(self, lower: any = None, upper: any = None) -> typing.Tuple:
+        """
+        Members within the bounds, both bounds included, in ascending order.
+        Only available on ordered value sets.
+        :param lower: any
+            Lower bound, by default unbounded
+        :param upper: any
+            Upper bound, by default unbounded
+        :return: typing.Tuple
+            Members within the bounds
+        """
+        if not self.ordered:
+            raise ValueError("Range lookup needs an ordered value set.")
+        start = 0 if lower is None else bisect.bisect_left(self._sorted, lower)
+        end = len(self._sorted) if upper is None else bisect.bisect_right(self._sorted, upper)
+        return self._sorted[start:end]
+
+    def __contains__(self, value: any) -> bool:
+        return value in self.members or (self.prefix and type(value) == str and self.match_prefix(value))
+
+    def __iter__(self) -> typing.Iterator:
+        return iter(self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __eq__(self, other: any) -> bool:
+        return type(other) == ValueSet and (self.members, self.prefix, self.ordered) == \
+               (other.members, other.prefix, other.ordered)
+
+    def __hash__(self) -> int:
+        return hash((self.members, self.prefix, self.ordered))
+
+    def __getstate__(self):
+        return self.members, self.prefix, self.ordered
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __repr__(self):
+        shown = sorted(repr(v) for v in self.members if v not in ('', None))
+        sample = ', '.join(shown[:_SHOWN]) + (', ...' if len(shown) > _SHOWN else '')
+        return "<ValueSet of {} value(s){}: {}>".format(len(shown), ' (prefixes)' if self.prefix else '', sample)
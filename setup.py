@@ -18,6 +18,7 @@ setup(
     download_url='https://github.com/saumalya75/parseval/archive/v1.0.0.tar.gz',
     keywords=['python'],
     install_requires=[],
+    extras_require={'columnar': ['numpy']},
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
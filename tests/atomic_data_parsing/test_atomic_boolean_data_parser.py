@@ -38,3 +38,36 @@ def test_bad_input():
     func = BooleanParser().build()
     with pytest.raises(BooleanParsingException):
         assert func("anything else")
+
+
+# Token table tests
+@pytest.mark.parametrize("input_data, expected_output", [
+    (' yes ', True),
+    ('TRUE', True),
+    ('no', False),
+    ('0', True),
+    ('12abc', True),
+    ('yes please', True),
+    ('   ', True)
+])
+def test_token_table_keeps_pattern_semantics(input_data, expected_output):
+    func = BooleanParser().build()
+    assert func(input_data) == expected_output
+
+
+@pytest.mark.parametrize("input_data, expected_output", [
+    ('on', True),
+    (' OFF ', False),
+    ('0', False),
+    ('1', True),
+    ('yes', True)
+])
+def test_extra_tokens(input_data, expected_output):
+    func = BooleanParser(true_values=['on', '1'], false_values=['Off', '0']).build()
+    assert func(input_data) == expected_output
+
+
+def test_conflicting_extra_tokens():
+    from parseval.exceptions import UnexpectedParsingException
+    with pytest.raises(UnexpectedParsingException):
+        BooleanParser(true_values=['on'], false_values=['ON'])
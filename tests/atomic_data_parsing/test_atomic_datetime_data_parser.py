@@ -1,6 +1,7 @@
 import pytest
 import datetime
-from parseval.parser import DatetimeParser
+from parseval.parser import Parser, DatetimeParser
+from parseval.formats import compile_format
 from parseval.exceptions import (
     DateTimeParsingException,
     NullValueInNotNullFieldException,
@@ -168,3 +169,107 @@ def test_add_func_validator():
 def test_convert():
     func = DatetimeParser().convert('%Y|%m|%d').build()
     assert func("20200501") == "2020|05|01"
+
+
+# Format resolution tests
+def test_format_stats_and_adaptive_order():
+    parser = DatetimeParser(formats=['%Y%m%d', '%Y-%m-%d', '%d/%m/%Y'], adaptive=True)
+    func = parser.build()
+    for data in ['01/01/2020', '02/01/2020', '2020-01-03']:
+        func(data)
+    assert parser._resolver._order[0] == '%Y-%m-%d'
+    func('20200104')
+    assert parser.format_stats() == {'%Y%m%d': 1, '%Y-%m-%d': 1, '%d/%m/%Y': 2}
+    assert parser._resolver._order[0] == '%Y%m%d'
+
+
+def test_format_lock_and_fallback():
+    parser = DatetimeParser(formats=['%Y%m%d', '%Y-%m-%d'], lock_after=2)
+    func = parser.build(compiled=True)
+    func('2020-01-01')
+    func('2020-01-02')
+    assert parser._resolver.locked == '%Y-%m-%d'
+    assert func('20200103') == datetime.datetime(2020, 1, 3)
+    assert parser._resolver.locked is None
+    assert parser._resolver.fallbacks == 1
+    with pytest.raises(DateTimeParsingException):
+        func('2020/01/04')
+    assert parser.format_stats() == {'%Y%m%d': 1, '%Y-%m-%d': 2}
+
+
+def test_ambiguous_formats_are_deterministic():
+    p = Parser(schema=[('DT', DatetimeParser(formats=['%y%m', '%Y']).convert('%Y-%m'))])
+    first = list(p.parse(['2001', '1999', '2001']))
+    assert first == ['2020-01', '1999-01', '2020-01']
+    assert list(p.parse(['2001', '1999', '2001'])) == first
+    func = DatetimeParser(formats=['%y%m', '%Y']).convert('%Y-%m').build()
+    assert [func(data) for data in ['2001', '1999', '2001', '2001']] == ['2020-01', '1999-01', '2020-01', '2020-01']
+
+
+def test_declared_format_order():
+    parser = DatetimeParser(formats=['%d%m%Y', '%m%d%Y'], adaptive=False)
+    func = parser.build()
+    assert func('13012020') == datetime.datetime(2020, 1, 13)
+    assert func('01022020') == datetime.datetime(2020, 2, 1)
+
+
+@pytest.mark.parametrize("input_data,input_format", [
+    ('20200131', '%Y%m%d'),
+    ('2020131', '%Y%m%d'),
+    ('20200230', '%Y%m%d'),
+    ('20200101235959', '%Y%m%d%H%M%S'),
+    ('2020-01-01 10:20:30', '%Y-%m-%d %H:%M:%S'),
+    ('2020-01-01  10:20:30', '%Y-%m-%d %H:%M:%S'),
+    ('2020-1-1', '%Y-%m-%d'),
+    ('31/12/2020', '%d/%m/%Y'),
+    ('10:20', '%H:%M'),
+    ('２０２００１０１', '%Y%m%d'),
+    ('Jan 2020', '%b %Y'),
+])
+def test_compiled_format_matches_strptime(input_data, input_format):
+    try:
+        expected = datetime.datetime.strptime(input_data, input_format)
+    except ValueError:
+        with pytest.raises(ValueError):
+            compile_format(input_format)(input_data)
+    else:
+        assert compile_format(input_format)(input_data) == expected
+
+
+# Format token tests
+@pytest.mark.parametrize("input_data,input_format,expected", [
+    ('1577836800', 'epoch_s', datetime.datetime(2020, 1, 1)),
+    ('-86400', 'epoch_s', datetime.datetime(1969, 12, 31)),
+    ('1577836800.25', 'epoch_s', datetime.datetime(2020, 1, 1, 0, 0, 0, 250000)),
+    ('1577836800123', 'epoch_ms', datetime.datetime(2020, 1, 1, 0, 0, 0, 123000)),
+    ('2020-01-01T10:20:30', 'iso8601', datetime.datetime(2020, 1, 1, 10, 20, 30)),
+    ('2020-01-01T10:20:30Z', 'iso8601', datetime.datetime(2020, 1, 1, 10, 20, 30)),
+    ('2020-01-01T10:20:30.5+05:30', 'iso8601', datetime.datetime(2020, 1, 1, 4, 50, 30, 500000)),
+])
+@pytest.mark.parametrize("compiled", [False, True])
+def test_format_tokens(input_data, input_format, expected, compiled):
+    func = DatetimeParser(formats=[input_format]).build(compiled=compiled)
+    assert func(input_data) == expected
+
+
+@pytest.mark.parametrize("input_data,input_format", [
+    ('1577836800x', 'epoch_s'),
+    ('١٥٧٧٨٣٦٨٠٠', 'epoch_s'),
+    ('1e9', 'epoch_ms'),
+    ('2020-13-01T10:20:30', 'iso8601'),
+])
+def test_invalid_format_tokens(input_data, input_format):
+    func = DatetimeParser(formats=[input_format]).build()
+    with pytest.raises(DateTimeParsingException):
+        func(input_data)
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_format_token_checks_and_convert(compiled):
+    func = DatetimeParser(formats=['epoch_ms'], enforce_type=False)\
+        .range('2020-01-01T00:00:00Z', '2020-12-31T23:59:59Z', 'iso8601').convert('iso8601').build(compiled=compiled)
+    assert func('1577836800123') == '2020-01-01T00:00:00.123000'
+    with pytest.raises(MinimumValueConstraintException):
+        func('1577836799999')
+    func = DatetimeParser(formats=['%Y%m%d']).convert('epoch_s').build(compiled=compiled)
+    assert func('20200101') == '1577836800'
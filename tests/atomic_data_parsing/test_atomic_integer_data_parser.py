@@ -75,6 +75,30 @@ def test_value_set_validator():
         IntegerParser(quoted=0).value_set(["100", "200", "300"]).build()
 
 
+def test_ordered_value_set():
+    from parseval.valueset import ValueSet
+    codes = ValueSet(range(0, 1000, 10), ordered=True)
+    assert codes.between(95, 130) == (100, 110, 120, 130)
+    assert codes.between(upper=15) == (0, 10)
+    func = IntegerParser(quoted=0).value_set(codes).build()
+    assert func('990') == 990
+    assert func('') == ''
+    with pytest.raises(ValidValueCheckException):
+        func('995')
+    with pytest.raises(ValueError):
+        ValueSet([1, 2]).between(1, 2)
+
+
+def test_reference_set_validator(tmp_path):
+    from parseval.refset import ReferenceSet
+    ReferenceSet.build(range(100, 1000, 7), str(tmp_path / 'keys'))
+    func = IntegerParser(quoted=0).reference_set(str(tmp_path / 'keys')).build()
+    assert func('107') == 107
+    assert func('') == ''
+    with pytest.raises(ValidValueCheckException):
+        func('108')
+
+
 def test_max_value_validator():
     func = IntegerParser(quoted=0).max_value(100).build()
     assert func('90') == 90
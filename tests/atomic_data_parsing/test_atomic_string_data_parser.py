@@ -1,9 +1,11 @@
+import re
 import pytest
 from parseval.parser import StringParser
 from parseval.exceptions import (
     NullValueInNotNullFieldException,
     ValidValueCheckException,
-    RegexMatchException
+    RegexMatchException,
+    UnexpectedParsingException
 )
 
 
@@ -51,6 +53,60 @@ def test_value_set_validator():
         assert func('GRY')
 
 
+def test_value_set_message_is_bounded():
+    func = StringParser().value_set(['CODE{:05}'.format(i) for i in range(10000)]).build()
+    assert func('CODE09999') == 'CODE09999'
+    with pytest.raises(ValidValueCheckException) as e:
+        func('CODE10000')
+    assert 'CODE09999' not in str(e.value)
+    assert '10000 value(s)' in str(e.value)
+
+
+@pytest.mark.parametrize("input_data, valid", [
+    ('A01', True),
+    ('A01.9', True),
+    ('B2', True),
+    ('B20', True),
+    ('A0', False),
+    ('A02', False),
+    ('', True)
+])
+def test_prefix_value_set(input_data, valid):
+    func = StringParser().value_set(['A01', 'A011', 'B2'], prefix=True).build()
+    if valid:
+        assert func(input_data) == input_data
+    else:
+        with pytest.raises(ValidValueCheckException):
+            func(input_data)
+
+
+def test_reference_set_validator(tmp_path):
+    from parseval.refset import ReferenceSet
+    reference = ReferenceSet.build(['CUST{:06}'.format(i) for i in range(0, 20000, 2)] + ['ÄØ'], str(tmp_path / 'keys'))
+    assert 'CUST000000' in reference and 'CUST019998' in reference and 'ÄØ' in reference
+    assert 'CUST000001' not in reference and 'CUST' not in reference and 'ZZZ' not in reference
+    func = StringParser().reference_set(reference).build()
+    assert func('CUST001234') == 'CUST001234'
+    assert func('') == ''
+    with pytest.raises(ValidValueCheckException):
+        func('CUST001235')
+    compiled = StringParser().reference_set(str(tmp_path / 'keys'), nullable=False).build(compiled=True)
+    assert compiled('CUST000002') == 'CUST000002'
+    with pytest.raises(ValidValueCheckException):
+        compiled('')
+    with pytest.raises(UnexpectedParsingException):
+        StringParser().reference_set(str(tmp_path / 'missing'))
+
+
+def test_reference_set_without_bloom_filter(tmp_path):
+    import pickle
+    from parseval.refset import ReferenceSet
+    reference = ReferenceSet.build(['b', 'd', 'f'], str(tmp_path / 'keys'), bits_per_key=0, cache_size=0)
+    assert [v in reference for v in 'abcdefg'] == [False, True, False, True, False, True, False]
+    restored = pickle.loads(pickle.dumps(StringParser().reference_set(reference))).build()
+    assert restored('d') == 'd'
+
+
 def test_regex_match_validator():
     pattern = r'\w+_\d{4}-\d{2}-\d{2}'
     func = StringParser(quoted=0).regex_match(pattern=pattern).build()
@@ -59,6 +115,36 @@ def test_regex_match_validator():
         assert func('Trig2020-23-12')
 
 
+@pytest.mark.parametrize("compiled", [False, True])
+def test_regex_full_match_validator(compiled):
+    func = StringParser().regex_match(r'\d{4}', full_match=True).build(compiled=compiled)
+    assert func('2020') == '2020'
+    assert func('') == ''
+    with pytest.raises(RegexMatchException):
+        func('20201')
+
+
+def test_invalid_regex_is_reported_at_declaration():
+    with pytest.raises(UnexpectedParsingException):
+        StringParser().regex_match(r'(\d')
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_regex_any_validator(compiled):
+    parser = StringParser().regex_any({'order': r'ORD-\d+', 'invoice': r'INV/\d+', 'code': re.compile('[a-z]+', re.I)},
+                                      nullable=False, full_match=True)
+    func = parser.build(compiled=compiled)
+    assert func('ORD-12') == 'ORD-12'
+    assert func('INV/7') == 'INV/7'
+    assert func('AbC') == 'AbC'
+    assert func('ORD-1') == 'ORD-1'
+    with pytest.raises(RegexMatchException):
+        func('ORD-1x')
+    with pytest.raises(RegexMatchException):
+        func('')
+    assert parser.match_stats() == {'order': 2, 'invoice': 1, 'code': 1}
+
+
 def test_change_case_validator():
     func = StringParser(quoted=0).change_case(case_type='u').build()
     assert func('Manual_2020-23-12') == "MANUAL_2020-23-12"
@@ -0,0 +1,99 @@
+import pytest
+import datetime
+from parseval.parser import (
+    StringParser,
+    IntegerParser,
+    FloatParser,
+    BooleanParser,
+    DatetimeParser,
+    ConstantParser
+)
+
+
+def _parity_check(data):
+    if data and int(data) % 2 != 0:
+        raise Exception("The data has to be even!")
+    return data
+
+
+def _outcome(func, data):
+    try:
+        return 'value', func(data)
+    except Exception as e:
+        return type(e), str(e)
+
+
+PARSERS = [
+    lambda: StringParser(),
+    lambda: StringParser(quoted=1).not_null('NA'),
+    lambda: StringParser(quoted=2, enforce_type=False).not_null(allow_white_space=True),
+    lambda: StringParser(start=2, end=4).value_set(['BCD', 'XYZ']).change_case('L'),
+    lambda: StringParser().value_set(['A', 'BC'], prefix=True, nullable=False),
+    lambda: StringParser().regex_match(r'\w+_\d{4}', nullable=False).change_case('s'),
+    lambda: StringParser().regex_match(r'\w+_\d{4}').max_value('X').min_value('A'),
+    lambda: StringParser().regex_match(r'\d+', full_match=True),
+    lambda: StringParser().regex_any([r'\w+_\d{4}', r'\d+'], nullable=False),
+    lambda: IntegerParser().not_null(0).range(10, 100),
+    lambda: IntegerParser(enforce_type=False).value_set([10, 20], nullable=False),
+    lambda: IntegerParser(quoted=1).add_func(_parity_check).max_value(1000),
+    lambda: FloatParser(start=1, end=5).min_value(1.5).not_null(),
+    lambda: BooleanParser(),
+    lambda: BooleanParser(enforce_type=False),
+    lambda: BooleanParser(true_values=['on', '1'], false_values=['off', '0']),
+    lambda: DatetimeParser(),
+    lambda: DatetimeParser(formats=['%Y-%m-%d', '%Y%m%d'], enforce_type=False).range('20200101', '20201231', '%Y%m%d'),
+    lambda: DatetimeParser(formats=['%Y-%m-%d']).convert('%d/%m/%Y').not_null('01/01/1970', '%d/%m/%Y'),
+    lambda: DatetimeParser(formats=['%Y%m%d']).value_set(['20200101'], '%Y%m%d').max_value(datetime.datetime.now()),
+    lambda: DatetimeParser(formats=['%Y-%m-%d'], enforce_type=False).range('2020-01-01', '2020-12-31', '%Y-%m-%d')
+    .value_set(['2020-06-30', '2021-01-01'], '%Y-%m-%d'),
+    lambda: DatetimeParser(formats=['%Y%m%d'], enforce_type=False).min_value('20200101', '%Y%m%d')
+    .max_value(datetime.datetime(2020, 6, 30, 12)),
+    lambda: ConstantParser('CONSTANT'),
+]
+
+INPUTS = [None, '', '   ', '"ABC"', "'12'", 'ABCDE', 'Manual_2020', '15', '"15"', '150', '0', '12.5', '1.0',
+          'true', 'No', 'maybe', 0, 1, 2.5, True, '20200101', '2020-06-30', '2021-01-01', '20201301', 'x',
+          '20200630', '20200701', '2020-02-29', '2019-02-29', '2020-6-30', datetime.datetime(2020, 6, 30)]
+
+
+@pytest.mark.parametrize("parser_index", range(len(PARSERS)))
+def test_compiled_parser_matches_closure_chain(parser_index):
+    closure_func = PARSERS[parser_index]().build()
+    compiled_func = PARSERS[parser_index]().build(compiled=True)
+    for data in INPUTS:
+        assert _outcome(compiled_func, data) == _outcome(closure_func, data), data
+
+
+def test_compiled_parser_is_flat():
+    parser = IntegerParser(start=1, end=3, quoted=1).not_null(0).value_set([10, 20]).range(0, 100)
+    func = parser.build(compiled=True)
+    assert func('"20"') == 20
+    assert 'def pipeline(v' in func.source
+    assert not any(f in parser._funcs for f in func.__kwdefaults__.values())  # no closure is called back
+
+
+def test_datetime_value_parsed_once():
+    parser = DatetimeParser(formats=['%Y-%m-%d', '%Y%m%d'], enforce_type=False)\
+        .range('20200101', '20201231', '%Y%m%d').value_set(['20200630'], '%Y%m%d')
+    func = parser.build(compiled=True)
+    assert func('2020-06-30') == '2020-06-30'
+    assert func.source.count(' = _resolve') == 1
+
+
+def test_datetime_closure_chain_parses_once():
+    parser = DatetimeParser(formats=['%d/%m/%Y'], enforce_type=False).range('01/01/2020', '31/12/2020', '%d/%m/%Y')
+    func = parser.build()
+    data = '30/06/2020'
+    assert func(data) == data
+    assert parser._parsed[0] is data
+    assert parser._parse_datetime(data) is parser._parsed[1]
+
+
+def test_sortable_datetime_checked_as_string():
+    parser = DatetimeParser(formats=['%Y%m%d'], enforce_type=False).range('20200101', '20201231', '%Y%m%d')
+    func = parser.build(compiled=True)
+    assert func('20200630') == '20200630'
+    with pytest.raises(Exception):
+        func('20210101')
+    assert '20200101' in func.__kwdefaults__.values()  # the bound is compared as string
+    assert parser.format_stats() == {'%Y%m%d': 2}
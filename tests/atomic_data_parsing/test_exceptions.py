@@ -0,0 +1,66 @@
+import pickle
+import pytest
+from parseval.parser import Parser, IntegerParser, StringParser, DatetimeParser
+from parseval.exceptions import (
+    MaximumValueConstraintException,
+    ValidValueCheckException,
+    NullValueInNotNullFieldException,
+    UnexpectedParsingException
+)
+
+
+class _Bound:
+    def __init__(self):
+        self.rendered = 0
+
+    def __repr__(self):
+        self.rendered += 1
+        return '<bound>'
+
+
+def test_message_rendered_on_demand():
+    bound = _Bound()
+    e = ValidValueCheckException(value='X', bound=bound)
+    assert bound.rendered == 0
+    assert (e.value, e.bound, e.rule, e.column) == ('X', bound, 'value_set', None)
+    assert str(e) == "Provided value - 'X' is not part of valid value list - <bound>."
+    assert e.msg == str(e) and bound.rendered == 1
+    assert e.args == (str(e),) and bound.rendered == 1
+
+
+def test_messages():
+    assert str(NullValueInNotNullFieldException()) == "NULL value detected in Not NULL field."
+    assert str(UnexpectedParsingException("Custom message.")) == "Custom message."
+    assert UnexpectedParsingException("Custom message.").args == ("Custom message.",)
+    assert NullValueInNotNullFieldException().args == ("NULL value detected in Not NULL field.",)
+    assert repr(MaximumValueConstraintException(value=11, bound=10)) == \
+        "<MaximumValueConstraintException(Provided value - '11' is higher than maximum allowed value - 10.)>"
+
+
+@pytest.mark.parametrize("parser", [
+    lambda: IntegerParser().max_value(10).build(),
+    lambda: IntegerParser().max_value(10).build(compiled=True)
+])
+def test_validators_raise_structured_exceptions(parser):
+    with pytest.raises(MaximumValueConstraintException) as e:
+        parser()('11')
+    assert (e.value.value, e.value.bound, e.value.rule) == (11, 10, 'max_value')
+
+
+def test_parser_sets_failing_column():
+    p = Parser(schema=[('ID', IntegerParser()), ('CODE', StringParser().value_set(['A', 'B']))])
+    with pytest.raises(ValidValueCheckException) as e:
+        list(p.parse(['1|C']))
+    assert (e.value.column, e.value.value) == ('CODE', 'C')
+
+
+def test_pickling():
+    e = ValidValueCheckException(value='C', bound=StringParser().value_set(['A'])._funcs[-1].params['values'],
+                                 column='CODE')
+    restored = pickle.loads(pickle.dumps(e))
+    assert type(restored) == ValidValueCheckException
+    assert (str(restored), restored.value, restored.column, restored.rule) == (str(e), 'C', 'CODE', 'value_set')
+    dt = DatetimeParser(formats=['%Y%m%d']).max_value('20200101', '%Y%m%d').build()
+    with pytest.raises(MaximumValueConstraintException) as e:
+        dt('20210101')
+    assert pickle.loads(pickle.dumps(e.value)).bound == e.value.bound
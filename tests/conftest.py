@@ -0,0 +1,37 @@
+import pytest
+from parseval.parser import (
+    StringParser,
+    IntegerParser,
+    FloatParser,
+    DatetimeParser
+)
+
+
+@pytest.fixture(name="make_schema")
+def _make_schema():
+    def make_schema(max_value=10):
+        return [
+            ('ID', IntegerParser().max_value(max_value)),
+            ('CODE', StringParser().not_null().value_set(['A', 'B'])),
+            ('DATE', DatetimeParser(formats=['%Y%m%d']).convert('%Y%m%d'))
+        ]
+    return make_schema
+
+
+@pytest.fixture(name="schema")
+def _schema(make_schema):
+    return make_schema()
+
+
+@pytest.fixture(name="fw_schema")
+def _fw_schema():
+    return [('ID', IntegerParser(start=1, end=2).max_value(10)), ('AMT', FloatParser(start=3, end=6))]
+
+
+@pytest.fixture(name="make_lines")
+def _make_lines():
+    def make_lines(n):
+        # every 5th line breaks the maximum value constraint, every 7th line has an invalid code
+        return ['{}|{}|20200101'.format(99999 if i % 5 == 0 else i % 10, 'X{}'.format(i % 2) if i % 7 == 0 else 'A')
+                for i in range(n)]
+    return make_lines
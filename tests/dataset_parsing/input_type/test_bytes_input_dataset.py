@@ -0,0 +1,87 @@
+import json
+import pytest
+from parseval.parser import (
+    Parser,
+    StringParser,
+    IntegerParser,
+    FloatParser,
+    DatetimeParser
+)
+from parseval.exceptions import UnexpectedParsingException
+
+
+@pytest.fixture(name="schema", scope="session")
+def _schema():
+    return [
+        ('ID', StringParser(quoted=1).not_null('NA')),
+        ('AMOUNT', IntegerParser(quoted=2).max_value(2000).not_null(0)),
+        ('RATE', FloatParser().min_value(1.0)),
+        ('INITIATED_ON', DatetimeParser(formats=['%Y%m%d']))
+    ]
+
+
+@pytest.fixture(name="fw_schema", scope="session")
+def _fw_schema():
+    return [
+        ('ID', StringParser(1, 2)),
+        ('GENDER', StringParser(6, 6).value_set(['M', 'F'])),
+        ('BIRTH_YEAR', IntegerParser(12, 13).max_value(20)),
+        ('BALANCE', FloatParser(14, 17).min_value(10.0))
+    ]
+
+
+LINES = ['"ÀB"|\'12\'|1.5|20200101', '"X"||2|20200101', '"X"|3000|2|20200101', '""|15|0.5|', '"X"| 7 |3|']
+FW_LINES = ['d0sauMvalue191000', 'd0pouM     2090.03', 'd0pouX     2090.03', 'd0pouM     xx90.03']
+
+
+def test_delimited_bytes_input(schema):
+    p = Parser(schema=schema, stop_on_error=-1, parsed_row_format='dict')
+    p_bytes = Parser(schema=schema, stop_on_error=-1, parsed_row_format='dict', input_encoding='utf-8')
+    parsed = list(p_bytes.parse([line.encode('utf-8') for line in LINES]))
+    assert parsed == list(p.parse(LINES))
+    assert parsed[0]['ID'] == 'ÀB' and parsed[0]['AMOUNT'] == 12
+    assert list(p_bytes.parse([line.encode('utf-8') for line in LINES], workers=2, chunk_size=2)) == parsed
+
+
+def test_delimited_bytes_input_in_other_encoding(schema):
+    p_bytes = Parser(schema=schema, stop_on_error=-1, input_encoding='utf-16-le', parsed_row_sep=',')
+    assert list(p_bytes.parse([line.encode('utf-16-le') for line in LINES])) == \
+        list(Parser(schema=schema, stop_on_error=-1, parsed_row_sep=',').parse(LINES))
+
+
+def test_bytes_input_casting_error(schema):
+    p_bytes = Parser(schema=schema, input_encoding='utf-8')
+    with pytest.raises(UnexpectedParsingException, match="Column value - abc could not be casted"):
+        list(p_bytes.parse([b'"X"|abc|2|20200101']))
+
+
+def test_non_ascii_numbers_in_bytes_input():
+    schema = [('INT', IntegerParser()), ('FLOAT', FloatParser())]
+    lines = ['٣|١.٥', '\xa03|1.5\xa0']
+    assert list(Parser(schema=schema, parsed_row_format='dict').parse(lines)) == [{'INT': 3, 'FLOAT': 1.5}] * 2
+    p_bytes = Parser(schema=schema, parsed_row_format='dict', input_encoding='utf-8')
+    assert list(p_bytes.parse([line.encode('utf-8') for line in lines])) == [{'INT': 3, 'FLOAT': 1.5}] * 2
+    assert p_bytes.validate([line.encode('utf-8') for line in lines]).rows == 0
+
+
+def test_fixed_width_bytes_input(fw_schema):
+    p = Parser(schema=fw_schema, input_row_format='fixed-width', parsed_row_format='fixed-width', stop_on_error=-1)
+    p_bytes = Parser(schema=fw_schema, input_row_format='fixed-width', parsed_row_format='fixed-width',
+                     stop_on_error=-1, input_encoding='ascii')
+    parsed = list(p_bytes.parse([line.encode('ascii') for line in FW_LINES]))
+    assert parsed == list(p.parse(FW_LINES)) == FW_LINES[:2]
+
+
+def test_numeric_columns_are_not_decoded(schema, fw_schema):
+    source = Parser(schema=schema, input_encoding='utf-8')._raw_row_func('utf-8').source
+    assert 'str(_cells[1], ' not in source and 'str(_cells[2], ' not in source
+    assert 'str(_cells[0], ' in source and 'str(_cells[3], ' in source
+    source = Parser(schema=fw_schema, input_row_format='fixed-width', parsed_row_format='dict',
+                    input_encoding='utf-8')._raw_row_func('utf-8').source
+    assert source.count('str(_f') == 2 and '_line' not in source
+
+
+def test_json_bytes_input(schema):
+    rows = [{'ID': '"ÀB"', 'AMOUNT': "'12'", 'RATE': '1.5', 'INITIATED_ON': '20200101'}]
+    p = Parser(schema=schema, input_row_format='json', parsed_row_format='json', input_encoding='utf-8')
+    assert list(p.parse([json.dumps(r).encode('utf-8') for r in rows])) == [json.dumps(rows[0])]
@@ -3,6 +3,7 @@ import types
 import tempfile
 import datetime
 from parseval.parser import Parser
+from parseval.exceptions import MaximumValueConstraintException
 from parseval.parser import (
     StringParser,
     DatetimeParser,
@@ -140,3 +141,10 @@ def test_delimited_input_as_lol_all_error_allowed(schema, delimited_bad_lol_deta
         assert isinstance(parsed_line, str)
         parsed_lines.append(parsed_line)
     assert len(parsed_lines) == 1
+
+
+def test_delimited_input_reports_validation_exception():
+    p = Parser(schema=[('ID', IntegerParser().max_value(10)), ('NAME', StringParser())])
+    assert list(p.parse(['1|A', '2|B'])) == ['1|A', '2|B']
+    with pytest.raises(MaximumValueConstraintException):
+        list(p.parse(['1|A', '20|B']))
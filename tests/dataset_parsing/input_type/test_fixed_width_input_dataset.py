@@ -7,6 +7,8 @@ from parseval.parser import (
     IntegerParser,
     FloatParser,
 )
+from parseval.compiler import fixed_width_layout
+from parseval.exceptions import SchemaBuildException
 
 
 @pytest.fixture(name="custom_function", scope="session")
@@ -132,3 +134,30 @@ def test_delimited_input_as_lol_all_error_allowed(schema, fixed_width_bad_lol):
         assert isinstance(parsed_line, str)
         parsed_lines.append(parsed_line)
     assert len(parsed_lines) == 1
+
+
+def test_fixed_width_layout_is_validated(schema, caplog):
+    assert fixed_width_layout(schema) == [(0, 1, 2), (1, 3, 5), (2, 6, 6), (3, 7, 11), (4, 7, 11), (5, 12, 13),
+                                          (6, 14, 17)]
+    assert "'NULLABLE_VALUE' (7-11) overlaps with the previous column" in caplog.text
+    fixed_width_layout([('A', StringParser(1, 2)), ('B', StringParser(5, 6))])
+    assert "gap before column - 'B'" in caplog.text
+    p_bad_layout = Parser(schema=[('A', StringParser(4, 2))], input_row_format='fixed-width')
+    with pytest.raises(SchemaBuildException, match="'A'"):
+        list(p_bad_layout.parse(['abcd']))
+
+
+def test_fixed_width_bytes_input_split_at_once(fixed_width_lol):
+    schema = [
+        ('ID', StringParser(1, 2)),
+        ('GENDER', StringParser(6, 6).value_set(['M', 'F'])),
+        ('BIRTH_YEAR', IntegerParser(12, 13).max_value(20)),
+        ('BALANCE', FloatParser(14, 17))
+    ]
+    lines = [line.rstrip('\n') for line in fixed_width_lol] + ['d0pouM     2', 'd0']
+    p = Parser(schema=schema, stop_on_error=-1, input_row_format='fixed-width', parsed_row_format='dict')
+    p_bytes = Parser(schema=schema, stop_on_error=-1, input_row_format='fixed-width', parsed_row_format='dict',
+                     input_encoding='utf-8')
+    assert 'unpack' in p_bytes._raw_row_func('utf-8').source
+    # short records are sliced, like strings
+    assert list(p_bytes.parse([line.encode() for line in lines])) == list(p.parse(lines))
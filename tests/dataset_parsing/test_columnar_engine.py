@@ -0,0 +1,119 @@
+import random
+import datetime
+import pytest
+from parseval.parser import (
+    Parser,
+    StringParser,
+    IntegerParser,
+    FloatParser,
+    DatetimeParser
+)
+from parseval.exceptions import UnexpectedParsingException, UnexpectedSystemException
+
+np = pytest.importorskip("numpy")
+from parseval.columnar import (  # noqa: E402
+    FixedWidthEngine,
+    parse_datetime_column,
+    VALID,
+    FORMAT_ERROR,
+    NULL_ERROR,
+    MAX_VALUE_ERROR,
+    MIN_VALUE_ERROR,
+    VALUE_SET_ERROR
+)
+
+
+def _schema():
+    return [
+        ('ID', StringParser(1, 2)),
+        ('GENDER', StringParser(3, 3).value_set(['M', 'F'])),
+        ('BIRTH_YEAR', IntegerParser(4, 7).range(1900, 2020)),
+        ('BALANCE', FloatParser(8, 14).min_value(10.0).not_null()),
+        ('UNITS', IntegerParser(15, 17).not_null(5).value_set([5, 10, 20, 100]))
+    ]
+
+
+def _records(n):
+    random.seed(75)
+    noise = '0123456789   +-.eE_x'
+    records = []
+    for _ in range(n):
+        records.append(''.join([
+            'ab',
+            random.choice('MFX'),
+            random.choice([''.join(random.choice(noise) for _ in range(4)), str(random.randint(1850, 2050)).rjust(4)]),
+            random.choice([''.join(random.choice(noise) for _ in range(7)), '{:7.2f}'.format(random.uniform(-50, 500))]),
+            random.choice([''.join(random.choice(noise) for _ in range(3)), '  5', ' 10', '020', '100', '  0', '   '])
+        ]))
+    return records
+
+
+def _expected(parser, records):
+    return [len(list(parser.parse([record]))) == 1 for record in records]
+
+
+@pytest.mark.parametrize("terminator", ['\n', '\r\n'])
+def test_columnar_engine_matches_row_parsing(terminator, tmp_path):
+    p = Parser(schema=_schema(), input_row_format='fixed-width', parsed_row_format='dict', stop_on_error=-1)
+    records = _records(3000)
+    expected = _expected(p, records)
+    engine = FixedWidthEngine(p, block_size=1000)
+    assert len(engine._columns) == 3  # numeric columns are vectorized, the string ones are checked row by row
+    assert engine.validate(terminator.join(records).encode()).tolist() == expected
+    path = tmp_path / 'data.txt'
+    path.write_bytes((terminator.join(records) + terminator).encode())
+    assert engine.validate(str(path)).tolist() == expected
+
+
+def test_columnar_engine_rejects_uneven_records():
+    p = Parser(schema=_schema(), input_row_format='fixed-width')
+    with pytest.raises(UnexpectedParsingException):
+        FixedWidthEngine(p).validate(b'abM2000  100.00 10\nabM2000  100.00 1\nabM2000  100.00 10')
+    with pytest.raises(UnexpectedSystemException):
+        FixedWidthEngine(Parser(schema=_schema()))
+
+
+def _datetime_values(n):
+    random.seed(16)
+    values = []
+    for _ in range(n):
+        value = list((datetime.datetime(2019, 1, 1) + datetime.timedelta(minutes=random.randint(0, 10 ** 6)))
+                     .strftime(random.choice(['%Y-%m-%d %H:%M:%S', '%Y%m%d'])))
+        if random.random() < 0.3:
+            value[random.randrange(len(value))] = random.choice('0123456789x -')
+        values.append(random.choice([''.join(value)] * 6 + ['', None, '2020-02-29 00:00:00', '2019-02-29 00:00:00',
+                                                             datetime.datetime(2020, 1, 1)]))
+    return values
+
+
+@pytest.mark.parametrize("make_parser", [
+    lambda: DatetimeParser(formats=['%Y-%m-%d %H:%M:%S', '%Y%m%d']).range('20190601', '20200601', '%Y%m%d'),
+    lambda: DatetimeParser(formats=['%Y-%m-%d %H:%M:%S', '%Y%m%d'], enforce_type=False).not_null()
+    .max_value(datetime.datetime(2020, 6, 1, 12, 30)),
+    lambda: DatetimeParser(formats=['%Y-%m-%d %H:%M:%S']).value_set(['2020-02-29 00:00:00'], '%Y-%m-%d %H:%M:%S'),
+    lambda: DatetimeParser(formats=['%Y-%m-%d %H:%M:%S', '%Y%m%d']).convert('%Y'),
+])
+def test_datetime_column_matches_scalar_parsing(make_parser):
+    values = _datetime_values(3000)
+    column = parse_datetime_column(make_parser(), values)
+    func = make_parser().build()
+    expected = []
+    for value in values:
+        try:
+            func(value)
+            expected.append(True)
+        except Exception:
+            expected.append(False)
+    assert column.valid.tolist() == expected
+    assert (column.codes == VALID).tolist() == expected
+
+
+def test_datetime_column_values_and_codes():
+    parser = DatetimeParser(formats=['%Y%m%d']).not_null().range('20200101', '20201231', '%Y%m%d')\
+        .value_set(['20200101', '20200630', '20210101'], '%Y%m%d')
+    column = parse_datetime_column(parser, ['20200630', '2020063x', '', '20210101', '20191231', '20200102'])
+    assert column.codes.tolist() == [VALID, FORMAT_ERROR, NULL_ERROR, MAX_VALUE_ERROR, MIN_VALUE_ERROR,
+                                     VALUE_SET_ERROR]
+    assert column.values[0] == np.datetime64('2020-06-30')
+    assert np.isnat(column.values[1:]).all()
+    assert parser.format_stats() == {'%Y%m%d': 4}
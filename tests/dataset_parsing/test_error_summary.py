@@ -0,0 +1,57 @@
+from parseval.parser import Parser
+from parseval.summary import ErrorSummary, TopK
+
+
+def test_summary_after_parse(schema, make_lines):
+    p = Parser(schema=schema, stop_on_error=-1)
+    assert p.summary is None
+    list(p.parse(make_lines(100) + ['1||20200101', '1|A|20200101|x']))
+    summary = p.summary
+    assert isinstance(summary, ErrorSummary)
+    # rows failing both rules are counted by their first failure
+    assert summary.counts == {('ID', 'max_value'): 20, ('CODE', 'value_set'): 12, ('CODE', 'not_null'): 1,
+                              (None, 'format'): 1}
+    assert (summary.rows, summary.total) == (34, 34)
+    assert summary.top('ID', 'max_value') == [(99999, 20, 0)]
+    assert sorted(summary.top('CODE', 'value_set')) == [('X0', 6, 0), ('X1', 6, 0)]
+    assert summary.top('CODE', 'not_null') == []
+    assert summary.to_dict()['failures'][0] == {'column': 'ID', 'rule': 'max_value', 'count': 20,
+                                                'top_values': [(99999, 20, 0)]}
+    list(p.parse(['1|A|20200101']))
+    assert p.summary.rows == 0
+
+
+def test_summary_of_compiled_rows_from_pool(schema, make_lines):
+    p = Parser(schema=schema, stop_on_error=-1)
+    list(p.parse(make_lines(300), workers=2, chunk_size=50))
+    assert p.summary.counts == {('ID', 'max_value'): 60, ('CODE', 'value_set'): 34}
+    assert p.summary.top('ID', 'max_value', 1) == [(99999, 60, 0)]
+
+
+def test_summary_counts_the_failing_row(schema):
+    p = Parser(schema=schema, stop_on_error=0)
+    try:
+        list(p.parse(['1|A|20200101', '99999|A|20200101']))
+    except Exception:
+        pass
+    assert p.summary.counts == {('ID', 'max_value'): 1}
+
+
+def test_summary_of_status_parsing(schema):
+    p = Parser(schema=schema, stop_on_error=-1)
+    list(p.parse_with_status(['99999|X|20200101', '1|A|20200101', '2||20200101']))
+    assert p.summary.counts == {('ID', 'max_value'): 1, ('CODE', 'value_set'): 1, ('CODE', 'not_null'): 1}
+    assert p.summary.rows == 2
+
+
+def test_top_k_sketch():
+    top = TopK(3)
+    for value in ['a'] * 50 + ['b'] * 30 + list('cdefghij') + ['c'] * 20:
+        top.add(value)
+    ranked = top.top()
+    assert [value for value, _, _ in ranked[:2]] == ['a', 'b']
+    assert ranked[0][1:] == (50, 0)
+    assert len(ranked) == 3 and top.total == 108
+    # guaranteed bounds of the count of a value replacing another one
+    value, count, error = ranked[2]
+    assert value == 'c' and count - error <= 21 <= count
@@ -0,0 +1,114 @@
+import os
+import multiprocessing
+import pytest
+from parseval.parser import (
+    Parser,
+    StringParser,
+    IntegerParser
+)
+from parseval.reader import file_ranges, count_lines, read_lines, map_lines
+from parseval.compiler import compile_row
+from parseval.sinks import ListSink
+from parseval.exceptions import MaximumValueConstraintException, UnexpectedParsingException
+
+
+@pytest.fixture(name="lines")
+def _lines(make_lines):
+    return make_lines(200)
+
+
+@pytest.fixture(name="file_name", params=['\n', '\r\n'])
+def _file_name(request, tmp_path, lines):
+    path = str(tmp_path / 'data.txt')
+    with open(path, 'w', newline='') as f:
+        f.write(request.param.join(lines))  # no line terminator after the last line
+    return path
+
+
+def test_file_ranges_are_aligned_to_lines(file_name, lines):
+    ranges = file_ranges(file_name, 100)
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0 and ranges[-1][1] == os.path.getsize(file_name)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert sum(count_lines(file_name, start, end) for start, end in ranges) == len(lines)
+    assert [line for start, end in ranges for line in read_lines(file_name, start, end)] == lines
+    assert [str(line, 'utf-8') for start, end in ranges for line in map_lines(file_name, start, end)] == lines
+    assert all(type(line) is memoryview for line in map_lines(file_name))
+
+
+def test_parse_file_matches_parse(file_name, lines, schema):
+    p = Parser(schema=schema, stop_on_error=-1)
+    expected = list(p.parse(lines))
+    assert list(p.parse_file(file_name)) == expected
+    assert list(p.parse_file(file_name, workers=3, chunk_bytes=200)) == expected
+
+
+def test_parse_file_into_parts(file_name, tmp_path, schema):
+    p = Parser(schema=schema, stop_on_error=-1, parsed_row_format='dict')
+    parts = p.parse_file(file_name, workers=2, output_dir=str(tmp_path / 'out'), chunk_bytes=300)
+    assert len(parts) > 2
+    assert [os.path.basename(part) for part in parts] == ['part-{:05d}'.format(i) for i in range(len(parts))]
+    written = []
+    for part in parts:
+        with open(part) as f:
+            written.extend(f.read().splitlines())
+    assert len(written) == len([i for i in range(200) if i % 5 and i % 7])
+    assert written[0] == '{"ID": 1, "CODE": "A", "DATE": "20200101"}'
+
+
+def test_parse_file_stop_on_error(file_name, caplog, tmp_path, schema):
+    p = Parser(schema=schema, stop_on_error=3)
+    with pytest.raises(MaximumValueConstraintException):
+        list(p.parse_file(file_name, workers=2, chunk_bytes=100))
+    assert "LINE NUMBER: 11\n" in caplog.text
+    assert "LINE NUMBER: 15\n" not in caplog.text
+    with pytest.raises(MaximumValueConstraintException):
+        p.parse_file(file_name, workers=2, output_dir=str(tmp_path / 'out'), chunk_bytes=100)
+
+
+def test_parse_file_in_pool_numbers_lines_of_all_ranges(tmp_path, schema):
+    path = str(tmp_path / 'data.txt')
+    lines = ['1|A|20200101'] * 200
+    lines[150] += '|x'
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines))
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    assert len(list(p.parse_file(path, workers=3, chunk_bytes=300))) == 199
+    assert [(r.line_number, r.offset, r.column) for r in sink.records] == [(150, 150 * 13, None)]
+    for workers in (None, 3):
+        with pytest.raises(UnexpectedParsingException, match="line - 151 is higher"):
+            list(Parser(schema=schema).parse_file(path, workers=workers, chunk_bytes=300))
+
+
+def test_no_worker_left_after_stop_on_error(file_name, tmp_path, schema):
+    p = Parser(schema=schema, stop_on_error=0)
+    for _ in range(3):
+        with pytest.raises(MaximumValueConstraintException):
+            list(p.parse_file(file_name, workers=2, chunk_bytes=100))
+        with pytest.raises(MaximumValueConstraintException):
+            p.parse_file(file_name, workers=2, output_dir=str(tmp_path / 'out'), chunk_bytes=100)
+    assert multiprocessing.active_children() == []
+
+
+def test_fixed_width_file_is_sliced_undecoded(tmp_path):
+    path = str(tmp_path / 'data.txt')
+    lines = ['d0sauMvalue191000', 'd0pouM     2090.03', 'd0pouX     2090.03', 'd0pouMéé 090.03']
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    schema = [
+        ('ID', StringParser(1, 2)),
+        ('GENDER', StringParser(6, 6).value_set(['M', 'F'])),
+        ('VALUE', StringParser(7, 11)),
+        ('BIRTH_YEAR', IntegerParser(12, 13).max_value(20)),
+    ]
+    p = Parser(schema=schema, input_row_format='fixed-width', parsed_row_format='dict', stop_on_error=-1)
+    assert list(p.parse_file(path)) == list(p.parse(lines[:3])) + [{
+        'ID': 'd0', 'GENDER': 'M', 'VALUE': 'éé ', 'BIRTH_YEAR': 9  # positions are byte positions
+    }]
+    assert list(p.parse_file(path, workers=2, chunk_bytes=20)) == list(p.parse_file(path))
+    row_func = compile_row(p, 'utf-8')
+    assert '_line' not in row_func.source  # only the columns are decoded, never the whole line
+    assert row_func(memoryview(b'd0sauMvalue191000'), 0) == {
+        'ID': 'd0', 'GENDER': 'M', 'VALUE': 'value', 'BIRTH_YEAR': 19
+    }
@@ -0,0 +1,53 @@
+import json
+import multiprocessing
+import pytest
+from parseval.parser import Parser
+from parseval.exceptions import (
+    MaximumValueConstraintException,
+    UnexpectedSystemException
+)
+
+
+def test_parallel_parsing_preserves_order(schema, make_lines):
+    p = Parser(schema=schema, stop_on_error=-1)
+    lines = make_lines(100)
+    expected = list(p.parse(lines))
+    assert list(p.parse(lines, workers=2, chunk_size=7)) == expected
+    assert list(p.parse(iter(lines), workers=3, chunk_size=1)) == expected
+
+
+def test_parallel_parsing_merges_stop_on_error(schema, make_lines):
+    lines = make_lines(100)
+    p = Parser(schema=schema, stop_on_error=5)
+    parsed = []
+    with pytest.raises(MaximumValueConstraintException):
+        for row in p.parse(lines, workers=2, chunk_size=10):
+            parsed.append(row)
+    # lines 0, 5, 7, 10, 14 are tolerated, line 15 stops the parsing
+    assert len(parsed) == 15 - 5
+
+
+def test_no_worker_left_after_stop_on_error(schema, make_lines):
+    p = Parser(schema=schema, stop_on_error=0)
+    for _ in range(3):
+        with pytest.raises(MaximumValueConstraintException):
+            list(p.parse(make_lines(100), workers=2, chunk_size=5))
+    assert multiprocessing.active_children() == []
+
+
+def test_parallel_parsing_reports_global_line_number(schema, make_lines, caplog):
+    p = Parser(schema=schema, stop_on_error=1)
+    with pytest.raises(MaximumValueConstraintException):
+        list(p.parse(make_lines(20), workers=2, chunk_size=4))
+    assert "LINE NUMBER: 1\n" in caplog.text
+    assert "LINE NUMBER: 6\n" in caplog.text
+    assert "LINE NUMBER: 8" not in caplog.text
+
+
+def test_parallel_json_parsing(schema):
+    rows = [{'ID': str(i), 'CODE': 'A', 'DATE': '20200101'} for i in range(10)]
+    p = Parser(schema=schema, input_row_format='json', parsed_row_format='json')
+    assert list(p.parse([json.dumps(r) for r in rows], workers=2, chunk_size=3)) == \
+        list(p.parse([json.dumps(r) for r in rows]))
+    with pytest.raises(UnexpectedSystemException):
+        list(p.parse(rows, workers=2, chunk_size=3))
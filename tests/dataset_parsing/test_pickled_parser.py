@@ -0,0 +1,74 @@
+import pickle
+import pytest
+import datetime
+import concurrent.futures
+from parseval.parser import (
+    Parser,
+    StringParser,
+    IntegerParser,
+    FloatParser,
+    BooleanParser,
+    DatetimeParser,
+    ConstantParser
+)
+
+
+def _parity_check(data):
+    if data and int(data) % 2 != 0:
+        raise Exception("The data has to be even!")
+    return data
+
+
+@pytest.fixture(name="schema")
+def _schema():
+    return [
+        ('ID', StringParser(quoted=1).not_null('NA')),
+        ('RUN_ID', StringParser().regex_match(r'\w+_\d{4}-\d{2}-\d{2}').change_case('u')),
+        ('CLASS', StringParser(start=1, end=1).value_set(['a', 'b', 'A'])),
+        ('INITIATED_ON', DatetimeParser(formats=['%Y%m%d', '%Y-%m-%d %H:%M:%S'])
+         .convert('%Y/%m/%d').range('20000101', datetime.datetime(2030, 1, 1), '%Y%m%d')),
+        ('AMOUNT', IntegerParser().max_value(2000).not_null(0).add_func(_parity_check)),
+        ('RATE', FloatParser().min_value(1.0)),
+        ('FLAG', BooleanParser()),
+        ('ROLE_MODEL', ConstantParser('Leo Messi'))
+    ]
+
+
+LINES = [
+    '"ABC"|Manual_2020-01-01|abc|20200123|1200|1.5|y|',
+    '""|Manual_2020-01-01|b|2020-01-23 10:20:23||2|No|',
+    '"ABC"|Trig2020-01-01|abc|20200123|1200|1.5|y|',
+    '"ABC"|Manual_2020-01-01|abc|20200123|1201|1.5|y|',
+]
+
+
+def _parse(parser, lines):
+    return list(parser.parse(lines))
+
+
+def test_field_parsers_survive_pickling(schema):
+    for name, field_parser in schema:
+        restored = pickle.loads(pickle.dumps(field_parser))
+        for data in ['"ABC"', 'Manual_2020-01-01', '20200123', '1200', '', 'y']:
+            try:
+                expected = field_parser.build()(data)
+            except Exception as e:
+                expected = type(e)
+            try:
+                actual = restored.build()(data)
+            except Exception as e:
+                actual = type(e)
+            assert actual == expected, (name, data)
+
+
+def test_parser_survives_pickling(schema):
+    p = Parser(schema=schema, stop_on_error=-1)
+    expected = _parse(p, LINES)
+    assert len(expected) == 2
+    assert _parse(pickle.loads(pickle.dumps(p)), LINES) == expected
+
+
+def test_parser_in_process_pool(schema):
+    p = Parser(schema=schema, stop_on_error=-1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        assert executor.submit(_parse, p, LINES).result() == _parse(p, LINES)
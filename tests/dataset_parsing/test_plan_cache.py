@@ -0,0 +1,76 @@
+from parseval.parser import Parser, StringParser, DatetimeParser
+from parseval.cache import PlanCache
+
+
+def test_structurally_identical_schemas_share_plan(make_schema):
+    cache = PlanCache()
+    assert list(Parser(schema=make_schema(), plan_cache=cache).parse(['1|A|20200101'])) == ['1|A|20200101']
+    assert list(Parser(schema=make_schema(), plan_cache=cache).parse(['2|B|20200101'])) == ['2|B|20200101']
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_different_schemas_get_different_plans(make_schema):
+    cache = PlanCache()
+    list(Parser(schema=make_schema(10), plan_cache=cache).parse(['1|A|20200101']))
+    list(Parser(schema=make_schema(20), plan_cache=cache).parse(['1|A|20200101']))
+    list(Parser(schema=make_schema(10), parsed_row_format="dict", plan_cache=cache).parse(['1|A|20200101']))
+    assert cache.cache_info().misses == 3
+
+
+def test_repeated_parse_calls_reuse_the_plan(schema):
+    cache = PlanCache()
+    p = Parser(schema=schema, plan_cache=cache)
+    for _ in range(5):
+        list(p.parse(['1|A|20200101']))
+    # the plan is kept by the parser, the cache is looked up once
+    info = cache.cache_info()
+    assert (info.hits, info.misses) == (0, 1)
+
+
+def test_changed_schema_gets_a_new_plan(schema, make_schema):
+    cache = PlanCache()
+    p = Parser(schema=schema, plan_cache=cache, stop_on_error=-1)
+    assert list(p.parse(['1|A|20200101', '1||20200101'])) == ['1|A|20200101']
+    schema[1][1].value_set(['B'])
+    assert list(p.parse(['1|A|20200101', '1|B|20200101'])) == ['1|B|20200101']
+    p.schema = make_schema(0)
+    assert list(p.parse(['1|A|20200101', '0|A|20200101'])) == ['0|A|20200101']
+    assert cache.cache_info().misses == 3
+
+
+def test_stateful_columns_share_plan_but_not_state():
+    cache = PlanCache()
+    parsers = [Parser(schema=[('DT', DatetimeParser(formats=['%Y%m%d', '%Y-%m-%d'])),
+                              ('CODE', StringParser().regex_any({'num': r'\d+', 'alpha': '[A-Z]+'}))],
+                      plan_cache=cache, stop_on_error=-1) for _ in range(2)]
+    list(parsers[0].parse(['20200101|1', '2020-01-02|A']))
+    list(parsers[1].parse(['20200101|12']))
+    assert (cache.cache_info().hits, cache.cache_info().misses) == (1, 1)
+    assert parsers[0].format_stats() == {'DT': {'%Y%m%d': 1, '%Y-%m-%d': 1}}
+    assert parsers[1].format_stats() == {'DT': {'%Y%m%d': 1, '%Y-%m-%d': 0}}
+    assert parsers[0].schema[1][1].match_stats() == {'num': 1, 'alpha': 1}
+    assert parsers[1].schema[1][1].match_stats() == {'num': 1}
+
+
+def test_lru_eviction_by_count(make_schema):
+    cache = PlanCache(maxsize=2)
+    for bound in (1, 2, 3):
+        list(Parser(schema=make_schema(bound), plan_cache=cache).parse(['1|A|20200101']))
+    list(Parser(schema=make_schema(1), plan_cache=cache).parse(['1|A|20200101']))
+    info = cache.cache_info()
+    assert (info.misses, info.evictions, info.currsize) == (4, 2, 2)
+
+
+def test_eviction_by_memory_bound(schema):
+    cache = PlanCache(maxsize=None, maxbytes=1)
+    list(Parser(schema=schema, plan_cache=cache).parse(['1|A|20200101']))
+    info = cache.cache_info()
+    assert (info.evictions, info.currsize, info.currbytes) == (1, 0, 0)
+
+
+def test_disabled_cache(schema):
+    cache = PlanCache(maxsize=0)
+    p = Parser(schema=schema, plan_cache=cache)
+    assert list(p.parse(['1|A|20200101'])) == list(p.parse(['1|A|20200101']))
+    assert cache.cache_info().currsize == 0
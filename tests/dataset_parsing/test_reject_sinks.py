@@ -0,0 +1,84 @@
+import json
+import logging
+import pytest
+from parseval.parser import Parser
+from parseval.sinks import ListSink, FileSink, CallbackSink, Reject
+
+
+def test_list_sink_replaces_logging(schema, make_lines, caplog):
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    lines = make_lines(10)
+    with caplog.at_level(logging.ERROR):
+        parsed = list(p.parse(lines + ['1||20200101']))
+    assert parsed == [line for i, line in enumerate(lines) if i % 5 and i % 7]
+    assert sink.records == [Reject(0, None, 'ID', 'max_value', lines[0]),
+                            Reject(5, None, 'ID', 'max_value', lines[5]),
+                            Reject(7, None, 'CODE', 'value_set', lines[7]),
+                            Reject(10, None, 'CODE', 'not_null', '1||20200101')]
+    assert not caplog.records
+
+
+def test_file_sink_records_byte_offsets(schema, tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('1|A|20200101\r\n99999|B|20200101\n2|A|20200101\n3||20200101\n')
+    with FileSink(str(tmp_path / 'rejects.jsonl')) as sink:
+        p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+        assert list(p.parse_file(str(path))) == ['1|A|20200101', '2|A|20200101']
+    rejects = [json.loads(line) for line in (tmp_path / 'rejects.jsonl').read_text().splitlines()]
+    assert rejects == [
+        {'line_number': 1, 'offset': 14, 'column': 'ID', 'rule': 'max_value', 'row': '99999|B|20200101'},
+        {'line_number': 3, 'offset': 44, 'column': 'CODE', 'rule': 'not_null', 'row': '3||20200101'}
+    ]
+
+
+def test_limit_and_buffering(schema, make_lines):
+    written = []
+    sink = CallbackSink(lambda *reject: written.append(reject), limit=3, buffer_size=2)
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    rows = p.parse(make_lines(50))
+    next(rows), next(rows), next(rows), next(rows), next(rows), next(rows)
+    assert [reject[0] for reject in written] == [0, 5]
+    list(rows)
+    assert [reject[0] for reject in written] == [0, 5, 7]
+    assert (sink.count, sink.dropped) == (16, 13)
+
+
+def test_reservoir_sample(schema, make_lines):
+    sink = ListSink(limit=5, sample=True, seed=7)
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    list(p.parse(make_lines(1000)))
+    assert len(sink.records) == 5
+    assert len({r.line_number for r in sink.records}) == 5
+    assert all(r.line_number % 5 == 0 or r.line_number % 7 == 0 for r in sink.records)
+    assert (sink.count, sink.dropped) == (314, 309)
+    with pytest.raises(ValueError):
+        ListSink(sample=True)
+
+
+def test_parallel_file_parsing_with_sink(schema, make_lines, tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text(''.join(line + '\n' for line in make_lines(200)))
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    assert len(list(p.parse_file(str(path), workers=2, chunk_bytes=500))) == 137
+    assert [r.line_number for r in sink.records] == [i for i in range(200) if i % 5 == 0 or i % 7 == 0]
+    lines = path.read_bytes()
+    assert all(lines[r.offset:].startswith(r.row.encode()) for r in sink.records)
+
+
+def test_status_parsing_with_sink(schema):
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    list(p.parse_with_status(['99999||20200101', '1|A|20200101']))
+    assert sink.records == [Reject(0, None, 'ID', 'max_value', '99999||20200101'),
+                            Reject(0, None, 'CODE', 'not_null', '99999||20200101')]
+
+
+def test_status_parsing_with_sink_decodes_bytes(schema):
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink, input_encoding='utf-8')
+    list(p.parse_with_status([b'11|A|20200101', memoryview('1|\xc0|20200101'.encode('utf-8')), b'1|\xff|20200101']))
+    assert sink.records == [Reject(0, None, 'ID', 'max_value', '11|A|20200101'),
+                            Reject(1, None, 'CODE', 'value_set', '1|\xc0|20200101'),
+                            Reject(2, None, 'CODE', 'other', '1|\ufffd|20200101')]
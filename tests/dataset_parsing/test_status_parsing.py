@@ -0,0 +1,52 @@
+import itertools
+import logging
+import pytest
+from parseval.parser import Parser, IntegerParser
+from parseval.exceptions import MaximumValueConstraintException
+from parseval.status import failures, failure_bit, FORMAT_ERROR, NULL_ERROR, MAX_VALUE_ERROR, VALUE_SET_ERROR
+
+
+def test_row_status(schema):
+    p = Parser(schema=schema, stop_on_error=-1)
+    rows = list(p.parse_with_status(['1|A|20200101', '11|x|2020', '5||20200101', '1|A|20200101|x']))
+    assert rows[0] == ('1|A|20200101', 0)
+    assert [parsed for parsed, _ in rows[1:]] == [None, None, None]
+    assert failures(rows[1][1]) == [(0, MAX_VALUE_ERROR), (1, VALUE_SET_ERROR), (2, FORMAT_ERROR)]
+    assert failures(rows[2][1]) == [(1, NULL_ERROR)]
+    assert rows[3][1] == failure_bit(3, FORMAT_ERROR)
+
+
+@pytest.mark.parametrize("schema_name, options", [
+    ("schema", {}),
+    ("schema", {'parsed_row_format': "dict"}),
+    ("schema", {'input_encoding': 'utf-8'}),
+    ("fw_schema", {'input_row_format': "fixed-width", 'parsed_row_format': "fixed-width"}),
+])
+def test_parsed_rows_match_parse(schema_name, options, request):
+    schema = request.getfixturevalue(schema_name)
+    data = ['1|A|20200101', '11|x|2020', '5||', '0123.5', '10abcd', '2|B|20211231']
+    statuses = list(Parser(schema=schema, stop_on_error=-1, **options).parse_with_status(data))
+    parsed = list(Parser(schema=schema, stop_on_error=-1, **options).parse(data))
+    assert [row for row, status in statuses if not status] == parsed
+
+
+def test_json_rows():
+    p = Parser(schema=[('ID', IntegerParser().max_value(10))], input_row_format="json", parsed_row_format="json",
+               stop_on_error=-1)
+    rows = list(p.parse_with_status(['{"ID": 1}', '{"ID": 11}', '{"ID": ']))
+    assert rows == [('{"ID": 1}', 0), (None, failure_bit(0, MAX_VALUE_ERROR)), (None, failure_bit(1, FORMAT_ERROR))]
+
+
+def test_stop_on_error_raises_row_exception(schema):
+    p = Parser(schema=schema, stop_on_error=1)
+    rows = p.parse_with_status(['1|A|20200101', '12|B|20200101', '1|A|20200101', '13|B|20200101'])
+    assert [status for _, status in itertools.islice(rows, 3)] == [0, failure_bit(0, MAX_VALUE_ERROR), 0]
+    with pytest.raises(MaximumValueConstraintException):
+        next(rows)
+
+
+def test_failed_rows_are_not_logged(schema, caplog):
+    p = Parser(schema=schema, stop_on_error=-1)
+    with caplog.at_level(logging.ERROR):
+        list(p.parse_with_status(['11|x|2020'] * 10))
+    assert not caplog.records
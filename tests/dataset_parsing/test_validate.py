@@ -0,0 +1,70 @@
+import pytest
+from parseval.parser import Parser, IntegerParser
+from parseval.exceptions import MaximumValueConstraintException, UnexpectedParsingException
+from parseval.sinks import ListSink, Reject
+
+
+_DATA = ['1|A|20200101', '11|C|2020', '٣|B|20211231', '1|A', '1|A|20200101|x', 'x||']
+
+
+@pytest.mark.parametrize("schema_name, options", [
+    ("schema", {}),
+    ("schema", {'input_encoding': 'utf-8'}),
+    ("fw_schema", {'input_row_format': "fixed-width", 'parsed_row_format': "fixed-width"}),
+])
+def test_validate_matches_parse_with_status(schema_name, options, request):
+    schema = request.getfixturevalue(schema_name)
+    data = _DATA + ['0123.5', '10abcd']
+    p = Parser(schema=schema, stop_on_error=-1, **options)
+    statuses = [status for _, status in p.parse_with_status(data)]
+    expected = p.summary
+    summary = Parser(schema=schema, stop_on_error=-1, **options).validate(data)
+    assert (summary.counts, summary.rows, summary.checked) == (expected.counts, expected.rows, expected.checked)
+    assert summary.rows == len([status for status in statuses if status])
+
+
+def test_validate_summary(schema):
+    summary = Parser(schema=schema, stop_on_error=-1).validate(_DATA)
+    assert (summary.checked, summary.rows, summary.passed) == (6, 4, 2)
+    assert summary.counts == {('ID', 'max_value'): 1, ('CODE', 'value_set'): 1, ('DATE', 'format'): 1,
+                              ('DATE', 'other'): 1, (None, 'format'): 1, ('ID', 'format'): 1,
+                              ('CODE', 'not_null'): 1}
+
+
+def test_validate_json_rows():
+    p = Parser(schema=[('ID', IntegerParser().max_value(10))], input_row_format="json", parsed_row_format="json",
+               stop_on_error=-1)
+    summary = p.validate(['{"ID": 1}', {"ID": 11}, '{"ID": '])
+    assert summary.counts == {('ID', 'max_value'): 1, (None, 'format'): 1}
+    assert p.summary is summary
+
+
+def test_validate_file_with_sink(schema, tmp_path):
+    path = tmp_path / 'input.txt'
+    path.write_text('1|A|20200101\r\n11|A|20200101\n1||20200101\n')
+    sink = ListSink()
+    p = Parser(schema=schema, stop_on_error=-1, reject_sink=sink)
+    summary = p.validate_file(str(path))
+    assert (summary.checked, summary.rows) == (3, 2)
+    assert sink.records == [Reject(1, 14, 'ID', 'max_value', '11|A|20200101'),
+                            Reject(2, 28, 'CODE', 'not_null', '1||20200101')]
+
+
+def test_validate_stop_on_error(schema, tmp_path):
+    p = Parser(schema=schema, stop_on_error=1)
+    with pytest.raises(MaximumValueConstraintException):
+        p.validate(['11|A|20200101', '1|A|20200101', '12|A|20200101'])
+    assert (p.summary.checked, p.summary.rows) == (3, 2)
+    path = tmp_path / 'input.txt'
+    path.write_text('x|A|20200101\n')
+    with pytest.raises(UnexpectedParsingException):
+        Parser(schema=schema).validate_file(str(path))
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_unconverted_integers_are_checked(compiled):
+    f = IntegerParser(enforce_type=False).build(compiled=compiled)
+    assert (f('123'), f('٣'), f(' 12 '), f('')) == ('123', '٣', ' 12 ', '')
+    for value in ['1.5', '²', 'x']:
+        with pytest.raises(UnexpectedParsingException):
+            f(value)